@@ -0,0 +1,212 @@
+import argparse
+import copy
+import dataclasses
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from batch import discover_cases
+from common.csvreader import read_budgets, read_cores, read_tasks
+from common.utils import get_project_root
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+BENCHMARK_KINDS = ("analysis", "event", "tick")
+# A benchmark regresses when it is this much slower (or bigger) than the baseline...
+TIME_TOLERANCE = 0.25
+MEMORY_TOLERANCE = 0.25
+# ...and the difference is above the timer noise
+MIN_TIME_DIFFERENCE = 0.05
+SIMULATION_ITERATIONS = 2
+# Synthetic systems replicate every case of data/custom this many times
+SCALE_FACTORS = (8, 64)
+
+def scaled_system(case_dir: str, factor: int) -> tuple[list, list, list]:
+    """
+    Replicate a case `factor` times, each copy on its own cores with renamed cores,
+    components and tasks. The hyperperiod is unchanged while the work per time unit
+    grows linearly with the factor.
+    """
+    cores, components, tasks = (read_cores(f"{case_dir}/architecture.csv"),
+                                read_budgets(f"{case_dir}/budgets.csv"),
+                                read_tasks(f"{case_dir}/tasks.csv"))
+    scaled = ([], [], [])
+    for copy_idx in range(factor):
+        suffix = f"#{copy_idx}"
+        for core in cores:
+            scaled[0].append(dataclasses.replace(core, id=core.id + suffix))
+        for component in components:
+            clone = copy.deepcopy(component)
+            clone.id, clone.core_id = component.id + suffix, component.core_id + suffix
+            scaled[1].append(clone)
+        for task in tasks:
+            clone = copy.deepcopy(task)
+            clone.id, clone.component_id = task.id + suffix, task.component_id + suffix
+            scaled[2].append(clone)
+    return scaled
+
+def benchmark_specs(roots: list[str], kinds: list[str], scale_factors: list[int]) -> list[dict]:
+    """Every (workload, kind) pair to run: all cases below the roots, then the scaled custom cases."""
+    specs = []
+    for case in discover_cases(roots):
+        for kind in kinds:
+            specs.append({"name": f"{os.path.basename(case)}/{kind}", "case": case, "scale": 1, "kind": kind})
+    for case in discover_cases(["data/custom"]):
+        for factor in scale_factors:
+            for kind in kinds:
+                specs.append({"name": f"{os.path.basename(case)}x{factor}/{kind}",
+                              "case": case, "scale": factor, "kind": kind})
+    return specs
+
+def run_one(spec: dict) -> dict:
+    """
+    Run a single benchmark in this process and measure it. Called in a fresh child
+    process by `measure`, so the peak RSS belongs to this benchmark alone.
+    """
+    from analysis import analyze
+    from common.horizon import plan_horizon
+    from common.system_model import SystemModel
+    from simulator import Simulator
+
+    cores, components, tasks = scaled_system(spec["case"], spec["scale"])
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            start = time.perf_counter()
+            if spec["kind"] == "analysis":
+                analyze(cores, components, tasks)
+                work = len(tasks)
+            else:
+                simulator = Simulator(cores, components, tasks)
+                simulator.truncate_horizon = True
+                # Simulated time per iteration: the hyperperiod, or its truncation past max_horizon
+                plan = plan_horizon(SystemModel(cores, components, tasks), max_horizon=simulator.max_horizon)
+                horizon = plan.truncated_horizon or plan.hyperperiod
+                if spec["kind"] == "event":
+                    simulator.run_event_driven(SIMULATION_ITERATIONS)
+                else:
+                    simulator.run(SIMULATION_ITERATIONS)
+                work = horizon * SIMULATION_ITERATIONS
+            seconds = time.perf_counter() - start
+        finally:
+            sys.stdout = stdout
+
+    return {
+        "seconds": seconds,
+        # Tasks analysed per second, or simulated time units per second
+        "throughput": work / seconds if seconds > 0 else float("inf"),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+def measure(spec: dict, repeat: int) -> dict:
+    """Run a benchmark `repeat` times in child processes; keep the fastest run."""
+    runs = []
+    for _ in range(repeat):
+        child = subprocess.run([sys.executable, os.path.abspath(__file__), "--run-one", json.dumps(spec)],
+                               capture_output=True, text=True, cwd=get_project_root())
+        if child.returncode != 0:
+            return {"error": child.stderr.strip().splitlines()[-1] if child.stderr.strip() else "failed"}
+        runs.append(json.loads(child.stdout.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run["seconds"])
+    best["peak_rss_kb"] = max(run["peak_rss_kb"] for run in runs)
+    return best
+
+def compare(results: dict, baseline: dict, time_tolerance: float = TIME_TOLERANCE,
+            memory_tolerance: float = MEMORY_TOLERANCE) -> list[str]:
+    """
+    Compare results against a baseline.
+
+    Returns:
+        list[str]: One message per regression; empty if there is none
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None or "error" in result or "error" in reference:
+            continue
+        slowdown = result["seconds"] - reference["seconds"]
+        if slowdown > MIN_TIME_DIFFERENCE and result["seconds"] > reference["seconds"] * (1 + time_tolerance):
+            regressions.append(f"{name}: {result['seconds']:.3f} s vs {reference['seconds']:.3f} s baseline")
+        if result["peak_rss_kb"] > reference["peak_rss_kb"] * (1 + memory_tolerance):
+            regressions.append(f"{name}: peak RSS {result['peak_rss_kb']} KB vs {reference['peak_rss_kb']} KB baseline")
+    return regressions
+
+def print_results(results: dict, baseline: dict):
+    print(f"{'Benchmark':<44} {'Time (s)':>10} {'Baseline':>10} {'Throughput':>14} {'Peak RSS (MB)':>14}")
+    for name, result in results.items():
+        if "error" in result:
+            print(f"{name:<44} ERROR {result['error']}")
+            continue
+        reference = baseline.get(name, {}).get("seconds")
+        reference = f"{reference:.3f}" if reference is not None else "-"
+        print(f"{name:<44} {result['seconds']:>10.3f} {reference:>10} {result['throughput']:>14.0f} "
+              f"{result['peak_rss_kb'] / 1024:>14.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the simulator and the analysis against a stored baseline.")
+    parser.add_argument("roots", nargs="*", default=["data/testcases", "data/custom"],
+                        help="Directories to search for test cases")
+    parser.add_argument("--kinds", type=lambda value: value.split(","), default=list(BENCHMARK_KINDS),
+                        help="Comma-separated benchmarks to run per workload: analysis, event, tick")
+    parser.add_argument("--scale", type=lambda value: [int(f) for f in value.split(",") if f],
+                        default=list(SCALE_FACTORS),
+                        help="Comma-separated replication factors of the synthetic systems (empty for none)")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the fastest one is kept")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE,
+                        help="Accepted relative slowdown before failing")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                        help="Accepted relative peak-memory growth before failing")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(json.loads(args.run_one))))
+        return
+
+    unknown = set(args.kinds) - set(BENCHMARK_KINDS)
+    if unknown:
+        parser.error(f"unknown benchmark kinds: {', '.join(sorted(unknown))}")
+
+    specs = [spec for spec in benchmark_specs(args.roots, args.kinds, args.scale) if args.filter in spec["name"]]
+    if not specs:
+        parser.error("no benchmarks selected")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = {spec["name"]: measure(spec, args.repeat) for spec in specs}
+    print_results(results, baseline)
+
+    report = {"machine": f"{platform.machine()} {platform.python_implementation()} {platform.python_version()}",
+              "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"- {regression}")
+        sys.exit(1)
+    print("\nNo regressions" if baseline else "\nNo baseline to compare against (run with --update-baseline)")
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,23 @@
+import argparse
+import copy
 import sys
 import csv
 import math
+import time
 from functools import reduce
 
-from common.csvreader import read_csv
+from common.csvreader import read_csv, read_resources
 from common.DBF import DBF
 from common.BDR import BDR
+from common.PRM import PRM
+from common.SRPModel import SRPModel, accesses_by_component, srp_models
 from common.scheduler import Scheduler
+from common.system_model import SystemModel
+from common.profiling import Profiler
+from common.model_cache import DEFAULT_CACHE_DIR, load_system
+
+
+SUPPLY_MODELS = ('bdr', 'prm')
 
 
 def lcm(a: int, b: int) -> int:
@@ -14,22 +25,34 @@ def lcm(a: int, b: int) -> int:
     return abs(a * b) // math.gcd(a, b)
 
 
-def adjust_wcet(tasks, budgets, architectures):
+def component_supply(budget, period, supply_model='bdr'):
+    """
+    Supply of a component with PRM interface (Q, P):
+      • 'bdr': half-half BDR lower bound (Theorem 3), rate=Q/P, delay=2*(P−Q)
+      • 'prm': exact periodic-resource sbf (common.PRM), which is never below the BDR bound
+    Both offer sbf, sbf_vec, sbf_inverse and sbf_inverse_vec.
+    """
+    if supply_model == 'prm':
+        return PRM(budget=budget, period=period)
+    return BDR(rate=budget/period, delay=2*(period-budget))  # Theorem 3
+
+
+def adjust_wcet(tasks, budgets, architectures, model: SystemModel | None = None):
     # Adjust WCET by core speed factor (scaling per architecture)
-    core_speed_map = {arch.id: arch.speed_factor for arch in architectures}
-    component_core_map = {budget.id: budget.core_id for budget in budgets}
+    model = model or SystemModel(architectures, budgets, tasks)
     for task in tasks:
-        core_id = component_core_map[task.component_id]
-        task.wcet = task.wcet / core_speed_map[core_id]
+        core = model.core_of(model.component_of(task))
+        task.wcet = task.wcet / core.speed_factor
     return tasks
 
 
-def group_tasks_by_component(tasks, budgets):
+def group_tasks_by_component(tasks, budgets, model: SystemModel | None = None):
     # Group tasks into their components based on budgets.csv
+    model = model or SystemModel([], budgets, tasks)
     components = {}
     for budget in budgets:
         comp_id = budget.id
-        comp_tasks = [t for t in tasks if t.component_id == comp_id]
+        comp_tasks = list(model.tasks_by_component[comp_id])
         # Sort for RM priority order
         if budget.scheduler == Scheduler.RM:
             comp_tasks.sort(key=lambda t: t.priority)
@@ -39,75 +62,385 @@ def group_tasks_by_component(tasks, budgets):
             'core_id': budget.core_id,
             'budget': budget.budget,      # Q from PRM
             'period': budget.period,      # P from PRM
+            'srp': None,                  # SRPModel of its local resources, if any
             'schedulable': False,
         }
     return components
 
 
-def check_component_schedulability(components):
+def critical_time_points(periods, horizon):
+    """
+    All multiples k·T_j (k >= 1) of the given periods up to and including horizon,
+    sorted and without duplicates.
+    """
+    import numpy as np
+    periods = np.asarray(periods, dtype=float)
+    if periods.size == 0 or horizon <= 0:
+        return np.empty(0)
+    multiples = [np.arange(1, np.floor(horizon / T) + 1) * T for T in np.unique(periods)]
+    return np.unique(np.concatenate(multiples))
+
+
+def demand_at_periods(periods, wcets, sched):
+    """
+    Demand of each task's own scheduling window evaluated at its period:
+      • RM: dbf_rm(W, T_i, i) (Eq. 4) for every task i (tasks sorted by priority)
+      • EDF: dbf_edf(W, T_i) (Eq. 2) for every task i
+    """
+    import numpy as np
+    if sched == Scheduler.RM:
+        return np.array([DBF.dbf_rm_vec(periods, wcets, idx, periods[idx:idx + 1])[0]
+                         for idx in range(periods.size)])
+    return DBF.dbf_edf_vec(periods, wcets, periods)
+
+
+def qpa_edf_test(periods, wcets, supply, demand_cache=None):
+    """
+    Quick Processor-demand Analysis (Zhang & Burns) of an implicit-deadline EDF task set
+    under a BDR supply, or any supply bounded below by BDR(supply.rate, supply.delay)
+    such as the exact PRM sbf.
+
+    Horizon: with U = Σ C_i/T_i < rate, dbf(t) ≤ U·t ≤ sbf(t) for every
+    t ≥ L = rate·delay / (rate − U), so only deadlines below L need checking.
+    Walking backward from the last deadline before L, a point t with h = dbf(t) ≤ sbf(t)
+    proves every t' in [sbf⁻¹(h), t] safe, so the walk jumps to the largest deadline
+    ≤ sbf⁻¹(h) instead of visiting each deadline in turn.
+
+    demand_cache (dict, optional) memoizes dbf_edf(W,t) by t across calls with the
+    same task set, e.g. while probing several supplies.
+
+    Returns:
+        bool: True iff dbf_edf(W,t) ≤ sbf(t) for all t > 0
+    """
+    import numpy as np
+    if demand_cache is None:
+        demand_cache = {}
+    if periods.size == 0:
+        return True
+    utilization = float(np.sum(wcets / periods))
+    if utilization > supply.rate or (utilization == supply.rate and supply.delay > 0):
+        return False
+    if supply.delay == 0:
+        return True  # dbf(t) ≤ U·t ≤ rate·t = sbf(t)
+
+    horizon = supply.rate * supply.delay / (supply.rate - utilization)
+    smallest_deadline = periods.min()
+
+    # Largest deadline strictly below the horizon
+    t = float(np.max((np.ceil(horizon / periods) - 1) * periods))
+    while t >= smallest_deadline:
+        demand = demand_cache.get(t)
+        if demand is None:
+            demand = demand_cache[t] = DBF.dbf_edf_vec(periods, wcets, np.array([t]))[0]   # Eq.2
+        if demand > supply.sbf(t):                                    # Eq.6
+            return False
+        bound = supply.sbf_inverse(demand)
+        if bound < t:
+            # Largest deadline ≤ sbf⁻¹(dbf(t))
+            t = float(np.max(np.floor(bound / periods) * periods))
+        else:
+            # Largest deadline strictly below t
+            t = float(np.max((np.ceil(t / periods) - 1) * periods))
+    return True
+
+
+def rm_response_times(periods, wcets, supply, blocking=None):
+    """
+    Worst-case response time of every task of an RM component under a supply, by the
+    fixed-point iteration
+        R_i = sbf⁻¹(C_i + B_i + Σ_{j<i} ⌈R_i/T_j⌉·C_j)
+    with tasks in priority order (index 0 highest) and B_i the SRP blocking term
+    (blocking, optional, default 0).
+
+    While C_i + B_i ≥ B_{i−1}, the workload of task i dominates that of task i−1 at
+    every t, so R_{i−1} is a lower bound of R_i and the iteration is warm-started from
+    the previous task's result (or from sbf⁻¹(B_i + Σ_{j≤i} C_j) if larger). The
+    interference sum is one vectorized dot product per step. The iteration stops as
+    soon as R_i exceeds the deadline T_i.
+
+    Returns:
+        np.ndarray: R_i per task, inf where the task can miss its deadline
+    """
+    import numpy as np
+    if blocking is None:
+        blocking = np.zeros(periods.size)
+    response = np.full(periods.size, math.inf)
+    previous = 0.0
+    for i in range(periods.size):
+        if i > 0 and wcets[i] + blocking[i] < blocking[i - 1]:
+            previous = 0.0
+        hp_periods, hp_wcets = periods[:i], wcets[:i]
+        own = wcets[i] + blocking[i]
+        r = max(previous, supply.sbf_inverse(own + hp_wcets.sum()))
+        while r <= periods[i]:
+            following = supply.sbf_inverse(own + np.ceil(r / hp_periods) @ hp_wcets)
+            if following <= r:
+                break
+            r = following
+        if r <= periods[i]:
+            response[i] = previous = r
+    return response
+
+
+def edf_response_times(periods, wcets, supply, time_points, demand=None):
+    """
+    Worst-case response time bound of every task of an EDF component under a supply.
+
+    Shortening every deadline by δ shifts the demand: dbf'(t) = dbf(t+δ). The task set
+    therefore stays schedulable with deadlines T_i − δ for the largest δ such that
+    dbf(t) ≤ sbf(t − δ) at every deadline point t, i.e.
+        δ = min_t (t − sbf⁻¹(dbf(t)))
+    and every job completes within R_i = T_i − δ of its release (and no earlier than
+    sbf⁻¹(C_i), the time needed for the task alone).
+
+    The minimum runs over every deadline, not only those up to the largest period.
+    With U = Σ C_i/T_i < rate, sbf⁻¹(x) ≤ delay + x/rate and dbf(t) ≤ U·t give
+        t − sbf⁻¹(dbf(t)) ≥ t·(1 − U/rate) − delay,
+    so once δ₀ is the minimum over time_points, no deadline beyond
+    L = rate·(delay + δ₀) / (rate − U) can lower it, and only the deadlines in
+    (max(time_points), L] are added. With U = rate (and no delay), t − sbf⁻¹(dbf(t))
+    is 0 at the hyperperiod, so δ = min(δ₀, 0).
+
+    time_points are the critical points up to the largest period. demand (optional) is
+    dbf_edf(W, time_points) if the caller already has it, plus the SRP blocking function
+    B(t) if there is one (deadline reductions shift B alike; B vanishes from the largest
+    period on).
+
+    Returns:
+        np.ndarray: R_i per task, inf for all tasks if the component is not schedulable
+    """
+    import numpy as np
+    if periods.size == 0:
+        return np.empty(0)
+    unschedulable = np.full(periods.size, math.inf)
+    utilization = float(np.sum(wcets / periods))
+    if utilization > supply.rate or (utilization == supply.rate and supply.delay > 0):
+        return unschedulable
+    if demand is None:
+        demand = DBF.dbf_edf_vec(periods, wcets, time_points)                         # Eq.2
+    delta = float(np.min(time_points - supply.sbf_inverse_vec(demand)))
+    if delta < 0:
+        return unschedulable
+    if utilization == supply.rate:
+        delta = 0.0
+    else:
+        horizon = supply.rate * (supply.delay + delta) / (supply.rate - utilization)
+        later = critical_time_points(periods, horizon)
+        later = later[later > time_points[-1]]
+        if later.size:
+            later_demand = DBF.dbf_edf_vec(periods, wcets, later)                     # Eq.2
+            delta = min(delta, float(np.min(later - supply.sbf_inverse_vec(later_demand))))
+            if delta < 0:
+                return unschedulable
+    return np.maximum(periods - delta, supply.sbf_inverse_vec(wcets))
+
+
+class DemandCurve:
+    """
+    Demand side of a component's local test, computed once and reused for every
+    supply it is probed against (the demand does not depend on the budget).
+
+    With an SRPModel of the component's local resources, the demand includes the SRP
+    blocking terms: B_i for each task under RM (SRPModel.rm_blocking), B(t) under EDF
+    (SRPModel.edf_blocking).
+
+    Attributes:
+        scheduler (Scheduler): Local scheduler of the component
+        srp (SRPModel | None): Resource model behind the blocking terms
+        periods, wcets (np.ndarray): Task parameters in priority order
+        time_points (np.ndarray): Critical points k·T_j up to the largest period
+        period_demand (np.ndarray): Demand of each task at its own period (Eq. 4 / Eq. 2), with blocking
+    """
+    def __init__(self, tasks, scheduler, srp=None):
+        self.scheduler = scheduler
+        self.srp = srp
+        self.periods, self.wcets = DBF.task_arrays(tasks)
+        self._task_ids = [task.id for task in tasks]
+        self.period_demand = self._period_demand()
+        self._time_points = None
+        self._rm_demand = None
+        self._edf_demand = None
+        self._qpa_cache = {}
+
+    def scaled(self, factors):
+        """
+        Copy of the curve with the task WCETs multiplied by `factors` (a scalar or one
+        factor per task). Periods and critical points are shared; demand is recomputed.
+        """
+        curve = copy.copy(self)
+        curve.wcets = self.wcets * factors
+        curve.period_demand = curve._period_demand()
+        curve._rm_demand = None
+        curve._edf_demand = None
+        curve._qpa_cache = {}
+        return curve
+
+    def _period_demand(self):
+        demand = demand_at_periods(self.periods, self.wcets, self.scheduler)  # Eq.4 / Eq.2
+        if self.srp is None:
+            return demand
+        if self.scheduler == Scheduler.RM:
+            return demand + self.srp.rm_blocking(self._task_ids)
+        return demand + self.srp.edf_blocking(self.periods)
+
+    def _rm_blocking(self):
+        import numpy as np
+        if self.srp is None:
+            return np.zeros(self.periods.size)
+        return self.srp.rm_blocking(self._task_ids)
+
+    def _edf_points_demand(self):
+        """dbf_edf(W,t) + B(t) at the critical points, computed once."""
+        if self._edf_demand is None:
+            self._edf_demand = DBF.dbf_edf_vec(self.periods, self.wcets, self.time_points)  # Eq.2
+            if self.srp is not None:
+                self._edf_demand = self._edf_demand + self.srp.edf_blocking(self.time_points)
+        return self._edf_demand
+
+    @property
+    def time_points(self):
+        if self._time_points is None:
+            max_deadline = self.periods.max() if self.periods.size else 0
+            self._time_points = critical_time_points(self.periods, max_deadline)
+        return self._time_points
+
+    def is_schedulable(self, supply, edf_test='exhaustive'):
+        """
+        Local test of the component under a supply (see check_component_schedulability).
+        """
+        import numpy as np
+        periods, wcets = self.periods, self.wcets
+        if self.scheduler == Scheduler.RM:
+            # For each task i, need ∃ t ≤ T_i s.t. dbf_rm(W,t,i) ≤ sbf(t)
+            if self._rm_demand is None:
+                blocking = self._rm_blocking()
+                self._rm_demand = [
+                    DBF.dbf_rm_vec(periods, wcets, idx,                                   # Eq.4
+                                   self.time_points[:np.searchsorted(self.time_points, T, side='right')])
+                    + blocking[idx]
+                    for idx, T in enumerate(periods)
+                ]
+            supply_at_points = supply.sbf_vec(self.time_points)                           # Eq.6
+            ok = all(np.any(demand <= supply_at_points[:demand.size]) for demand in self._rm_demand)
+        elif edf_test == 'qpa':
+            ok = qpa_edf_test(periods, wcets, supply, self._qpa_cache)
+            if ok and self.srp is not None:
+                # B(t) = 0 from the largest period on, where QPA has checked dbf alone;
+                # below it, check dbf + B at every critical point
+                ok = bool(np.all(self._edf_points_demand() <= supply.sbf_vec(self.time_points)))
+        else:
+            # EDF: ∀ t, dbf_edf(W,t) + B(t) ≤ sbf(t)
+            ok = bool(np.all(self._edf_points_demand() <= supply.sbf_vec(self.time_points)))  # Eq.2 / Eq.6
+
+        # Also ensure every individual task meets its deadline under this supply
+        return ok and bool(np.all(self.period_demand <= supply.sbf_vec(periods)))
+
+    def response_times(self, supply):
+        """
+        Worst-case response time of every task under a supply (rm_response_times or
+        edf_response_times), in the order of self.periods.
+        """
+        if self.scheduler == Scheduler.RM:
+            return rm_response_times(self.periods, self.wcets, supply, self._rm_blocking())
+        return edf_response_times(self.periods, self.wcets, supply, self.time_points, self._edf_points_demand())
+
+
+def check_component_schedulability(components, edf_test='exhaustive', profiler=None, supply_model='bdr'):
     """
     For each component, check local schedulability under its PRM budget:
-    - Convert PRM (Q,P) to a conservative BDR lower-bound via Half-Half (Theorem 3): rate=Q/P, delay=2*(P−Q)
-    - Use Supply Bound Function sbf_BDR (Eq. 6) for supply.sbf(t)
+    - Convert PRM (Q,P) to a conservative BDR lower-bound via Half-Half (Theorem 3): rate=Q/P, delay=2*(P−Q)
+    - Use Supply Bound Function sbf_BDR (Eq. 6) for supply.sbf(t)
     - Use Demand Bound Functions:
-        • RM: dbf_rm(W,t,i) (Eq. 4)
-        • EDF: dbf_edf(W,t) (Eq. 2)
+        • RM: dbf_rm(W,t,i) (Eq. 4)
+        • EDF: dbf_edf(W,t) (Eq. 2)
     - For both schedulers, generate all critical points t = k·T_j up to each component's max deadline.
     Then apply the tests:
         RM: ∀τ_i ∃ t ≤ T_i such that dbf_rm(W,t,i) ≤ sbf(t)
         EDF: ∀ t ≥ 0 dbf_edf(W,t) ≤ sbf(t)
+    Demand and supply are evaluated for all time points at once with the vectorized
+    DBF/BDR functions.
+
+    edf_test selects the EDF test: 'exhaustive' checks every critical point up to the
+    largest period, 'qpa' runs qpa_edf_test over a horizon derived from the supply.
+    supply_model 'prm' replaces the BDR bound by the exact PRM sbf (see component_supply).
+    With a common.profiling.Profiler, the time spent on each component is recorded.
     """
-    for comp in components.values():
-        tasks = comp['tasks']
-        sched = comp['scheduler']
-        Q, P = comp['budget'], comp['period']
-        supply = BDR(rate=Q/P, delay=2*(P-Q))  # Theorem 3
-
-        # Build global critical points: multiples of all periods
-        periods = [t.period for t in tasks]
-        max_deadline = max(periods) if periods else 0
-        time_points = set()
-        for T in periods:
-            k = 1
-            while k * T <= max_deadline:
-                time_points.add(k * T)
-                k += 1
-        time_points = sorted(time_points)
-
-        ok = True
-        if sched == Scheduler.RM:
-            # For each task i, need ∃ t ≤ T_i s.t. dbf_rm(W,t,i) ≤ sbf(t)
-            for idx, task in enumerate(tasks):
-                Ti = task.period
-                found = False
-                for t in time_points:
-                    if t > Ti:
-                        break
-                    demand = DBF.dbf_rm(tasks, t, idx)  # Eq.4
-                    if demand <= supply.sbf(t):         # Eq.6
-                        found = True
-                        break
-                if not found:
-                    ok = False
-                    break
+    for comp_id, comp in components.items():
+        if profiler is not None:
+            profiler.mark()
+        supply = component_supply(comp['budget'], comp['period'], supply_model)
+        curve = DemandCurve(comp['tasks'], comp['scheduler'], comp['srp'])
+        comp['schedulable'] = curve.is_schedulable(supply, edf_test)
+        if profiler is not None:
+            profiler.lap(f"analysis.component.{comp_id}")
+            profiler.count("analysis.components")
+            profiler.count("analysis.tasks", len(comp['tasks']))
+            profiler.observe("analysis.component_tasks", len(comp['tasks']))
+    return components
+
+
+def minimal_budget(curve, period, edf_test='exhaustive', supply_model='bdr'):
+    """
+    Smallest integer budget Q ≤ period for which the component passes its local test
+    under component_supply(Q, period, supply_model).
+
+    A larger Q raises the supply at every interval (for the BDR bound and the exact
+    PRM sbf alike), so the test
+    is monotone in Q: a binary search over Q needs O(log P) probes, each of which only
+    re-evaluates the supply against the cached demand curve.
+
+    Returns:
+        int | None: The minimal budget, or None if even Q = P is not enough
+    """
+    if curve.periods.size == 0:
+        return 0
+    passes = lambda Q: curve.is_schedulable(component_supply(Q, period, supply_model), edf_test)
+    if not passes(period):
+        return None
+    failing, passing = 0, int(period)
+    while passing - failing > 1:
+        mid = (failing + passing) // 2
+        if passes(mid):
+            passing = mid
         else:
-            # EDF: ∀ t, dbf_edf(W,t) ≤ sbf(t)
-            for t in time_points:
-                demand = DBF.dbf_edf(tasks, t)      # Eq.2
-                if demand > supply.sbf(t):          # Eq.6
-                    ok = False
-                    break
+            failing = mid
+    return passing
 
-        # Also ensure every individual task meets its deadline under this supply
-        task_checks = []
-        for idx, task in enumerate(tasks):
-            if sched == Scheduler.RM:
-                demand = DBF.dbf_rm(tasks, task.period, idx)
+
+def synthesize_interfaces(components, candidate_periods=(), edf_test='exhaustive', supply_model='bdr'):
+    """
+    Interface synthesis: for each component, find the PRM (Q, P) with the smallest
+    bandwidth Q/P that keeps the component schedulable, trying its current period and
+    every candidate period.
+
+    Returns:
+        dict: component id -> (Q, P), or None if no candidate period is feasible
+    """
+    interfaces = {}
+    for comp_id, comp in components.items():
+        curve = DemandCurve(comp['tasks'], comp['scheduler'], comp['srp'])
+        best = None
+        for period in dict.fromkeys([comp['period'], *candidate_periods]):
+            budget = minimal_budget(curve, period, edf_test, supply_model)
+            if budget is not None and (best is None or budget / period < best[0] / best[1]):
+                best = (budget, period)
+        interfaces[comp_id] = best
+    return interfaces
+
+
+def write_budgets_csv(budgets, interfaces, filename='budgets_optimized.csv'):
+    # budgets.csv with the synthesized (Q, P); components without a feasible interface keep theirs
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['component_id', 'scheduler', 'budget', 'period', 'core_id', 'priority'])
+        for budget in budgets:
+            Q, P = interfaces.get(budget.id) or (budget.budget, budget.period)
+            priority = budget.priority
+            if priority is None or (isinstance(priority, float) and math.isnan(priority)):
+                priority = ''
             else:
-                demand = DBF.dbf_edf(tasks, task.period)
-            task_checks.append(demand <= supply.sbf(task.period))
-        comp['schedulable'] = ok and all(task_checks)
-    return components
+                priority = int(priority)
+            writer.writerow([budget.id, budget.scheduler.name, Q, P, budget.core_id, priority])
 
 
 def summarize_by_core(components, architectures):
@@ -145,15 +478,20 @@ def summarize_by_core(components, architectures):
     return core_summary
 
 
-def output_report(components, core_summary):
+def output_report(components, core_summary, supply_model='bdr'):
     # Produce console output only (no file)
     for comp_id, comp in components.items():
         Q, P = comp['budget'], comp['period']
         rate = Q/P              # PRM bandwidth
-        delay = 2*(P-Q)         # BDR startup delay
         label = 'Schedulable' if comp['schedulable'] else 'Not schedulable'
+        if supply_model == 'prm':
+            # Exact sbf: no supply for up to 2(P−Q), then Q in every later P
+            supply = f"exact sbf(rate={rate:.4f},blackout={2*(P-Q):.2f})"
+        else:
+            delay = 2*(P-Q)     # BDR startup delay
+            supply = f"BLB(rate={rate:.4f},delay={delay:.2f})"
         print(f"Component {comp_id} (Core {comp['core_id']}, {comp['scheduler'].name}): "
-              f"PRM_sup=(Q={Q},P={P}), BLB(rate={rate:.4f},delay={delay:.2f}) - {label}")
+              f"PRM_sup=(Q={Q},P={P}), {supply} - {label}")
 
     print('\nCore-level Summary:')
     for core_id, ok in core_summary.items():
@@ -161,48 +499,320 @@ def output_report(components, core_summary):
         print(f"Core {core_id}: {core_stat}")
 
 
-def write_solution_csv(tasks, components, filename='analysis_solution.csv'): 
-    # CSV with task- and component-level results
+def output_response_times(components, supply_model='bdr'):
+    """Print the worst-case response time bound and the headroom to the deadline of every task."""
+    print('\nWorst-case response times:')
+    for comp_id, comp in components.items():
+        curve = DemandCurve(comp['tasks'], comp['scheduler'], comp['srp'])
+        response_times = curve.response_times(component_supply(comp['budget'], comp['period'], supply_model))
+        for task, period, response in zip(comp['tasks'], curve.periods, response_times):
+            if math.isfinite(response):
+                print(f"Task {task.id} (Component {comp_id}): WCRT={response:.2f}, "
+                      f"deadline={period:g}, headroom={period - response:.2f}")
+            else:
+                print(f"Task {task.id} (Component {comp_id}): WCRT unbounded, deadline={period:g}")
+
+
+def write_solution_csv(tasks, components, filename='analysis_solution.csv', supply_model='bdr'):
+    # CSV with task- and component-level results; worst_case_response_time is left
+    # empty for tasks without a finite bound
     rows = []
     for cid, comp in components.items():
-        supply = BDR(rate=comp['budget']/comp['period'], delay=2*(comp['period']-comp['budget']))
-        for task in comp['tasks']:
-            if comp['scheduler'] == Scheduler.RM:
-                idx = comp['tasks'].index(task)
-                demand = DBF.dbf_rm(comp['tasks'], task.period, idx)  # Eq.4
-            else:
-                demand = DBF.dbf_edf(comp['tasks'], task.period)     # Eq.2
+        supply = component_supply(comp['budget'], comp['period'], supply_model)
+        curve = DemandCurve(comp['tasks'], comp['scheduler'], comp['srp'])
+        task_checks = curve.period_demand <= supply.sbf_vec(curve.periods)  # Eq.4 / Eq.2
+        response_times = curve.response_times(supply)
+        for task, task_ok, response in zip(comp['tasks'], task_checks, response_times):
             rows.append({
                 'task_name': task.id,
                 'component_id': cid,
-                'task_schedulable': int(demand <= supply.sbf(task.period)),
-                'component_schedulable': int(comp['schedulable'])
+                'task_schedulable': int(task_ok),
+                'component_schedulable': int(comp['schedulable']),
+                'worst_case_response_time': round(float(response), 4) if math.isfinite(response) else ''
             })
     with open(filename, 'w', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=[
-            'task_name','component_id','task_schedulable','component_schedulable'
+            'task_name','component_id','task_schedulable','component_schedulable','worst_case_response_time'
         ])
         writer.writeheader()
         for r in rows:
             writer.writerow(r)
 
 
-def main():
-    if len(sys.argv) != 4:
-        print("Usage: python analysis.py <architecture.csv> <budgets.csv> <tasks.csv>")
-        sys.exit(1)
+def analyze(architectures, budgets, tasks, edf_test='exhaustive', wcet_adjusted=False, profiler=None,
+            supply_model='bdr', resources=None):
+    """
+    Full analysis pipeline on already loaded inputs: adjust WCETs to the core speeds
+    (in place, unless wcet_adjusted says they already are), group tasks into components,
+    run the local component checks and the core-level summary. With resources (a list of
+    common.SRPModel.ResourceAccess), the local checks include the SRP blocking terms.
 
-    architectures, budgets, tasks = read_csv()
-    tasks = adjust_wcet(tasks, budgets, architectures)
-    components = group_tasks_by_component(tasks, budgets)
+    Returns:
+        tuple: (components, core_summary) as produced by check_component_schedulability
+               and summarize_by_core
+    """
+    model = SystemModel(architectures, budgets, tasks)
+    if not wcet_adjusted:
+        adjust_wcet(tasks, budgets, architectures, model)
+    components = group_tasks_by_component(tasks, budgets, model)
+    for comp_id, srp in srp_models(model, resources or []).items():
+        components[comp_id]['srp'] = srp
 
     # Local component checks
-    components = check_component_schedulability(components)
+    components = check_component_schedulability(components, edf_test, profiler, supply_model)
     # Global core summaries
     core_summary = summarize_by_core(components, architectures)
+    return components, core_summary
+
+
+class AnalysisSession:
+    """
+    Stateful analysis for what-if edits.
+
+    The session runs the full pipeline once and keeps its results: the component dicts
+    (as built by group_tasks_by_component), a DemandCurve per component and the BDR rate
+    sum of every core. Each edit re-evaluates only the components it touches and their
+    cores: task edits rebuild the demand curve of the component, budget edits only
+    re-evaluate the supply against the cached demand.
+
+    The session works on copies of the tasks and components, keeps the nominal WCETs and
+    scales them by the core speed itself. With resources (critical sections, as for
+    `analyze`), the SRP model of a component is rebuilt along with its demand curve.
+    Results always match `analyze` on the edited system.
+
+    Attributes:
+        components (dict): Component id -> component dict, with the current 'schedulable' flag
+        core_summary (dict): Core id -> core-level result, as from summarize_by_core
+        core_rates (dict): Core id -> sum of the BDR rates of its components
+    """
+    def __init__(self, architectures, budgets, tasks, edf_test='exhaustive', wcet_adjusted=False,
+                 supply_model='bdr', resources=None):
+        self.edf_test = edf_test
+        self.supply_model = supply_model
+        self.cores = {core.id: core for core in architectures}
+        self.budgets = {budget.id: copy.copy(budget) for budget in budgets}
+        self.tasks = {task.id: copy.copy(task) for task in tasks}
+        model = SystemModel(architectures, list(self.budgets.values()), list(self.tasks.values()))
+        self._accesses = {}  # Task id -> its critical sections
+        for component_accesses in accesses_by_component(model, resources or []).values():
+            for access in component_accesses:
+                self._accesses.setdefault(access.task_id, []).append(access)
+
+        self._nominal_wcet = {}
+        for task in self.tasks.values():
+            speed = model.core_of(model.component_of(task)).speed_factor
+            self._nominal_wcet[task.id] = task.wcet * speed if wcet_adjusted else task.wcet
+            task.wcet = self._nominal_wcet[task.id] / speed
+
+        self.components = group_tasks_by_component(list(self.tasks.values()), list(self.budgets.values()), model)
+        self._components_by_core = {core_id: [] for core_id in self.cores}
+        for comp_id, comp in self.components.items():
+            self._components_by_core[comp['core_id']].append(comp_id)
+
+        self._curves = {}
+        # Cores without components are trivially schedulable
+        self.core_summary = {core_id: True for core_id in self.cores}
+        self.core_rates = {core_id: 0 for core_id in self.cores}
+        self._refresh(self.components, rebuild_demand=True)
+
+    def update_task(self, task_id, wcet=None, period=None, priority=None):
+        """
+        Change the nominal WCET, period and/or priority of a task.
+
+        Returns:
+            dict: Results of the re-evaluated components and cores (see _refresh)
+        """
+        task = self.tasks[task_id]
+        if wcet is not None:
+            self._nominal_wcet[task_id] = wcet
+        if period is not None:
+            task.period = period
+        if priority is not None:
+            task.priority = priority
+        task.wcet = self._nominal_wcet[task_id] / self._speed_of(task.component_id)
+        self._sort_tasks(task.component_id)
+        return self._refresh([task.component_id], rebuild_demand=True)
+
+    def move_task(self, task_id, component_id):
+        """
+        Move a task to another component (rescaling its WCET to the new core's speed).
+
+        Raises:
+            ValueError: If the component does not exist, or if the task shares a resource
+                with a task that stays in its component
+        """
+        if component_id not in self.components:
+            raise ValueError(f"Component {component_id} does not exist")
+        task = self.tasks[task_id]
+        source = task.component_id
+        own = {access.resource_id for access in self._accesses.get(task_id, [])}
+        shared = own & {access.resource_id for other in self.components[source]['tasks'] if other is not task
+                        for access in self._accesses.get(other.id, [])}
+        if shared and component_id != source:
+            raise ValueError(f"Task {task_id} shares resources {sorted(shared)} with component {source}; "
+                             f"only component-local resources are supported")
+        self.components[source]['tasks'].remove(task)
+        task.component_id = component_id
+        task.wcet = self._nominal_wcet[task_id] / self._speed_of(component_id)
+        self.components[component_id]['tasks'].append(task)
+        self._sort_tasks(component_id)
+        return self._refresh(dict.fromkeys([source, component_id]), rebuild_demand=True)
+
+    def change_budget(self, component_id, budget=None, period=None):
+        """
+        Change the PRM budget Q and/or period P of a component; its demand curve is reused.
+
+        Raises:
+            ValueError: If the component does not exist or the new budget is not in [0, P] with P > 0
+        """
+        if component_id not in self.components:
+            raise ValueError(f"Component {component_id} does not exist")
+        comp = self.components[component_id]
+        new_budget = comp['budget'] if budget is None else budget
+        new_period = comp['period'] if period is None else period
+        if new_period <= 0 or not 0 <= new_budget <= new_period:
+            raise ValueError(f"Invalid budget Q={new_budget}, P={new_period} for component {component_id}: "
+                             f"need P > 0 and 0 ≤ Q ≤ P")
+        if budget is not None:
+            comp['budget'] = self.budgets[component_id].budget = budget
+        if period is not None:
+            comp['period'] = self.budgets[component_id].period = period
+        return self._refresh([component_id], rebuild_demand=False)
+
+    def add_component(self, component, tasks=()):
+        """Add a component (a Component as read from budgets.csv) with its tasks (nominal WCETs)."""
+        if component.id in self.components:
+            raise ValueError(f"Component {component.id} already exists")
+        component = copy.copy(component)
+        self.budgets[component.id] = component
+        self.components[component.id] = {
+            'tasks': [],
+            'scheduler': component.scheduler,
+            'core_id': component.core_id,
+            'budget': component.budget,
+            'period': component.period,
+            'srp': None,
+            'schedulable': False,
+        }
+        self._components_by_core[component.core_id].append(component.id)
+        for task in tasks:
+            task = copy.copy(task)
+            task.component_id = component.id
+            self.tasks[task.id] = task
+            self._nominal_wcet[task.id] = task.wcet
+            task.wcet = task.wcet / self._speed_of(component.id)
+            self.components[component.id]['tasks'].append(task)
+        self._sort_tasks(component.id)
+        return self._refresh([component.id], rebuild_demand=True)
+
+    def _speed_of(self, component_id):
+        return self.cores[self.components[component_id]['core_id']].speed_factor
+
+    def _srp_of(self, component_id):
+        comp = self.components[component_id]
+        accesses = [access for task in comp['tasks'] for access in self._accesses.get(task.id, [])]
+        if not accesses:
+            return None
+        return SRPModel(comp['scheduler'], comp['tasks'], accesses, self._speed_of(component_id))
+
+    def _sort_tasks(self, component_id):
+        comp = self.components[component_id]
+        if comp['scheduler'] == Scheduler.RM:
+            # Tasks moved in from an EDF component have no priority and come last
+            comp['tasks'].sort(key=lambda t: t.priority if t.priority is not None else math.inf)
+
+    def _refresh(self, component_ids, rebuild_demand):
+        """
+        Re-run the local test of the given components and the core-level check of their cores.
+
+        Returns:
+            dict: {'components': {id: schedulable}, 'cores': {id: schedulable}} for the re-evaluated ones
+        """
+        result = {'components': {}, 'cores': {}}
+        for comp_id in component_ids:
+            comp = self.components[comp_id]
+            if rebuild_demand or comp_id not in self._curves:
+                comp['srp'] = self._srp_of(comp_id)
+                self._curves[comp_id] = DemandCurve(comp['tasks'], comp['scheduler'], comp['srp'])
+            supply = component_supply(comp['budget'], comp['period'], self.supply_model)
+            comp['schedulable'] = self._curves[comp_id].is_schedulable(supply, self.edf_test)
+            result['components'][comp_id] = comp['schedulable']
+            result['cores'][comp['core_id']] = None
+
+        for core_id in result['cores']:
+            # Same composition test as summarize_by_core, over this core only
+            comps_on_core = [self.components[comp_id] for comp_id in self._components_by_core[core_id]]
+            self.core_rates[core_id] = sum(comp['budget'] / comp['period'] for comp in comps_on_core)
+            self.core_summary[core_id] = (self.core_rates[core_id] <= 1.0 and
+                                          all(comp['schedulable'] for comp in comps_on_core))
+            result['cores'][core_id] = self.core_summary[core_id]
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compositional schedulability analysis of a hierarchical system.")
+    parser.add_argument("architecture", help="Path to architecture.csv")
+    parser.add_argument("budgets", help="Path to budgets.csv")
+    parser.add_argument("tasks", help="Path to tasks.csv")
+    parser.add_argument("--edf-test", choices=["exhaustive", "qpa"], default="exhaustive",
+                        help="Check every critical point up to the largest period, or run QPA up to a supply-derived horizon")
+    parser.add_argument("--supply", choices=SUPPLY_MODELS, default="bdr",
+                        help="Component supply: half-half BDR bound of the PRM budget, or the exact PRM sbf")
+    parser.add_argument("--resources", metavar="RESOURCES_CSV",
+                        help="Critical sections of the tasks; adds the SRP blocking terms to the local tests")
+    parser.add_argument("--synthesize-budgets", metavar="BUDGETS_CSV",
+                        help="Search the minimal budget of each component and write an optimized budgets.csv")
+    parser.add_argument("--periods", type=lambda value: [int(p) for p in value.split(',')], default=[],
+                        help="Comma-separated candidate periods for --synthesize-budgets (the current period is always tried)")
+    parser.add_argument("--wcrt", action="store_true",
+                        help="Print the worst-case response time bound and deadline headroom of every task")
+    parser.add_argument("--profile", metavar="REPORT_JSON",
+                        help="Write loading and per-component analysis times to a JSON report")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE_DIR, metavar="CACHE_DIR",
+                        help="Load the system through the content-hashed model cache")
+    args = parser.parse_args()
+    profiler = Profiler() if args.profile else None
+
+    start = time.perf_counter()
+    if args.cache:
+        system = load_system(args.architecture, args.budgets, args.tasks, args.cache)
+        architectures, budgets, tasks = system.cores, system.components, system.tasks
+    else:
+        architectures, budgets, tasks = read_csv(args.architecture, args.budgets, args.tasks)
+    resources = read_resources(args.resources) if args.resources else None
+    load_seconds = time.perf_counter() - start
+    print(f"Loading inputs: {load_seconds * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    components, core_summary = analyze(architectures, budgets, tasks, args.edf_test,
+                                       wcet_adjusted=args.cache is not None, profiler=profiler,
+                                       supply_model=args.supply, resources=resources)
+    analysis_seconds = time.perf_counter() - start
+    print(f"Analysis ({args.edf_test} EDF test, {args.supply} supply): {analysis_seconds * 1000:.2f} ms\n")
+    if profiler is not None:
+        profiler.add_time("analysis.load", load_seconds)
+        profiler.add_time("analysis.total", analysis_seconds)
+
+    output_report(components, core_summary, args.supply)
+    if args.wcrt:
+        output_response_times(components, args.supply)
+    write_solution_csv(tasks, components, supply_model=args.supply)
+
+    if args.synthesize_budgets:
+        interfaces = synthesize_interfaces(components, args.periods, args.edf_test, args.supply)
+        print('\nInterface synthesis:')
+        for comp_id, interface in interfaces.items():
+            comp = components[comp_id]
+            if interface is None:
+                print(f"Component {comp_id}: no feasible budget, keeping Q={comp['budget']}, P={comp['period']}")
+            else:
+                Q, P = interface
+                print(f"Component {comp_id}: Q={Q}, P={P} (bandwidth {Q/P:.4f}, "
+                      f"was {comp['budget']/comp['period']:.4f})")
+        write_budgets_csv(budgets, interfaces, args.synthesize_budgets)
 
-    output_report(components, core_summary)
-    write_solution_csv(tasks, components)
+    if profiler is not None:
+        profiler.write_json(args.profile)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,143 @@
+import argparse
+import contextlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from analysis import analyze
+from common.csvreader import read_budgets, read_cores, read_tasks
+from common.sampler import NormalSampler
+from common.utils import get_project_root
+from simulator import LOWER_BOUND_PERCENTAGE, SIMULATION_ITERATIONS, Simulator
+
+CASE_FILES = ("architecture.csv", "budgets.csv", "tasks.csv")
+
+def discover_cases(roots: list[str]) -> list[str]:
+    """
+    Find every test-case directory below the given roots, i.e. every directory that
+    contains architecture.csv, budgets.csv and tasks.csv.
+
+    Args:
+        roots: Directories to search. Relative paths are tried from the working
+            directory first and then from the project root.
+
+    Returns:
+        list[str]: Case directories, sorted
+    """
+    cases = []
+    for root in roots:
+        if not os.path.isdir(root):
+            root = os.path.join(get_project_root(), root)
+        for directory, _, files in os.walk(root):
+            if all(name in files for name in CASE_FILES):
+                cases.append(directory)
+    return sorted(cases)
+
+def run_case(case_dir: str, run_analysis: bool = True, run_simulation: bool = True,
+             edf_test: str = "exhaustive", engine: str = "event",
+             iterations: int = SIMULATION_ITERATIONS, seed: int | None = None) -> dict:
+    """
+    Analyse and/or simulate one case in-process and collect the results.
+
+    Console output of the library functions is discarded; failures are reported in the
+    result instead of aborting the batch.
+
+    Returns:
+        dict: Case name and path, per-stage results and wall-clock seconds, and the error if any
+    """
+    architecture, budgets, tasks = (os.path.join(case_dir, name) for name in CASE_FILES)
+    result = {"case": os.path.basename(case_dir), "path": case_dir}
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            if run_analysis:
+                stage_start = time.perf_counter()
+                components, core_summary = analyze(read_cores(architecture), read_budgets(budgets),
+                                                   read_tasks(tasks), edf_test)
+                result["analysis"] = {
+                    "components": {comp_id: comp["schedulable"] for comp_id, comp in components.items()},
+                    "cores": core_summary,
+                    "seconds": time.perf_counter() - stage_start,
+                }
+
+            if run_simulation:
+                stage_start = time.perf_counter()
+                sampler = NormalSampler(LOWER_BOUND_PERCENTAGE, np.random.default_rng(seed))
+                simulator = Simulator(read_cores(architecture), read_budgets(budgets), read_tasks(tasks), sampler)
+                if engine == "event":
+                    simulator.run_event_driven(iterations)
+                else:
+                    simulator.run(iterations)
+                result["simulation"] = {
+                    "tasks": [vars(task_result) for task_result in simulator.get_task_results()],
+                    "seconds": time.perf_counter() - stage_start,
+                }
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def run_batch(cases: list[str], workers: int = 1, **options) -> list[dict]:
+    """
+    Run `run_case` over all cases, in a pool of worker processes when workers > 1.
+    Results are returned in case order.
+    """
+    if workers <= 1:
+        return [run_case(case, **options) for case in cases]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_case, case, **options) for case in cases]
+        return [future.result() for future in futures]
+
+def print_summary(results: list[dict]):
+    for result in results:
+        if "error" in result:
+            status = f"ERROR {result['error']}"
+        else:
+            parts = []
+            if "analysis" in result:
+                cores = result["analysis"]["cores"].values()
+                parts.append(f"analysis: {sum(cores)}/{len(cores)} cores schedulable")
+            if "simulation" in result:
+                tasks = result["simulation"]["tasks"]
+                schedulable = sum(task["task_schedulable"] for task in tasks)
+                parts.append(f"simulation: {schedulable}/{len(tasks)} tasks schedulable")
+            status = ", ".join(parts)
+        print(f"{result['case']:<32} {result['seconds']:>9.3f} s  {status}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse and/or simulate every test case below some directories.")
+    parser.add_argument("roots", nargs="*", default=["data/testcases", "data/custom"],
+                        help="Directories to search for test cases")
+    parser.add_argument("--no-analysis", dest="analysis", action="store_false", help="Skip the analysis")
+    parser.add_argument("--no-simulation", dest="simulation", action="store_false", help="Skip the simulation")
+    parser.add_argument("--edf-test", choices=["exhaustive", "qpa"], default="exhaustive")
+    parser.add_argument("--engine", choices=["tick", "event"], default="event")
+    parser.add_argument("--iterations", type=int, default=SIMULATION_ITERATIONS)
+    parser.add_argument("--seed", type=int, help="Seed of every simulation's random number generator")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of cases processed in parallel")
+    parser.add_argument("--report", default="batch_report.json", help="Path of the aggregated JSON report")
+    args = parser.parse_args()
+
+    cases = discover_cases(args.roots)
+    if not cases:
+        parser.error(f"no test cases found under {', '.join(args.roots)}")
+
+    start = time.perf_counter()
+    results = run_batch(cases, args.workers, run_analysis=args.analysis, run_simulation=args.simulation,
+                        edf_test=args.edf_test, engine=args.engine, iterations=args.iterations, seed=args.seed)
+    total_seconds = time.perf_counter() - start
+
+    print_summary(results)
+    print(f"\n{len(cases)} cases in {total_seconds:.3f} s")
+
+    with open(args.report, "w") as f:
+        # NumPy scalars that reach the analysis or simulation results are written as plain numbers
+        json.dump({"cases": results, "seconds": total_seconds}, f, indent=2,
+                  default=lambda value: value.item() if hasattr(value, "item") else str(value))
+
+if __name__ == "__main__":
+    main()
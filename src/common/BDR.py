@@ -1,12 +1,17 @@
 # common/BDR.py
 
+from __future__ import annotations
+
 import math
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 from functools import reduce
 
 from common.DBF import DBF
 from common.scheduler import Scheduler
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def lcm(a: int, b: int) -> int:
     """Compute least common multiple of two integers."""
@@ -33,6 +38,36 @@ class BDR:
             return 0.0
         return self.rate * (interval - self.delay)
 
+    def sbf_vec(self, intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized sbf: supply for every interval of an array in one call.
+        """
+        import numpy as np
+        intervals = np.asarray(intervals, dtype=float)
+        return np.where(intervals < self.delay, 0.0, self.rate * (intervals - self.delay))
+
+    def sbf_inverse(self, demand: float) -> float:
+        """
+        Smallest interval whose supply covers the demand:
+          sbf_inverse(demand) = 0,                        if demand <= 0
+                                delay + demand / rate,   otherwise
+        """
+        if demand <= 0:
+            return 0.0
+        if self.rate <= 0:
+            return math.inf
+        return self.delay + demand / self.rate
+
+    def sbf_inverse_vec(self, demands: np.ndarray) -> np.ndarray:
+        """
+        Vectorized sbf_inverse: smallest covering interval for every demand of an array.
+        """
+        import numpy as np
+        demands = np.asarray(demands, dtype=float)
+        if self.rate <= 0:
+            return np.where(demands <= 0, 0.0, math.inf)
+        return np.where(demands <= 0, 0.0, self.delay + demands / self.rate)
+
     @staticmethod
     def can_schedule_children(parent: "BDR", children: List["BDR"]) -> bool:
         """
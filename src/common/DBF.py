@@ -1,7 +1,16 @@
 # common/DBF.py
 
+from __future__ import annotations
+
 import math
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Upper bound on the number of (interval, task) cells evaluated at once by the
+# vectorized functions, to keep the temporary matrices small
+VECTOR_CHUNK_CELLS = 1 << 22
 
 class DBF:
     @staticmethod
@@ -44,3 +53,59 @@ class DBF:
             invocations = math.ceil(interval / higher.period)
             demand += invocations * higher.wcet
         return demand
+
+    @staticmethod
+    def task_arrays(tasks: Sequence) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Collect the periods and WCETs of a task sequence into arrays, in task order,
+        for the vectorized demand bound functions.
+        """
+        import numpy as np
+        periods = np.fromiter((task.period for task in tasks), dtype=float, count=len(tasks))
+        wcets = np.fromiter((task.wcet for task in tasks), dtype=float, count=len(tasks))
+        return periods, wcets
+
+    @staticmethod
+    def dbf_edf_vec(periods: np.ndarray, wcets: np.ndarray, intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized dbf_edf: demand of implicit-deadline tasks at every interval in one call.
+            dbfEDF(W, t) = sum(floor(t / period) * wcet)   for each t in intervals
+        """
+        import numpy as np
+        return DBF._demand(lambda t: np.floor(t / periods), wcets, intervals)
+
+    @staticmethod
+    def dbf_edf_explicit_vec(periods: np.ndarray, wcets: np.ndarray, deadlines: np.ndarray,
+                             intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized dbf_edf_explicit:
+            dbfEDF(W, t) = sum(max(0, floor((t + period - deadline) / period)) * wcet)
+        """
+        import numpy as np
+        return DBF._demand(lambda t: np.maximum(np.floor((t + periods - deadlines) / periods), 0),
+                           wcets, intervals)
+
+    @staticmethod
+    def dbf_rm_vec(periods: np.ndarray, wcets: np.ndarray, index: int, intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized dbf_rm for the task at 'index' (tasks sorted by priority):
+            dbfRM(W, t, i) = wcet_i + sum(ceil(t / period_k) * wcet_k)   for k < i
+        """
+        import numpy as np
+        higher_periods = periods[:index]
+        interference = DBF._demand(lambda t: np.ceil(t / higher_periods), wcets[:index], intervals)
+        return wcets[index] + interference
+
+    @staticmethod
+    def _demand(job_counts, wcets: np.ndarray, intervals: np.ndarray) -> np.ndarray:
+        import numpy as np
+        # Evaluate sum_k job_counts(t)_k * wcet_k for every t, chunking over the intervals
+        intervals = np.asarray(intervals, dtype=float)
+        demand = np.zeros(intervals.shape[0])
+        if wcets.size == 0:
+            return demand
+        rows = max(1, VECTOR_CHUNK_CELLS // wcets.size)
+        for start in range(0, intervals.shape[0], rows):
+            chunk = intervals[start:start + rows, None]
+            demand[start:start + rows] = job_counts(chunk) @ wcets
+        return demand
@@ -0,0 +1,78 @@
+# common/PRM.py
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class PRM:
+    def __init__(self, budget: float, period: float):
+        """
+        Periodic Resource Model Γ(P, Q): `budget` units of supply every `period`,
+        delivered at any time within each period.
+          rate  – long-term supply rate Q/P
+          delay – blackout interval 2(P − Q) of the worst-case supply pattern
+
+        rate and delay are those of the half-half BDR bound (Theorem 3), which lies below
+        the exact sbf everywhere; QPA uses them to bound its horizon.
+        """
+        self.budget = budget
+        self.period = period
+        self.rate = budget / period if period > 0 else 0.0
+        self.delay = 2 * (period - budget)
+
+    def sbf(self, interval: float) -> float:
+        """
+        Supply Bound Function of the periodic resource (Shin & Lee):
+          k = ⌊(interval − (P − Q)) / P⌋
+          sbf(interval) = k·Q + max(0, interval − 2(P − Q) − k·P),   if interval ≥ P − Q
+                          0,                                           otherwise
+        """
+        if self.budget <= 0 or interval < self.period - self.budget:
+            return 0.0
+        periods = math.floor((interval - (self.period - self.budget)) / self.period)
+        partial = min(max(interval - self.delay - periods * self.period, 0.0), self.budget)
+        return float(periods * self.budget + partial)
+
+    def sbf_vec(self, intervals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized sbf: supply for every interval of an array in one call.
+        """
+        import numpy as np
+        intervals = np.asarray(intervals, dtype=float)
+        if self.budget <= 0:
+            return np.zeros_like(intervals)
+        blackout = self.period - self.budget
+        periods = np.floor(np.maximum(intervals - blackout, 0.0) / self.period)
+        partial = np.clip(intervals - self.delay - periods * self.period, 0.0, self.budget)
+        return np.where(intervals < blackout, 0.0, periods * self.budget + partial)
+
+    def sbf_inverse(self, demand: float) -> float:
+        """
+        Smallest interval whose supply covers the demand: k = ⌈demand/Q⌉ − 1 full periods
+        plus the remainder on the next rising edge,
+          sbf_inverse(demand) = 0,                                  if demand <= 0
+                                2(P − Q) + k·P + (demand − k·Q),   otherwise
+        """
+        if demand <= 0:
+            return 0.0
+        if self.budget <= 0:
+            return math.inf
+        periods = math.ceil(demand / self.budget) - 1
+        return self.delay + periods * self.period + (demand - periods * self.budget)
+
+    def sbf_inverse_vec(self, demands: np.ndarray) -> np.ndarray:
+        """
+        Vectorized sbf_inverse: smallest covering interval for every demand of an array.
+        """
+        import numpy as np
+        demands = np.asarray(demands, dtype=float)
+        if self.budget <= 0:
+            return np.where(demands <= 0, 0.0, math.inf)
+        periods = np.ceil(demands / self.budget) - 1
+        return np.where(demands <= 0, 0.0,
+                        self.delay + periods * self.period + (demands - periods * self.budget))
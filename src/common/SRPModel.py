@@ -1,8 +1,237 @@
+from __future__ import annotations
+
+import math
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from common.job import Job
+from common.ready_queue import ReadyQueue
+from common.scheduler import Scheduler
+from common.system_model import SystemModel
+from common.task import Task
+
+if TYPE_CHECKING:
+    import numpy as np
 
 @dataclass
+class ResourceAccess:
+    """
+    Critical section of a task: every job of the task holds `resource_id` from `start`
+    to `end` time units into its execution (Si and Ei, at nominal speed like the WCET).
+    """
+    task_id: str
+    resource_id: str
+    start: float
+    end: float
+
 class SRPModel:
-    # Start Index (Si) and End Index (Ei) for resource access
-    resource_access: list[tuple[int, int]]
-    period: int 
-    
\ No newline at end of file
+    """
+    Stack Resource Policy (Baker) for the local resources of one component.
+
+    Preemption levels are keys where a lower key is a higher level, in the order of the
+    component's scheduler: the relative deadline (period) under EDF, the priority under
+    RM. The ceiling of a resource is the lowest key among the tasks that use it. Levels,
+    ceilings and critical sections are computed once, when the model is built.
+
+    At run time the model keeps two stacks:
+      • the ceiling stack, one entry per held resource carrying the system ceiling (the
+        lowest ceiling) of the stack up to that entry, so the current system ceiling is
+        read from the top in O(1);
+      • the stack of started, unfinished jobs; each job on it preempted the one below.
+    The highest-priority pending job runs if it has already started or if its key is
+    below the system ceiling; otherwise the top started job runs. Once started, a job
+    never blocks.
+
+    Critical sections are speed-adjusted like WCETs. The simulators advance in whole
+    time units (ticks): a section is acquired at the start of the tick in which it
+    begins and released at the end of the tick in which it ends.
+
+    Attributes:
+        scheduler (Scheduler): Local scheduler of the component
+        levels (dict[str, float]): Task id -> preemption level key
+        ceilings (dict[str, float]): Resource id -> ceiling key
+        sections (dict[str, list[tuple[float, float, str]]]): Task id -> (start, end, resource id), by start
+    """
+    __slots__ = ("scheduler", "levels", "ceilings", "sections", "_ceiling_stack", "_started",
+                 "_executed", "_next_section")
+
+    def __init__(self, scheduler: Scheduler, tasks: list[Task], accesses: list[ResourceAccess],
+                 speed_factor: float = 1.0):
+        self.scheduler = scheduler
+        self.levels: dict[str, float] = {task.id: self.level_of(task, scheduler) for task in tasks}
+
+        self.sections: dict[str, list[tuple[float, float, str]]] = {}
+        for access in accesses:
+            self.sections.setdefault(access.task_id, []).append(
+                (access.start / speed_factor, access.end / speed_factor, access.resource_id))
+        self.ceilings: dict[str, float] = {}
+        for task_id, sections in self.sections.items():
+            sections.sort()
+            for _, _, resource_id in sections:
+                self.ceilings[resource_id] = min(self.ceilings.get(resource_id, math.inf), self.levels[task_id])
+
+        self._ceiling_stack: list[tuple[float, float, Job, float]] = []  # (ceiling, system ceiling, holder, end)
+        self._started: list[Job] = []
+        self._executed: dict[Job, int] = {}  # Ticks executed by each started job
+        self._next_section: dict[Job, int] = {}  # Index of each started job's next section to acquire
+
+    @staticmethod
+    def level_of(task: Task, scheduler: Scheduler) -> float:
+        if scheduler == Scheduler.EDF:
+            return task.period
+        return task.priority if task.priority is not None else math.inf
+
+    @property
+    def system_ceiling(self) -> float:
+        return self._ceiling_stack[-1][1] if self._ceiling_stack else math.inf
+
+    def job_to_run(self, queue: ReadyQueue) -> Job:
+        """The job of the component that runs next (see the class description)."""
+        job = queue.peek()
+        if job.start_time >= 0 or self.levels[job.task_id] < self.system_ceiling or not self._started:
+            return job
+        return self._started[-1]
+
+    def dispatch(self, job: Job):
+        """
+        The job runs from now on: put it on the started stack and acquire the sections
+        that begin within its next tick.
+        """
+        if not self._started or self._started[-1] is not job:
+            self._started.append(job)
+        sections = self.sections.get(job.task_id)
+        if not sections:
+            return
+        executed = self._executed.get(job, 0)
+        idx = self._next_section.get(job, 0)
+        while idx < len(sections) and sections[idx][0] < executed + 1:
+            _, end, resource_id = sections[idx]
+            ceiling = self.ceilings[resource_id]
+            self._ceiling_stack.append((ceiling, min(ceiling, self.system_ceiling), job, end))
+            idx += 1
+        self._next_section[job] = idx
+
+    def advance(self, job: Job, ticks: int):
+        """Charge executed ticks to the job and release the sections that have ended."""
+        executed = self._executed[job] = self._executed.get(job, 0) + ticks
+        if any(holder is job and end <= executed for _, _, holder, end in self._ceiling_stack):
+            self._release(lambda holder, end: holder is job and end <= executed)
+
+    def ticks_to_next_change(self, job: Job) -> float:
+        """
+        Ticks the job can run before it acquires or releases a section, i.e. before the
+        system ceiling changes; inf if it never does again.
+        """
+        executed = self._executed.get(job, 0)
+        ticks = math.inf
+        sections = self.sections.get(job.task_id)
+        idx = self._next_section.get(job, 0)
+        if sections and idx < len(sections):
+            ticks = math.floor(sections[idx][0] - executed)
+        for _, _, holder, end in self._ceiling_stack:
+            if holder is job:
+                ticks = min(ticks, math.ceil(end - executed))
+        return ticks
+
+    def finish(self, job: Job):
+        """The job completed or was dropped: forget it and release everything it holds."""
+        if job in self._started:
+            self._started.remove(job)
+        self._executed.pop(job, None)
+        self._next_section.pop(job, None)
+        if any(holder is job for _, _, holder, _ in self._ceiling_stack):
+            self._release(lambda holder, end: holder is job)
+
+    def clear(self):
+        self._ceiling_stack.clear()
+        self._started.clear()
+        self._executed.clear()
+        self._next_section.clear()
+
+    def _release(self, released):
+        # Sections need not nest, so entries may leave from the middle of the stack;
+        # the system ceilings above them are recomputed (the stack is a few entries deep)
+        stack, self._ceiling_stack = self._ceiling_stack, []
+        for ceiling, _, holder, end in stack:
+            if not released(holder, end):
+                self._ceiling_stack.append((ceiling, min(ceiling, self.system_ceiling), holder, end))
+
+    def _section_table(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(level of the task, ceiling of the resource, length) of every critical section."""
+        import numpy as np
+        rows = [(self.levels[task_id], self.ceilings[resource_id], end - start)
+                for task_id, sections in self.sections.items() for start, end, resource_id in sections]
+        if not rows:
+            return np.empty(0), np.empty(0), np.empty(0)
+        return tuple(np.array(column, dtype=float) for column in zip(*rows))
+
+    def rm_blocking(self, task_ids: list[str]) -> np.ndarray:
+        """
+        Blocking term of every task under RM:
+          B_i = max { length of a section of τ_j on r : level_j > level_i, ceiling(r) ≤ level_i }
+        (keys: a lower key is a higher level).
+        """
+        import numpy as np
+        levels, ceilings, lengths = self._section_table()
+        keys = np.array([self.levels[task_id] for task_id in task_ids], dtype=float)
+        if lengths.size == 0:
+            return np.zeros(keys.size)
+        mask = (levels[None, :] > keys[:, None]) & (ceilings[None, :] <= keys[:, None])
+        return np.max(np.where(mask, lengths[None, :], 0.0), axis=1)
+
+    def edf_blocking(self, intervals: np.ndarray) -> np.ndarray:
+        """
+        Blocking function of the component under EDF (Baruah), for every interval t:
+          B(t) = max { length of a section of τ_j on r : T_j > t, ceiling(r) ≤ t }
+        i.e. the longest section of a task with a later relative deadline on a resource
+        also used by a task whose deadline falls within t.
+        """
+        import numpy as np
+        intervals = np.asarray(intervals, dtype=float)
+        levels, ceilings, lengths = self._section_table()
+        if lengths.size == 0:
+            return np.zeros(intervals.size)
+        mask = (ceilings[None, :] <= intervals[:, None]) & (intervals[:, None] < levels[None, :])
+        return np.max(np.where(mask, lengths[None, :], 0.0), axis=1)
+
+def accesses_by_component(model: SystemModel, accesses: list[ResourceAccess]) -> dict[str, list[ResourceAccess]]:
+    """
+    Group the resource accesses by the component of their task.
+
+    Raises:
+        ValueError: If an access names an unknown task or an empty section, or if a
+            resource is used by tasks of different components (only local resources
+            are supported)
+    """
+    task_by_id = {task.id: task for task in model.tasks}
+    owner: dict[str, str] = {}
+    grouped: dict[str, list[ResourceAccess]] = {}
+    for access in accesses:
+        task = task_by_id.get(access.task_id)
+        if task is None:
+            raise ValueError(f"Resource access of unknown task {access.task_id}")
+        if not 0 <= access.start < access.end:
+            raise ValueError(f"Empty or negative critical section of task {access.task_id} "
+                             f"on {access.resource_id}: [{access.start}, {access.end}]")
+        component_id = owner.setdefault(access.resource_id, task.component_id)
+        if component_id != task.component_id:
+            raise ValueError(f"Resource {access.resource_id} is shared by components {component_id} and "
+                             f"{task.component_id}; only component-local resources are supported")
+        grouped.setdefault(task.component_id, []).append(access)
+    return grouped
+
+def srp_models(model: SystemModel, accesses: list[ResourceAccess]) -> dict[str, SRPModel]:
+    """
+    Build the SRP model of every component whose tasks access resources, with the
+    sections scaled by the speed of the component's core.
+
+    Raises:
+        ValueError: See accesses_by_component
+    """
+    models = {}
+    for component_id, component_accesses in accesses_by_component(model, accesses).items():
+        component = model.component_by_id[component_id]
+        core = model.core_of(component)
+        models[component_id] = SRPModel(component.scheduler, model.tasks_by_component[component_id],
+                                        component_accesses, core.speed_factor if core is not None else 1.0)
+    return models
@@ -1,3 +1,4 @@
+from common.ready_queue import ReadyQueue
 from common.scheduler import Scheduler
 
 class Component:
@@ -14,7 +15,10 @@ class Component:
         priority (int | None): How important this component is compared to others
                               (used for RM scheduling, None for EDF)
                               Lower number means higher priority
+        jobs_queue (ReadyQueue): Pending jobs of the component, ordered by its scheduler
     """
+    __slots__ = ("id", "scheduler", "budget", "period", "core_id", "priority", "remaining_budget", "jobs_queue")
+
     def __init__(self, component_id: str, scheduler: Scheduler, budget: int, 
                  period: int, core_id: int, priority: int | None):
         self.id = component_id
@@ -24,4 +28,4 @@ class Component:
         self.core_id = core_id
         self.priority = priority
         self.remaining_budget = budget
-        self.jobs_queue = []
+        self.jobs_queue = ReadyQueue(scheduler)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from common.scheduler import Scheduler
 
-@dataclass
+@dataclass(slots=True)
 class Core:
     """
     A class representing a processing core architecture with its properties and scheduling capabilities.
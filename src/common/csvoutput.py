@@ -10,6 +10,9 @@ class TaskResult:
     avg_response_time: float
     max_response_time: float
     component_schedulable: bool
+    p50_response_time: float = 0.0
+    p99_response_time: float = 0.0
+    p999_response_time: float = 0.0
 
 class CSVOutput:
     def __init__(self, filename: str):
@@ -20,7 +23,10 @@ class CSVOutput:
             'task_schedulable',
             'avg_response_time',
             'max_response_time',
-            'component_schedulable'
+            'component_schedulable',
+            'p50_response_time',
+            'p99_response_time',
+            'p999_response_time'
         ]
         self.results: List[TaskResult] = []
 
@@ -45,7 +51,10 @@ class CSVOutput:
                     'task_schedulable': 1 if result.task_schedulable else 0,
                     'avg_response_time': result.avg_response_time,
                     'max_response_time': result.max_response_time,
-                    'component_schedulable': 1 if result.component_schedulable else 0
+                    'component_schedulable': 1 if result.component_schedulable else 0,
+                    'p50_response_time': result.p50_response_time,
+                    'p99_response_time': result.p99_response_time,
+                    'p999_response_time': result.p999_response_time
                 })
 
     def clear_results(self) -> None:
@@ -1,17 +1,23 @@
-import pandas as pd
+import csv as _csv
+import itertools
 import os
 import sys
+from typing import Iterator
 
 from common.core import Core
 from common.component import Component
+from common.SRPModel import ResourceAccess
 from common.task import Task
 from common.scheduler import Scheduler
 from common.utils import get_project_root
 
+# Number of task rows materialised at a time by iter_tasks
+TASK_CHUNK_SIZE = 100_000
+
 def read_cores(csv:str) -> list[Core]:
     """
     Reads the architecture information from a CSV file and returns a list of Architecture objects.
-    
+
     Args:
         csv (str): Path to the CSV file. Can be either an absolute path or a relative path from the project root.
 
@@ -20,13 +26,11 @@ def read_cores(csv:str) -> list[Core]:
     """
     csv = _get_csv_path(csv)
 
-    df = pd.read_csv(csv)
-
     architectures = []
-    for _, row in df.iterrows():
+    for row in _iter_rows(csv):
         architecture = Core(
             id=row['core_id'],
-            speed_factor=row['speed_factor'],
+            speed_factor=float(row['speed_factor']),
             scheduler=Scheduler[row['scheduler']]
         )
         architectures.append(architecture)
@@ -36,39 +40,87 @@ def read_cores(csv:str) -> list[Core]:
 def read_budgets(csv:str) -> list[Component]:
     csv = _get_csv_path(csv)
 
-    df = pd.read_csv(csv)
-
     budgets = []
-    for _,row in df.iterrows():
+    for row in _iter_rows(csv):
         budget = Component(
             component_id=row['component_id'],
             scheduler=Scheduler[row['scheduler']],
-            budget=row['budget'],
-            period=row['period'],
+            budget=_parse_number(row['budget']),
+            period=_parse_number(row['period']),
             core_id=row['core_id'],
-            priority=row['priority']
+            priority=_parse_priority(row.get('priority'))
         )
         budgets.append(budget)
 
     return budgets
 
 def read_tasks(csv:str) -> list[Task]:
-    csv = _get_csv_path(csv)
+    tasks = []
+    for chunk in iter_tasks(csv):
+        tasks.extend(chunk)
+    return tasks
 
-    df = pd.read_csv(csv)
+def iter_tasks(csv:str, chunk_size:int = TASK_CHUNK_SIZE) -> Iterator[list[Task]]:
+    """
+    Streams the tasks of a CSV file in chunks of at most chunk_size tasks, so task
+    files with millions of rows can be processed in bounded memory.
 
-    tasks = []
-    for _,row in df.iterrows():
-        task = Task(
+    Args:
+        csv (str): Path to the CSV file. Can be either an absolute path or a relative path from the project root.
+        chunk_size (int): Maximum number of tasks per chunk
+
+    Yields:
+        list[Task]: The next chunk of tasks, in file order
+    """
+    csv = _get_csv_path(csv)
+
+    rows = _iter_rows(csv)
+    while chunk := [
+        Task(
             task_name=row['task_name'],
-            wcet=row['wcet'],
-            period=row['period'],
+            wcet=_parse_number(row['wcet']),
+            period=_parse_number(row['period']),
             component_id=row['component_id'],
-            priority=row['priority']
+            priority=_parse_priority(row.get('priority'))
         )
-        tasks.append(task)
+        for row in itertools.islice(rows, chunk_size)
+    ]:
+        yield chunk
 
-    return tasks
+def read_resources(csv:str) -> list[ResourceAccess]:
+    """
+    Reads the critical sections of the tasks (columns task_name, resource_id, start, end):
+    each job of the task holds the resource from `start` to `end` time units into its
+    execution, at nominal speed.
+    """
+    csv = _get_csv_path(csv)
+
+    return [
+        ResourceAccess(
+            task_id=row['task_name'],
+            resource_id=row['resource_id'],
+            start=_parse_number(row['start']),
+            end=_parse_number(row['end'])
+        )
+        for row in _iter_rows(csv)
+    ]
+
+def _iter_rows(csv:str) -> Iterator[dict[str, str]]:
+    with open(csv, newline='') as f:
+        yield from _csv.DictReader(f)
+
+def _parse_number(value:str) -> int | float:
+    # Integral columns stay ints so periods and budgets keep exact arithmetic
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+def _parse_priority(value:str | None) -> int | None:
+    # Empty or missing priorities (EDF components and tasks) become None
+    if value is None or value.strip() == '':
+        return None
+    return int(float(value))
 
 def _get_csv_path(csv:str) -> str:
     if os.path.exists(csv):
@@ -77,28 +129,34 @@ def _get_csv_path(csv:str) -> str:
     csv = os.path.join(get_project_root(),csv)
     if os.path.exists(csv):
         return csv
-    
+
     raise FileNotFoundError(
         f"File {csv} does not exist. "
         "Pass to the function an absolute path or a relative path from the project root. "
         "For example 'data/testcases/1-tiny-test-case/architecture.csv", csv
     )
 
-def read_csv() -> tuple[list[Core], list[Component], list[Task]]:
-    if len(sys.argv) != 4:
-        script_name = os.path.basename(sys.argv[0])
-        print(f"Usage: python {script_name} <architecture.csv> <budget.csv> <tasks.csv>")
-        sys.exit(1)
+def read_csv(architecture_file: str | None = None, budget_file: str | None = None,
+             tasks_file: str | None = None) -> tuple[list[Core], list[Component], list[Task]]:
+    """
+    Reads the three input files of a system. When no paths are given they are taken
+    from the command line (sys.argv[1:4]).
+    """
+    if architecture_file is None or budget_file is None or tasks_file is None:
+        if len(sys.argv) != 4:
+            script_name = os.path.basename(sys.argv[0])
+            print(f"Usage: python {script_name} <architecture.csv> <budget.csv> <tasks.csv>")
+            sys.exit(1)
 
-    architecture_file = sys.argv[1]
-    budget_file = sys.argv[2]
-    tasks_file = sys.argv[3]
+        architecture_file = sys.argv[1]
+        budget_file = sys.argv[2]
+        tasks_file = sys.argv[3]
 
     try:
         architectures = read_cores(architecture_file)
         budgets = read_budgets(budget_file)
         tasks = read_tasks(tasks_file)
-        
+
     except FileNotFoundError as e:
         print(f"Error: File not found - {e}")
         sys.exit(1)
@@ -106,4 +164,4 @@ def read_csv() -> tuple[list[Core], list[Component], list[Task]]:
         print(f"Error processing files: {e}")
         sys.exit(1)
 
-    return architectures, budgets, tasks
\ No newline at end of file
+    return architectures, budgets, tasks
@@ -0,0 +1,162 @@
+import math
+from dataclasses import dataclass, field
+
+from common.system_model import SystemModel
+
+# Largest hyperperiod (in time units) simulated without an explicit opt-in
+MAX_SIMULATION_HORIZON = 10**8
+# Rough costs of the simulator engines, measured on the custom test cases. The tick engine
+# scans every task, component and core each tick; the event engine pays per event.
+SECONDS_PER_EVENT = 2.5e-6
+SECONDS_PER_TICK_ENTITY = 2e-7
+
+@dataclass
+class CoreHorizon:
+    """
+    Horizon of a single core.
+
+    Attributes:
+        core_id (str): The core
+        hyperperiod (int): LCM of the task periods and component periods on the core
+        releases (int): Job releases per core hyperperiod
+        replenishments (int): Budget replenishments per core hyperperiod
+    """
+    core_id: str
+    hyperperiod: int
+    releases: int
+    replenishments: int
+
+    @property
+    def events(self) -> int:
+        # Every job is released and completes; every replenishment can be followed by an exhaustion
+        return 2 * self.releases + 2 * self.replenishments
+
+@dataclass
+class HorizonPlan:
+    """
+    Simulation horizon of a system and the estimated cost of simulating it.
+
+    Attributes:
+        hyperperiod (int): System hyperperiod, including the component (budget) periods
+        cores (list[CoreHorizon]): Per-core hyperperiods and event counts
+        iterations (int): Number of hyperperiods the estimates are for
+        events (int): Estimated scheduling events over all iterations (event engine)
+        ticks (int): Clock ticks over all iterations (tick engine)
+        event_seconds (float): Estimated runtime of the event engine
+        tick_seconds (float): Estimated runtime of the tick engine
+        max_horizon (int): Largest acceptable hyperperiod
+        truncated_horizon (int | None): Bounded horizon to use instead, if the hyperperiod is too long
+        coverage (float): Fraction of the hyperperiod covered by the truncated horizon (1.0 if not truncated)
+        min_releases (dict[str, int]): Releases of each task within the (possibly truncated) horizon
+        harmonized_periods (dict[str, int]): Suggested harmonic periods of tasks and components
+        harmonized_hyperperiod (int): Hyperperiod with the suggested periods
+    """
+    hyperperiod: int
+    cores: list[CoreHorizon]
+    iterations: int
+    events: int
+    ticks: int
+    event_seconds: float
+    tick_seconds: float
+    max_horizon: int
+    truncated_horizon: int | None
+    coverage: float
+    min_releases: dict[str, int] = field(default_factory=dict)
+    harmonized_periods: dict[str, int] = field(default_factory=dict)
+    harmonized_hyperperiod: int = 0
+
+    @property
+    def feasible(self) -> bool:
+        return self.hyperperiod <= self.max_horizon
+
+    def describe(self) -> str:
+        """Human-readable summary of the plan."""
+        lines = [
+            f"Hyperperiod: {self.hyperperiod} (limit {self.max_horizon})",
+            *(f"- Core {core.core_id}: hyperperiod {core.hyperperiod}, {core.releases} releases, "
+              f"{core.replenishments} replenishments" for core in self.cores),
+            f"Estimated for {self.iterations} iterations: {self.events} events "
+            f"(~{self.event_seconds:.1f} s event engine), {self.ticks} ticks (~{self.tick_seconds:.1f} s tick engine)",
+        ]
+        if not self.feasible:
+            fewest = min(self.min_releases.values(), default=0)
+            lines += [
+                f"Truncated horizon: {self.truncated_horizon} covers {self.coverage:.2e} of the hyperperiod; "
+                f"every task is released at least {fewest} times",
+                f"Harmonized periods would give a hyperperiod of {self.harmonized_hyperperiod}: "
+                + ", ".join(f"{item_id}={period}" for item_id, period in self.harmonized_periods.items()),
+            ]
+        return "\n".join(lines)
+
+def plan_horizon(model: SystemModel, iterations: int = 1, max_horizon: int = MAX_SIMULATION_HORIZON) -> HorizonPlan:
+    """
+    Compute the exact hyperperiods of a system and estimate the cost of simulating it,
+    without simulating anything. Only integer arithmetic on the periods is used, so huge
+    hyperperiods are reported rather than overflowing.
+
+    When the hyperperiod exceeds max_horizon, the plan also proposes bounded alternatives:
+    a truncated horizon (with the fraction of the hyperperiod it covers and how many
+    releases of each task it contains) and harmonic periods that bound the hyperperiod.
+
+    Args:
+        model: The system
+        iterations: Number of hyperperiods to estimate the cost for
+        max_horizon: Largest acceptable hyperperiod
+
+    Returns:
+        HorizonPlan: The plan
+    """
+    hyperperiod = model.hyperperiod()
+    cores = []
+    for core_id, components in model.components_by_core.items():
+        if not components:
+            continue
+        core_hyperperiod = model.core_hyperperiod(core_id)
+        tasks = [task for component in components for task in model.tasks_by_component[component.id]]
+        cores.append(CoreHorizon(
+            core_id=core_id,
+            hyperperiod=core_hyperperiod,
+            releases=sum(core_hyperperiod // int(task.period) for task in tasks),
+            replenishments=sum(core_hyperperiod // int(component.period) for component in components),
+        ))
+
+    # The whole system runs for the global hyperperiod, so scale the per-core counts up to it
+    events = iterations * sum(core.events * (hyperperiod // core.hyperperiod) for core in cores)
+    ticks = iterations * hyperperiod
+    entities = len(model.tasks) + len(model.components) + len(model.cores)
+
+    horizon = min(hyperperiod, max_horizon)
+    plan = HorizonPlan(
+        hyperperiod=hyperperiod,
+        cores=cores,
+        iterations=iterations,
+        events=events,
+        ticks=ticks,
+        event_seconds=events * SECONDS_PER_EVENT,
+        tick_seconds=ticks * entities * SECONDS_PER_TICK_ENTITY,
+        max_horizon=max_horizon,
+        truncated_horizon=None if hyperperiod <= max_horizon else horizon,
+        coverage=horizon / hyperperiod,
+        min_releases={task.id: horizon // int(task.period) for task in model.tasks},
+    )
+    if not plan.feasible:
+        plan.harmonized_periods = harmonize_periods(model)
+        plan.harmonized_hyperperiod = math.lcm(*plan.harmonized_periods.values())
+    return plan
+
+def harmonize_periods(model: SystemModel) -> dict[str, int]:
+    """
+    Suggest harmonic periods: every task and component period is rounded down to
+    base·2^k, where base is the smallest period in the system. Rounding down only makes
+    the system more demanding (tasks) or better supplied (components), and the hyperperiod
+    of the result is simply the largest suggested period.
+
+    Returns:
+        dict[str, int]: Suggested period for each task id and component id
+    """
+    periods = {task.id: int(task.period) for task in model.tasks}
+    periods.update({component.id: int(component.period) for component in model.components})
+    if not periods:
+        return {}
+    base = min(periods.values())
+    return {item_id: base << ((period // base).bit_length() - 1) for item_id, period in periods.items()}
@@ -1,6 +1,8 @@
 class Job:
+    __slots__ = ("task_id", "priority", "release_time", "execution_time", "remaining_time",
+                 "absolute_deadline", "start_time")
+
     def __init__(self, task, release_time: int, execution_time: float):
-        self.id = f"{task.id}_{release_time}"
         self.task_id = task.id
         self.priority = task.priority
         self.release_time: int = release_time
@@ -9,6 +11,11 @@ class Job:
         self.absolute_deadline: int = release_time + task.period + self.execution_time * 0.0001 # Tie-breaker
         self.start_time: int = -1
 
+    @property
+    def id(self) -> str:
+        # Built on demand: a job is created for every release and the id is rarely needed
+        return f"{self.task_id}_{self.release_time}"
+
     # Make it sortable for priority queues if needed (e.g., for EDF)
     def __lt__(self, other):
         # Example for EDF: earlier deadline is higher priority
@@ -16,8 +23,8 @@ class Job:
             return self.absolute_deadline < other.absolute_deadline
         # Tie-breaking (e.g., by original task priority if RM, or by release time)
         # For pure EDF, could be arbitrary or based on task ID for determinism
-        return self.task_template.priority < other.task_template.priority # Assuming lower prio number is higher
+        return self.priority < other.priority # Assuming lower prio number is higher
 
     def __repr__(self):
-        return (f"Job(id={self.id}, task={self.task_template.id}, release={self.release_time}, "
-                f"deadline={self.absolute_deadline}, rem={self.remaining_time:.2f})")
\ No newline at end of file
+        return (f"Job(id={self.id}, task={self.task_id}, release={self.release_time}, "
+                f"deadline={self.absolute_deadline}, rem={self.remaining_time:.2f})")
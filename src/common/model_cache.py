@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING
+
+from common.component import Component
+from common.core import Core
+from common.csvreader import _get_csv_path, iter_tasks, read_budgets, read_cores
+from common.scheduler import Scheduler
+from common.system_model import SystemModel
+from common.task import Task
+from common.utils import get_project_root
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Bump when the on-disk layout changes so old entries are ignored
+CACHE_FORMAT_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(get_project_root(), ".cache", "models")
+
+class CachedSystem:
+    """
+    A system loaded through the model cache. Task WCETs are already scaled by the speed
+    factor of their core.
+
+    On a cache hit the columns are read-only memory maps of the entry's .npy files, and
+    the cores, components and tasks are only built from them on first access, so nothing
+    is copied out of the maps until a model object is needed.
+
+    Attributes:
+        columns (dict[str, np.ndarray]): Column name -> values, one entry per object in input order
+        hyperperiod (int): System hyperperiod (SystemModel.hyperperiod)
+        key (str): Content hash of the three input files
+        hit (bool): True if the system was loaded from the cache
+        cores (list[Core]): Cores, in input order
+        components (list[Component]): Components, in input order
+        tasks (list[Task]): Tasks with speed-adjusted WCETs, in input order
+    """
+    def __init__(self, columns: dict[str, np.ndarray], hyperperiod: int, key: str, hit: bool,
+                 cores: list[Core] | None = None, components: list[Component] | None = None,
+                 tasks: list[Task] | None = None):
+        self.columns = columns
+        self.hyperperiod = hyperperiod
+        self.key = key
+        self.hit = hit
+        self._cores = cores
+        self._components = components
+        self._tasks = tasks
+
+    @property
+    def cores(self) -> list[Core]:
+        if self._cores is None:
+            self._cores = [
+                Core(id=core_id, speed_factor=speed_factor, scheduler=Scheduler[scheduler])
+                for core_id, speed_factor, scheduler in zip(
+                    *self._lists("core_id", "core_speed_factor", "core_scheduler"))
+            ]
+        return self._cores
+
+    @property
+    def components(self) -> list[Component]:
+        if self._components is None:
+            self._components = [
+                Component(component_id=component_id, scheduler=Scheduler[scheduler], budget=budget,
+                          period=period, core_id=core_id, priority=_decode_priority(priority))
+                for component_id, scheduler, budget, period, core_id, priority in zip(
+                    *self._lists("component_id", "component_scheduler", "component_budget",
+                                 "component_period", "component_core_id", "component_priority"))
+            ]
+        return self._components
+
+    @property
+    def tasks(self) -> list[Task]:
+        if self._tasks is None:
+            self._tasks = [
+                Task(task_name=task_id, wcet=wcet, period=period, component_id=component_id,
+                     priority=_decode_priority(priority))
+                for task_id, wcet, period, component_id, priority in zip(
+                    *self._lists("task_id", "task_wcet", "task_period", "task_component_id", "task_priority"))
+            ]
+        return self._tasks
+
+    def _lists(self, *names: str) -> list[list]:
+        return [self.columns[name].tolist() for name in names]
+
+def cache_key(architecture_file: str, budget_file: str, tasks_file: str) -> str:
+    """SHA-256 over the contents of the three input files and the cache format version."""
+    digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}".encode())
+    for path in (architecture_file, budget_file, tasks_file):
+        digest.update(b"\0")
+        with open(_get_csv_path(path), "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+def load_system(architecture_file: str, budget_file: str, tasks_file: str,
+                cache_dir: str = DEFAULT_CACHE_DIR) -> CachedSystem:
+    """
+    Load a system through the on-disk cache.
+
+    Each entry is a directory named after the content hash of the inputs, holding one
+    uncompressed .npy file per column plus a small JSON header. Columns are opened with
+    memory mapping, so a cache hit skips CSV parsing, WCET adjustment and the hyperperiod
+    computation, and model objects are only built when first used (see CachedSystem).
+    Editing any input file changes the hash, so stale entries are never used.
+
+    On a miss the task file is streamed with iter_tasks: each chunk is speed-adjusted and
+    packed into the task columns before the next one is parsed, so only one chunk of Task
+    objects is alive at a time.
+
+    Args:
+        architecture_file, budget_file, tasks_file: Paths of the input CSV files
+        cache_dir: Directory holding the cache entries
+
+    Returns:
+        CachedSystem: The normalized system
+    """
+    import numpy as np
+    key = cache_key(architecture_file, budget_file, tasks_file)
+    entry = os.path.join(cache_dir, key)
+    if os.path.exists(os.path.join(entry, "header.json")):
+        return _read_entry(entry, key)
+
+    cores = read_cores(architecture_file)
+    components = read_budgets(budget_file)
+    model = SystemModel(cores, components, [])
+    # Per-component LCM of the replenishment and task periods, as in SystemModel.hyperperiod
+    component_hyperperiods = {component.id: int(component.period) for component in components}
+    chunks = {name: [] for name in ("task_id", "task_wcet", "task_period", "task_component_id", "task_priority")}
+    for tasks in iter_tasks(tasks_file):
+        for task in tasks:
+            task.wcet = task.wcet / model.core_of(model.component_of(task)).speed_factor
+            component_hyperperiods[task.component_id] = math.lcm(component_hyperperiods[task.component_id],
+                                                                 int(task.period))
+        chunks["task_id"].append(_to_array([task.id for task in tasks]))
+        chunks["task_wcet"].append(_to_array([task.wcet for task in tasks]))
+        chunks["task_period"].append(_to_array([task.period for task in tasks]))
+        chunks["task_component_id"].append(_to_array([task.component_id for task in tasks]))
+        chunks["task_priority"].append(_to_array([_encode_priority(task.priority) for task in tasks]))
+
+    columns = {
+        "core_id": [core.id for core in cores],
+        "core_speed_factor": [core.speed_factor for core in cores],
+        "core_scheduler": [core.scheduler.name for core in cores],
+        "component_id": [component.id for component in components],
+        "component_scheduler": [component.scheduler.name for component in components],
+        "component_budget": [component.budget for component in components],
+        "component_period": [component.period for component in components],
+        "component_core_id": [component.core_id for component in components],
+        "component_priority": [_encode_priority(component.priority) for component in components],
+    }
+    columns = {name: _to_array(values) for name, values in columns.items()}
+    for name, arrays in chunks.items():
+        columns[name] = np.concatenate(arrays) if arrays else _to_array([])
+    system = CachedSystem(columns, math.lcm(*component_hyperperiods.values()), key, hit=False,
+                          cores=cores, components=components)
+    _write_entry(entry, system)
+    return system
+
+def _write_entry(entry: str, system: CachedSystem):
+    import numpy as np
+
+    # Write into a temporary directory and rename it, so readers never see a partial entry
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    staging = tempfile.mkdtemp(dir=os.path.dirname(entry))
+    try:
+        for name, values in system.columns.items():
+            np.save(os.path.join(staging, f"{name}.npy"), values)
+        with open(os.path.join(staging, "header.json"), "w") as f:
+            json.dump({"version": CACHE_FORMAT_VERSION, "hyperperiod": system.hyperperiod}, f)
+        os.replace(staging, entry)
+    except OSError:
+        # Another process stored the same entry first
+        shutil.rmtree(staging, ignore_errors=True)
+
+def _read_entry(entry: str, key: str) -> CachedSystem:
+    import numpy as np
+    with open(os.path.join(entry, "header.json")) as f:
+        header = json.load(f)
+    columns = {
+        name[:-len(".npy")]: np.load(os.path.join(entry, name), mmap_mode="r")
+        for name in os.listdir(entry) if name.endswith(".npy")
+    }
+    return CachedSystem(columns, header["hyperperiod"], key, hit=True)
+
+def _to_array(values: list) -> np.ndarray:
+    import numpy as np
+    if values and all(isinstance(value, str) for value in values):
+        return np.array(values, dtype=str)
+    if all(isinstance(value, int) for value in values):
+        return np.array(values, dtype=np.int64)
+    return np.array(values, dtype=np.float64)
+
+# Missing priorities are stored as -1 so the column stays integral
+def _encode_priority(priority: int | None) -> int:
+    return -1 if priority is None else int(priority)
+
+def _decode_priority(priority: int) -> int | None:
+    return None if priority < 0 else priority
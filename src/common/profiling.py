@@ -0,0 +1,102 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+
+class Profiler:
+    """
+    Counters, timers and high-water marks collected during a simulation or analysis run.
+
+    Instrumented code holds an optional profiler and guards every call with
+    `if profiler is not None`, so a disabled profiler costs one comparison per call site.
+    Phases of a loop are timed with `mark`/`lap`: `lap(name)` charges the time since the
+    previous mark or lap to `name`, so consecutive phases need a single clock read each.
+
+    Attributes:
+        counters (dict[str, int]): Event counts
+        timers (dict[str, list]): name -> [total seconds, number of timed intervals]
+        high_water (dict[str, int]): Largest value observed for each gauge
+    """
+    def __init__(self):
+        self.counters: dict[str, int] = {}
+        self.timers: dict[str, list] = {}
+        self.high_water: dict[str, int] = {}
+        self._last = time.perf_counter()
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_time(self, name: str, seconds: float):
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [seconds, 1]
+        else:
+            timer[0] += seconds
+            timer[1] += 1
+
+    def mark(self):
+        """Start timing the next phase."""
+        self._last = time.perf_counter()
+
+    def lap(self, name: str):
+        """Charge the time since the last mark or lap to a timer."""
+        now = time.perf_counter()
+        self.add_time(name, now - self._last)
+        self._last = now
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def observe(self, name: str, value: int):
+        """Update the high-water mark of a gauge."""
+        if value > self.high_water.get(name, -1):
+            self.high_water[name] = value
+
+    def report(self) -> dict:
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "timers": {name: {"seconds": seconds, "calls": calls}
+                       for name, (seconds, calls) in sorted(self.timers.items())},
+            "high_water": dict(sorted(self.high_water.items())),
+        }
+
+    def write_json(self, filename: str):
+        with open(filename, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+class ProgressReporter:
+    """
+    Throttled console progress: `update` prints at most once every `interval` seconds,
+    however often it is called.
+    """
+    def __init__(self, interval: float = 1.0, stream: TextIO | None = None):
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stdout
+        self.total = 0
+        self.label = ""
+        self._started = 0.0
+        self._next_report = 0.0
+
+    def start(self, total: int, label: str = "Progress"):
+        self.total = total
+        self.label = label
+        self._started = time.perf_counter()
+        self._next_report = self._started + self.interval
+
+    def update(self, done: int):
+        now = time.perf_counter()
+        if now < self._next_report:
+            return
+        self._next_report = now + self.interval
+        fraction = done / self.total if self.total else 1.0
+        elapsed = now - self._started
+        remaining = elapsed * (1 - fraction) / fraction if fraction > 0 else float("inf")
+        print(f"{self.label}: {fraction * 100:.1f}% ({done}/{self.total}), "
+              f"{elapsed:.1f} s elapsed, ~{remaining:.1f} s left", file=self.stream, flush=True)
@@ -0,0 +1,85 @@
+import heapq
+import math
+
+from common.job import Job
+from common.scheduler import Scheduler
+
+
+class ReadyQueue:
+    """
+    Priority queue of the pending jobs of a component.
+
+    Jobs are kept in a binary heap ordered by the component's scheduling policy:
+    EDF orders by absolute deadline, RM by task priority (lower value = higher priority).
+    Ties are broken in favour of the most recently released job, which is the order the
+    previous list-based queue produced.
+
+    At most one job per task is pending. Pushing a job for a task that already has one
+    replaces it; the replaced heap entry is left behind and discarded lazily when it
+    reaches the top. This keeps push/pop at O(log n) and task lookups at O(1).
+
+    Attributes:
+        scheduler (Scheduler): Scheduling policy used to order the jobs
+    """
+    __slots__ = ("scheduler", "_heap", "_pending", "_counter")
+
+    def __init__(self, scheduler: Scheduler):
+        if scheduler not in (Scheduler.EDF, Scheduler.RM):
+            raise ValueError(f"Unknown scheduling policy: {scheduler}")
+        self.scheduler = scheduler
+        self._heap: list[tuple[float, int, Job]] = []
+        self._pending: dict[str, Job] = {}  # task_id -> pending job
+        self._counter = 0  # insertion counter used to break ties
+
+    def push(self, job: Job) -> None:
+        """Add a job, replacing any pending job of the same task."""
+        if self.scheduler == Scheduler.EDF:
+            key = job.absolute_deadline
+        else:
+            key = job.priority if job.priority is not None else math.inf
+        self._pending[job.task_id] = job
+        self._counter += 1
+        heapq.heappush(self._heap, (key, -self._counter, job))
+
+        # Rebuild once replaced entries dominate the heap
+        if len(self._heap) > 2 * len(self._pending) + 16:
+            self._heap = [entry for entry in self._heap if self._pending.get(entry[2].task_id) is entry[2]]
+            heapq.heapify(self._heap)
+
+    def peek(self) -> Job:
+        """Return the highest-priority job without removing it."""
+        self._discard_stale()
+        return self._heap[0][2]
+
+    def pop(self) -> Job:
+        """Remove and return the highest-priority job."""
+        self._discard_stale()
+        _, _, job = heapq.heappop(self._heap)
+        del self._pending[job.task_id]
+        return job
+
+    def remove(self, task_id: str) -> Job:
+        """Remove and return the pending job of a task; its heap entry is discarded lazily."""
+        return self._pending.pop(task_id)
+
+    def get(self, task_id: str) -> Job | None:
+        """Return the pending job of a task, or None if the task has no pending job."""
+        return self._pending.get(task_id)
+
+    def clear(self) -> None:
+        """Remove all jobs."""
+        self._heap.clear()
+        self._pending.clear()
+
+    def _discard_stale(self) -> None:
+        heap = self._heap
+        while heap and self._pending.get(heap[0][2].task_id) is not heap[0][2]:
+            heapq.heappop(heap)
+        if not heap:
+            raise IndexError("ReadyQueue is empty")
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __iter__(self):
+        return iter(self._pending.values())
@@ -0,0 +1,129 @@
+import math
+
+
+class ResponseTimeStats:
+    """
+    Online response-time and deadline statistics of a single task.
+
+    Memory does not grow with the number of jobs: count, sum, min, max and variance are
+    accumulated with Welford's algorithm, and quantiles come from a log-bucketed histogram
+    sketch (as in DDSketch) whose quantile estimates have a relative error of at most
+    `relative_accuracy`. The number of histogram buckets is capped at `max_buckets`;
+    beyond that the lowest buckets are collapsed, which only degrades the lowest quantiles.
+
+    Two accumulators can be merged, so statistics gathered by parallel runs combine into
+    the same result a single run would produce.
+
+    Attributes:
+        count (int): Number of completed jobs
+        total (float): Sum of the response times
+        min (float): Smallest response time (inf if no job completed)
+        max (float): Largest response time (0.0 if no job completed)
+        deadline_checks (int): Number of deadline checks (completions and overrun releases)
+        deadline_misses (int): Number of failed deadline checks
+    """
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.deadline_checks = 0
+        self.deadline_misses = 0
+        self._buckets: dict[int, int] = {}  # bucket index -> count
+        self._zero_count = 0
+
+    def add_response(self, response_time: float, deadline_met: bool) -> None:
+        """Record a completed job."""
+        self.count += 1
+        self.total += response_time
+        if response_time < self.min:
+            self.min = response_time
+        if response_time > self.max:
+            self.max = response_time
+
+        delta = response_time - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (response_time - self._mean)
+
+        if response_time > 0:
+            index = math.ceil(math.log(response_time) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            if len(self._buckets) > self.max_buckets:
+                self._collapse()
+        else:
+            self._zero_count += 1
+
+        self.add_deadline(deadline_met)
+
+    def add_deadline(self, deadline_met: bool) -> None:
+        """Record a deadline check that is not tied to a completion (e.g. an overrun at release)."""
+        self.deadline_checks += 1
+        if not deadline_met:
+            self.deadline_misses += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the response times."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def all_deadlines_met(self) -> bool:
+        return self.deadline_misses == 0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1) of the response times.
+
+        Returns:
+            float: The estimate, within `relative_accuracy` of the true value (0.0 if no job completed)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                estimate = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def merge(self, other: "ResponseTimeStats") -> None:
+        """Fold the statistics of another accumulator (with the same accuracy) into this one."""
+        if other.count:
+            count = self.count + other.count
+            delta = other._mean - self._mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self._mean += delta * other.count / count
+            self.count = count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            for index, bucket_count in other._buckets.items():
+                self._buckets[index] = self._buckets.get(index, 0) + bucket_count
+            self._zero_count += other._zero_count
+            if len(self._buckets) > self.max_buckets:
+                self._collapse()
+
+        self.deadline_checks += other.deadline_checks
+        self.deadline_misses += other.deadline_misses
+
+    def _collapse(self) -> None:
+        # Fold the lowest buckets into the first one that is kept
+        indexes = sorted(self._buckets)
+        excess = indexes[:len(indexes) - self.max_buckets]
+        target = indexes[len(excess)]
+        self._buckets[target] += sum(self._buckets.pop(index) for index in excess)
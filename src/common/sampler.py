@@ -0,0 +1,118 @@
+import csv
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from common.task import Task
+
+
+class ExecutionTimeSampler:
+    """
+    Base class for execution-time distributions.
+
+    A sampler draws a whole batch of execution times for a task in one vectorized call,
+    so the simulator can pre-draw the jobs of a hyperperiod instead of calling NumPy once
+    per job. All values lie in [lower_bound, wcet] where lower_bound = wcet * lower_bound_percentage.
+
+    Attributes:
+        lower_bound_percentage (float): Best case execution time as a fraction of the WCET
+        rng (np.random.Generator): Random number generator; pass a seeded one for reproducible runs
+    """
+    def __init__(self, lower_bound_percentage: float = 1.0, rng: np.random.Generator | None = None):
+        if not 0 <= lower_bound_percentage <= 1:
+            raise ValueError(f"lower_bound_percentage must be in [0, 1], got {lower_bound_percentage}")
+        self.lower_bound_percentage = lower_bound_percentage
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def sample(self, task: Task, count: int) -> np.ndarray:
+        """
+        Draw execution times for the next `count` jobs of a task.
+
+        Args:
+            task: Task whose jobs are sampled (its WCET is the upper bound)
+            count: Number of execution times to draw
+
+        Returns:
+            np.ndarray: Array of `count` execution times
+        """
+        raise NotImplementedError
+
+class ConstantSampler(ExecutionTimeSampler):
+    """Every job runs for exactly its WCET."""
+    def sample(self, task: Task, count: int) -> np.ndarray:
+        return np.full(count, task.wcet, dtype=float)
+
+class UniformSampler(ExecutionTimeSampler):
+    """Execution times are uniformly distributed between the lower bound and the WCET."""
+    def sample(self, task: Task, count: int) -> np.ndarray:
+        lower_bound = task.wcet * self.lower_bound_percentage
+        if lower_bound == task.wcet:
+            return np.full(count, task.wcet, dtype=float)
+        return self.rng.uniform(lower_bound, task.wcet, size=count)
+
+class NormalSampler(ExecutionTimeSampler):
+    """
+    Execution times follow a normal distribution truncated to [lower_bound, wcet].
+
+    The distribution uses:
+    - mean: average of WCET and lower_bound ((wcet + lower_bound)/2)
+    - standard deviation: (wcet - lower_bound)/6, so ~99.7% of the values fall within ±3σ
+
+    Values outside the bounds are redrawn, but only the rejected entries of the batch are
+    redrawn and a zero standard deviation short-circuits to the mean.
+    """
+    def sample(self, task: Task, count: int) -> np.ndarray:
+        lower_bound = task.wcet * self.lower_bound_percentage
+        mean = (task.wcet + lower_bound) / 2
+        std_dev = (task.wcet - lower_bound) / 6
+        if std_dev == 0:
+            return np.full(count, mean, dtype=float)
+
+        samples = self.rng.normal(mean, std_dev, size=count)
+        rejected = np.flatnonzero((samples < lower_bound) | (samples > task.wcet))
+        while rejected.size:
+            samples[rejected] = self.rng.normal(mean, std_dev, size=rejected.size)
+            rejected = rejected[(samples[rejected] < lower_bound) | (samples[rejected] > task.wcet)]
+        return samples
+
+class EmpiricalSampler(ExecutionTimeSampler):
+    """
+    Execution times are resampled (with replacement) from observed traces.
+
+    Traces are expressed in the same time units as the simulated (speed-adjusted) WCET and
+    are clipped to [lower_bound, wcet]. Tasks without a trace run for their WCET.
+
+    Attributes:
+        traces (dict[str, np.ndarray]): Observed execution times per task id
+    """
+    def __init__(self, traces: Mapping[str, Sequence[float]], lower_bound_percentage: float = 0.0,
+                 rng: np.random.Generator | None = None):
+        super().__init__(lower_bound_percentage, rng)
+        self.traces = {task_id: np.asarray(values, dtype=float) for task_id, values in traces.items()}
+
+    @classmethod
+    def from_csv(cls, filename: str, lower_bound_percentage: float = 0.0,
+                 rng: np.random.Generator | None = None) -> "EmpiricalSampler":
+        """
+        Build a sampler from a CSV file with the columns task_name,execution_time
+        (one row per observed job).
+        """
+        traces: dict[str, list[float]] = {}
+        with open(filename, newline='') as f:
+            for row in csv.DictReader(f):
+                traces.setdefault(row['task_name'], []).append(float(row['execution_time']))
+        return cls(traces, lower_bound_percentage, rng)
+
+    def sample(self, task: Task, count: int) -> np.ndarray:
+        trace = self.traces.get(task.id)
+        if trace is None or trace.size == 0:
+            return np.full(count, task.wcet, dtype=float)
+        lower_bound = task.wcet * self.lower_bound_percentage
+        return np.clip(self.rng.choice(trace, size=count), lower_bound, task.wcet)
+
+SAMPLERS: dict[str, type[ExecutionTimeSampler]] = {
+    'normal': NormalSampler,
+    'uniform': UniformSampler,
+    'constant': ConstantSampler,
+    'empirical': EmpiricalSampler,
+}
@@ -0,0 +1,88 @@
+import math
+
+from common.component import Component
+from common.core import Core
+from common.scheduler import Scheduler
+from common.task import Task
+
+
+class SystemModel:
+    """
+    Lookup indexes over the cores, components and tasks of a system.
+
+    The indexes are built once when the system is loaded, so the simulator and the
+    analysis can find the component of a task, the tasks of a component or the
+    components of a core in O(1) instead of scanning the whole system.
+
+    Attributes:
+        cores (list[Core]): All cores, in input order
+        components (list[Component]): All components, in input order
+        tasks (list[Task]): All tasks, in input order
+        core_by_id (dict[str, Core]): Core for each core id
+        component_by_id (dict[str, Component]): Component for each component id
+        components_by_core (dict[str, list[Component]]): Components pinned to each core, in input order
+        tasks_by_component (dict[str, list[Task]]): Tasks of each component, in input order
+        scheduler_by_core (dict[str, Scheduler]): Top-level scheduler of each core
+    """
+    def __init__(self, cores: list[Core], components: list[Component], tasks: list[Task]):
+        self.cores = cores
+        self.components = components
+        self.tasks = tasks
+
+        self.core_by_id: dict[str, Core] = {core.id: core for core in cores}
+        self.component_by_id: dict[str, Component] = {component.id: component for component in components}
+        self.scheduler_by_core: dict[str, Scheduler] = {core.id: core.scheduler for core in cores}
+
+        self.components_by_core: dict[str, list[Component]] = {core.id: [] for core in cores}
+        for component in components:
+            self.components_by_core.setdefault(component.core_id, []).append(component)
+
+        self.tasks_by_component: dict[str, list[Task]] = {component.id: [] for component in components}
+        for task in tasks:
+            self.tasks_by_component.setdefault(task.component_id, []).append(task)
+
+    def component_of(self, task: Task) -> Component:
+        """Return the component a task belongs to."""
+        return self.component_by_id[task.component_id]
+
+    def core_of(self, component: Component) -> Core | None:
+        """Return the core a component is pinned to, or None if the core is not defined."""
+        return self.core_by_id.get(component.core_id)
+
+    def hyperperiod(self) -> int:
+        """Calculate the system hyperperiod hierarchically.
+        First calculates the hyperperiod (LCM) of each component: its task periods and
+        its own replenishment period, since budgets are refreshed on that period too.
+        Then calculates the LCM of all component hyperperiods.
+
+        Example:
+            Component1 has period 4 and tasks with periods [2,3]  -> LCM = 12
+            Component2 has period 5 and tasks with periods [2,4]  -> LCM = 20
+            System hyperperiod = LCM(12,20) = 60
+
+        Returns:
+            int: The hyperperiod value for the entire system
+        """
+        # Calculate hyperperiod for each component
+        component_hyperperiods = [
+            math.lcm(int(component.period), *(int(task.period) for task in self.tasks_by_component[component.id]))
+            for component in self.components
+        ]
+
+        # Calculate system hyperperiod as LCM of component hyperperiods
+        return math.lcm(*component_hyperperiods)
+
+    def core_hyperperiod(self, core_id: str) -> int:
+        """
+        Hyperperiod of a single core: the LCM of the periods of all tasks on the core and
+        of the replenishment periods of its components. Cores never interact, so this is
+        the horizon after which the schedule of the core repeats.
+
+        Returns:
+            int: The core hyperperiod (1 for a core without components)
+        """
+        periods = []
+        for component in self.components_by_core.get(core_id, []):
+            periods.append(int(component.period))
+            periods.extend(int(task.period) for task in self.tasks_by_component[component.id])
+        return math.lcm(*periods) if periods else 1
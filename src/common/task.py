@@ -1,4 +1,6 @@
 class Task:
+    __slots__ = ("id", "wcet", "period", "component_id", "priority", "release_time", "remaining_time")
+
     def __init__(self, task_name: str, wcet: int, period: int, component_id: str, priority: int | None):
         self.id = task_name
         self.wcet = wcet
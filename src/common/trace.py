@@ -0,0 +1,242 @@
+import json
+import os
+from enum import IntEnum
+from typing import Iterator
+
+import numpy as np
+
+from common.component import Component
+from common.system_model import SystemModel
+
+# Events buffered in memory before a chunk is appended to the trace file
+TRACE_CHUNK_EVENTS = 1 << 16
+# Rows scanned at a time when filtering a memory-mapped trace
+SCAN_CHUNK_EVENTS = 1 << 20
+# Task index of events that do not concern a task (budget replenishment and exhaustion)
+NO_TASK = np.iinfo(np.uint32).max
+
+class TraceEvent(IntEnum):
+    RELEASE = 0
+    START = 1  # A job is dispatched on its core (first start or resumption)
+    PREEMPT = 2  # An unfinished job stops running (higher-priority work or budget exhaustion)
+    COMPLETE = 3
+    REPLENISH = 4
+    EXHAUST = 5
+    DEADLINE_MISS = 6  # A job completed late or was still pending at the next release of its task
+
+# Fixed-width record of one event, 23 bytes. Times restart at 0 every iteration (hyperperiod).
+TRACE_DTYPE = np.dtype([
+    ("iteration", "<u4"),
+    ("time", "<i8"),
+    ("event", "u1"),
+    ("core", "<u2"),
+    ("component", "<u4"),
+    ("task", "<u4"),
+])
+
+class TraceRecorder:
+    """
+    Records the scheduling events of a simulation into a compact binary trace.
+
+    Events are appended to an in-memory list and converted to TRACE_DTYPE records in
+    chunks of `chunk_events`, which are appended to the trace file. Cores, components and
+    tasks are stored as indexes into the id tables of a JSON sidecar (`<path>.json`),
+    written when the recorder is closed. Memory use is bounded by the chunk size, so
+    traces can be larger than RAM; read them back with TraceReader.
+
+    Attributes:
+        path (str): Path of the trace file
+        iteration (int): Iteration stamped on the recorded events (set by the simulator)
+        count (int): Number of events recorded so far
+    """
+    def __init__(self, path: str, model: SystemModel, chunk_events: int = TRACE_CHUNK_EVENTS):
+        self.path = path
+        self.iteration = 0
+        self.count = 0
+        self.chunk_events = chunk_events
+
+        self.core_ids = [core.id for core in model.cores]
+        self.component_ids = [component.id for component in model.components]
+        self.task_ids = [task.id for task in model.tasks]
+        self._core_index = {core_id: idx for idx, core_id in enumerate(self.core_ids)}
+        self._component_index = {component_id: idx for idx, component_id in enumerate(self.component_ids)}
+        self._task_index = {task_id: idx for idx, task_id in enumerate(self.task_ids)}
+
+        self._buffer: list[tuple] = []
+        self._deferred: list[tuple] = []
+        self._file = open(path, "wb")
+
+    def record(self, time: int, event: TraceEvent, component: Component, task_id: str | None = None):
+        """Record an event of a component (and of one of its tasks)."""
+        self._buffer.append(self._row(time, event, component, task_id))
+        if len(self._buffer) >= self.chunk_events:
+            self._flush()
+
+    def defer(self, time: int, event: TraceEvent, component: Component, task_id: str | None = None):
+        """
+        Record an event once `commit` is called. The tick engine uses this for events at the
+        end of a tick, so they follow the dispatches of all cores at the start of the tick and
+        the trace stays ordered by time.
+        """
+        self._deferred.append(self._row(time, event, component, task_id))
+
+    def commit(self):
+        """Record the deferred events."""
+        if self._deferred:
+            self._buffer.extend(self._deferred)
+            self._deferred.clear()
+            if len(self._buffer) >= self.chunk_events:
+                self._flush()
+
+    def close(self):
+        """Flush the remaining events and write the sidecar."""
+        if self._file.closed:
+            return
+        self.commit()
+        self._flush()
+        self._file.close()
+        with open(self.path + ".json", "w") as f:
+            json.dump({
+                "dtype": TRACE_DTYPE.descr,
+                "count": self.count,
+                "events": [event.name for event in TraceEvent],
+                "cores": self.core_ids,
+                "components": self.component_ids,
+                "tasks": self.task_ids,
+            }, f)
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _row(self, time: int, event: TraceEvent, component: Component, task_id: str | None) -> tuple:
+        return (
+            self.iteration,
+            time,
+            event,
+            self._core_index.get(component.core_id, 0),
+            self._component_index[component.id],
+            NO_TASK if task_id is None else self._task_index[task_id],
+        )
+
+    def _flush(self):
+        if self._buffer:
+            self._file.write(np.array(self._buffer, dtype=TRACE_DTYPE).tobytes())
+            self.count += len(self._buffer)
+            self._buffer.clear()
+
+class TraceReader:
+    """
+    Memory-mapped view of a trace written by TraceRecorder.
+
+    Events are ordered by (iteration, time), so time windows are located by binary search;
+    the other filters scan the selected rows in chunks. Only the pages that are touched are
+    read from disk.
+
+    Attributes:
+        events (np.ndarray): All events (TRACE_DTYPE, memory-mapped)
+        core_ids, component_ids, task_ids (list[str]): Id tables the event indexes refer to
+    """
+    def __init__(self, path: str):
+        with open(path + ".json") as f:
+            header = json.load(f)
+        self.core_ids: list[str] = header["cores"]
+        self.component_ids: list[str] = header["components"]
+        self.task_ids: list[str] = header["tasks"]
+
+        count = header["count"]
+        if count == 0 or os.path.getsize(path) == 0:
+            self.events = np.empty(0, dtype=TRACE_DTYPE)
+        else:
+            self.events = np.memmap(path, dtype=TRACE_DTYPE, mode="r", shape=(count,))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def query(self, start: int | None = None, end: int | None = None, iteration: int | None = None,
+              core: str | None = None, component: str | None = None, task: str | None = None,
+              events: list[TraceEvent] | None = None) -> np.ndarray:
+        """
+        Select events. All filters are optional and combined.
+
+        Args:
+            start, end: Time window [start, end), applied within every selected iteration
+            iteration: Only this iteration
+            core, component, task: Only events of this core, component or task (by id)
+            events: Only these event types
+
+        Returns:
+            np.ndarray: The matching events (TRACE_DTYPE), in trace order
+        """
+        selected = [self._filter(rows, core, component, task, events)
+                    for rows in self._windows(start, end, iteration)]
+        return np.concatenate(selected) if selected else np.empty(0, dtype=TRACE_DTYPE)
+
+    def window(self, start: int, end: int, iteration: int | None = None) -> np.ndarray:
+        """Events in the time window [start, end)."""
+        return self.query(start, end, iteration)
+
+    def for_core(self, core_id: str) -> np.ndarray:
+        return self.query(core=core_id)
+
+    def for_component(self, component_id: str) -> np.ndarray:
+        return self.query(component=component_id)
+
+    def for_task(self, task_id: str) -> np.ndarray:
+        return self.query(task=task_id)
+
+    def describe(self, rows: np.ndarray) -> Iterator[dict]:
+        """Decode events into dicts with event names and core, component and task ids."""
+        for row in rows:
+            yield {
+                "iteration": int(row["iteration"]),
+                "time": int(row["time"]),
+                "event": TraceEvent(row["event"]).name,
+                "core": self.core_ids[row["core"]] if self.core_ids else None,
+                "component": self.component_ids[row["component"]],
+                "task": None if row["task"] == NO_TASK else self.task_ids[row["task"]],
+            }
+
+    def _windows(self, start: int | None, end: int | None, iteration: int | None) -> Iterator[np.ndarray]:
+        iterations = self.events["iteration"]
+        if len(iterations) == 0:
+            return
+        if iteration is None:
+            selected = range(int(iterations[0]), int(iterations[-1]) + 1)
+        else:
+            selected = [iteration]
+
+        for current in selected:
+            lo = np.searchsorted(iterations, current, side="left")
+            hi = np.searchsorted(iterations, current, side="right")
+            rows = self.events[lo:hi]
+            times = rows["time"]
+            first = 0 if start is None else np.searchsorted(times, start, side="left")
+            last = len(rows) if end is None else np.searchsorted(times, end, side="left")
+            if first < last:
+                yield rows[first:last]
+
+    def _filter(self, rows: np.ndarray, core: str | None, component: str | None, task: str | None,
+                events: list[TraceEvent] | None) -> np.ndarray:
+        conditions = []
+        if core is not None:
+            conditions.append(("core", self.core_ids.index(core)))
+        if component is not None:
+            conditions.append(("component", self.component_ids.index(component)))
+        if task is not None:
+            conditions.append(("task", self.task_ids.index(task)))
+        if not conditions and events is None:
+            return np.array(rows)
+
+        selected = []
+        for offset in range(0, len(rows), SCAN_CHUNK_EVENTS):
+            chunk = rows[offset:offset + SCAN_CHUNK_EVENTS]
+            mask = np.ones(len(chunk), dtype=bool)
+            for field, value in conditions:
+                mask &= chunk[field] == value
+            if events is not None:
+                mask &= np.isin(chunk["event"], [int(event) for event in events])
+            selected.append(chunk[mask])
+        return np.concatenate(selected)
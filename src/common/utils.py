@@ -1,3 +1,4 @@
+import argparse
 import os
 
 def get_project_root() -> str:
@@ -10,4 +11,11 @@ def get_project_root() -> str:
     src_dir = os.path.dirname(common_dir)
     project_root = os.path.dirname(src_dir)
     
-    return project_root
\ No newline at end of file
+    return project_root
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1, such as --workers."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
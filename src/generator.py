@@ -0,0 +1,173 @@
+import argparse
+import csv
+import math
+import os
+
+import numpy as np
+
+from common.component import Component
+from common.core import Core
+from common.scheduler import Scheduler
+from common.task import Task
+
+PERIOD_DISTRIBUTIONS = ("loguniform", "uniform", "harmonic")
+
+def uunifast(rng: np.random.Generator, utilizations: np.ndarray, n: int) -> np.ndarray:
+    """
+    UUniFast (Bini & Buttazzo) for many task sets at once: split each total utilization
+    into n task utilizations drawn uniformly from the simplex.
+
+    Args:
+        rng: Random number generator
+        utilizations: Total utilization of each task set, shape (m,)
+        n: Number of tasks per set
+
+    Returns:
+        np.ndarray: Task utilizations, shape (m, n); each row sums to its total
+    """
+    m = len(utilizations)
+    if n == 1:
+        return utilizations.reshape(m, 1).astype(float)
+    exponents = 1.0 / np.arange(n - 1, 0, -1)
+    remaining = utilizations[:, None] * np.cumprod(rng.random((m, n - 1)) ** exponents, axis=1)
+    previous = np.hstack([utilizations[:, None], remaining])
+    return np.hstack([previous[:, :-1] - remaining, remaining[:, -1:]])
+
+def draw_periods(rng: np.random.Generator, size: int, distribution: str,
+                 period_range: tuple[int, int]) -> np.ndarray:
+    """
+    Draw integer task periods.
+
+    'uniform' and 'loguniform' draw from [low, high]. 'harmonic' draws from {low·2^k} within
+    the range, so the hyperperiod of any set of periods is at most the largest period.
+    """
+    low, high = period_range
+    if distribution == "uniform":
+        return rng.integers(low, high + 1, size)
+    if distribution == "loguniform":
+        return np.clip(np.rint(np.exp(rng.uniform(math.log(low), math.log(high + 1), size))), low, high).astype(np.int64)
+    if distribution == "harmonic":
+        exponents = rng.integers(0, max(int(math.log2(high / low)), 0) + 1, size)
+        return low * (1 << exponents)
+    raise ValueError(f"Unknown period distribution: {distribution}")
+
+def generate_system(cores: int = 2, components_per_core: int = 2, tasks_per_component: int = 5,
+                    utilization: tuple[float, float] = (0.1, 0.25), periods: str = "loguniform",
+                    period_range: tuple[int, int] = (10, 1000), speed_range: tuple[float, float] = (0.75, 1.25),
+                    rm_fraction: float = 0.5, budget_margin: float = 1.5,
+                    seed: int | None = None) -> tuple[list[Core], list[Component], list[Task]]:
+    """
+    Generate a random hierarchical system.
+
+    Every core gets `components_per_core` components with `tasks_per_component` tasks each.
+    The task utilization of each component (at nominal speed) is drawn uniformly from
+    `utilization` and split among its tasks with UUniFast. Cores and components use RM with
+    probability `rm_fraction`, EDF otherwise; RM priorities are rate monotonic. Each component
+    gets a period of half its shortest task period and a budget covering its speed-adjusted
+    utilization times `budget_margin` (capped at the period).
+
+    The same arguments and seed always produce the same system.
+
+    Returns:
+        tuple: (cores, components, tasks) ready for Simulator or analysis
+    """
+    rng = np.random.default_rng(seed)
+    n_components = cores * components_per_core
+    n_tasks = n_components * tasks_per_component
+
+    speed_factors = np.round(rng.uniform(*speed_range, cores), 2)
+    core_schedulers = rng.random(cores) < rm_fraction
+    component_schedulers = rng.random(n_components) < rm_fraction
+
+    # Task parameters, one row per component
+    totals = rng.uniform(*utilization, n_components)
+    task_periods = draw_periods(rng, n_tasks, periods, period_range).reshape(n_components, tasks_per_component)
+    task_wcets = np.maximum(1, np.rint(uunifast(rng, totals, tasks_per_component) * task_periods)).astype(np.int64)
+    # Rate-monotonic rank of each task within its component
+    task_priorities = np.argsort(np.argsort(task_periods, axis=1, kind="stable"), axis=1)
+
+    component_cores = np.repeat(np.arange(cores), components_per_core)
+    shortest = task_periods.min(axis=1)
+    floor = period_range[0] if periods == "harmonic" else 1
+    component_periods = np.maximum(floor, shortest // 2)
+    speed_utilization = (task_wcets / task_periods).sum(axis=1) / speed_factors[component_cores]
+    component_budgets = np.minimum(component_periods,
+                                   np.ceil(component_periods * speed_utilization * budget_margin)).astype(np.int64)
+
+    # Rate-monotonic rank of each component on its core
+    component_priorities = np.empty(n_components, dtype=np.int64)
+    for core_idx in range(cores):
+        members = np.arange(core_idx * components_per_core, (core_idx + 1) * components_per_core)
+        component_priorities[members[np.argsort(component_periods[members], kind="stable")]] = np.arange(len(members))
+
+    system_cores = [
+        Core(id=f"Core_{idx + 1}", speed_factor=float(speed_factors[idx]),
+             scheduler=Scheduler.RM if core_schedulers[idx] else Scheduler.EDF)
+        for idx in range(cores)
+    ]
+    system_components = [
+        Component(component_id=f"Component_{idx + 1}",
+                  scheduler=Scheduler.RM if component_schedulers[idx] else Scheduler.EDF,
+                  budget=int(component_budgets[idx]), period=int(component_periods[idx]),
+                  core_id=system_cores[component_cores[idx]].id,
+                  priority=int(component_priorities[idx]) if core_schedulers[component_cores[idx]] else None)
+        for idx in range(n_components)
+    ]
+    system_tasks = [
+        Task(task_name=f"Task_{idx * tasks_per_component + j + 1}", wcet=int(task_wcets[idx, j]),
+             period=int(task_periods[idx, j]), component_id=system_components[idx].id,
+             priority=int(task_priorities[idx, j]) if component_schedulers[idx] else None)
+        for idx in range(n_components) for j in range(tasks_per_component)
+    ]
+    return system_cores, system_components, system_tasks
+
+def write_system(directory: str, cores: list[Core], components: list[Component], tasks: list[Task]):
+    """Write a system as architecture.csv, budgets.csv and tasks.csv in the input format."""
+    os.makedirs(directory, exist_ok=True)
+    optional = lambda value: "" if value is None else value
+
+    with open(os.path.join(directory, "architecture.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["core_id", "speed_factor", "scheduler"])
+        writer.writerows([core.id, core.speed_factor, core.scheduler.name] for core in cores)
+
+    with open(os.path.join(directory, "budgets.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["component_id", "scheduler", "budget", "period", "core_id", "priority"])
+        writer.writerows([c.id, c.scheduler.name, c.budget, c.period, c.core_id, optional(c.priority)]
+                         for c in components)
+
+    with open(os.path.join(directory, "tasks.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["task_name", "wcet", "period", "component_id", "priority"])
+        writer.writerows([t.id, t.wcet, t.period, t.component_id, optional(t.priority)] for t in tasks)
+
+def main():
+    pair = lambda cast: lambda value: tuple(cast(v) for v in value.split(","))
+    parser = argparse.ArgumentParser(description="Generate a random hierarchical system as CSV inputs.")
+    parser.add_argument("output", help="Directory to write architecture.csv, budgets.csv and tasks.csv to")
+    parser.add_argument("--cores", type=int, default=2)
+    parser.add_argument("--components-per-core", type=int, default=2)
+    parser.add_argument("--tasks-per-component", type=int, default=5)
+    parser.add_argument("--utilization", type=pair(float), default=(0.1, 0.25), metavar="LOW,HIGH",
+                        help="Range of the task utilization of each component, at nominal speed")
+    parser.add_argument("--periods", choices=PERIOD_DISTRIBUTIONS, default="loguniform",
+                        help="Distribution of the task periods (harmonic bounds the hyperperiod)")
+    parser.add_argument("--period-range", type=pair(int), default=(10, 1000), metavar="LOW,HIGH")
+    parser.add_argument("--speed-range", type=pair(float), default=(0.75, 1.25), metavar="LOW,HIGH",
+                        help="Range of the core speed factors")
+    parser.add_argument("--rm-fraction", type=float, default=0.5,
+                        help="Probability that a core or component uses RM instead of EDF")
+    parser.add_argument("--budget-margin", type=float, default=1.5,
+                        help="Component bandwidth as a multiple of its speed-adjusted utilization")
+    parser.add_argument("--seed", type=int, help="Seed of the random number generator")
+    args = parser.parse_args()
+
+    cores, components, tasks = generate_system(
+        args.cores, args.components_per_core, args.tasks_per_component, args.utilization, args.periods,
+        args.period_range, args.speed_range, args.rm_fraction, args.budget_margin, args.seed)
+    write_system(args.output, cores, components, tasks)
+    print(f"Generated {len(cores)} cores, {len(components)} components and {len(tasks)} tasks in {args.output}")
+
+if __name__ == "__main__":
+    main()
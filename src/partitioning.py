@@ -0,0 +1,302 @@
+import argparse
+import copy
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from analysis import SUPPLY_MODELS, DemandCurve, analyze, component_supply, minimal_budget, write_budgets_csv
+from common.csvreader import read_csv, read_resources
+from common.scheduler import Scheduler
+from common.SRPModel import SRPModel, accesses_by_component
+from common.system_model import SystemModel
+from common.utils import positive_int
+
+ANNEALING_ITERATIONS = 20_000
+# Cost of an infeasible (component, core) pair or of one core's worth of overload,
+# relative to one used core
+INFEASIBILITY_PENALTY = 1000.0
+
+class AllocationProblem:
+    """
+    Component-to-core allocation problem with memoized fitness.
+
+    For every (component, core) pair the problem knows whether the component passes its
+    local test on that core, with its task WCETs scaled by the core's speed factor (as
+    adjust_wcet does), and the BDR rate it then needs. With `resize_budgets` the rate is
+    that of the minimal budget at the component's period on that core (see minimal_budget),
+    so faster cores need less bandwidth; otherwise it is the rate of the budget from
+    budgets.csv. The local test uses the supply selected by `supply_model` (see
+    analysis.component_supply) and, with resources, the SRP blocking terms of the
+    component's critical sections at the core's speed. Results depend only on the
+    component and the speed factor, so they are computed once per (component, distinct
+    speed) and shared by cores of equal speed.
+
+    Attributes:
+        core_ids (list[str]): Cores, in input order
+        component_ids (list[str]): Components, in input order
+        rates (np.ndarray): rates[c, k] is the rate component c needs on core k, inf if infeasible
+        budgets (np.ndarray): budgets[c, k] is the budget Q behind rates[c, k]
+    """
+    def __init__(self, architectures, budgets, tasks, edf_test='exhaustive', resize_budgets=False,
+                 supply_model='bdr', resources=None):
+        self.edf_test = edf_test
+        self.supply_model = supply_model
+        self.resize_budgets = resize_budgets
+        self.cores = list(architectures)
+        self.components = list(budgets)
+        self.core_ids = [core.id for core in self.cores]
+        self.component_ids = [component.id for component in self.components]
+
+        model = SystemModel(self.cores, self.components, tasks)
+        self._tasks = model.tasks_by_component
+        self._accesses = accesses_by_component(model, resources or [])
+        self._memo = {}
+
+        self.rates = np.full((len(self.components), len(self.cores)), math.inf)
+        self.budgets = np.zeros((len(self.components), len(self.cores)))
+        for c, component in enumerate(self.components):
+            for k, core in enumerate(self.cores):
+                fit = self.fit(component, core.speed_factor)
+                if fit is not None:
+                    self.budgets[c, k] = fit
+                    self.rates[c, k] = fit / component.period
+
+    def fit(self, component, speed_factor):
+        """
+        Budget the component needs on a core of the given speed, or None if it cannot be
+        scheduled there. Memoized per (component, speed factor).
+        """
+        key = (component.id, speed_factor)
+        if key not in self._memo:
+            scaled = []
+            for task in self._tasks[component.id]:
+                task = copy.copy(task)
+                task.wcet = task.wcet / speed_factor
+                scaled.append(task)
+            if component.scheduler == Scheduler.RM:
+                scaled.sort(key=lambda t: t.priority if t.priority is not None else math.inf)
+            accesses = self._accesses.get(component.id)
+            srp = SRPModel(component.scheduler, scaled, accesses, speed_factor) if accesses else None
+            curve = DemandCurve(scaled, component.scheduler, srp)
+
+            Q, P = component.budget, component.period
+            if self.resize_budgets:
+                self._memo[key] = minimal_budget(curve, P, self.edf_test, self.supply_model)
+            elif curve.is_schedulable(component_supply(Q, P, self.supply_model), self.edf_test):
+                self._memo[key] = Q
+            else:
+                self._memo[key] = None
+        return self._memo[key]
+
+    def loads(self, assignment):
+        """Total BDR rate per core; components that are infeasible on their core count as a full core."""
+        loads = np.zeros(len(self.cores))
+        for c, k in enumerate(assignment):
+            rate = self.rates[c, k]
+            loads[k] += rate if math.isfinite(rate) else 1.0
+        return loads
+
+    def cost(self, assignment):
+        """
+        Cost of a complete assignment (core index per component): penalties for infeasible
+        pairs and for overloaded cores, plus the number of cores in use. Feasible allocations
+        cost less than INFEASIBILITY_PENALTY.
+        """
+        infeasible = sum(1 for c, k in enumerate(assignment) if not math.isfinite(self.rates[c, k]))
+        loads = self.loads(assignment)
+        overload = float(np.sum(np.maximum(loads - 1.0, 0.0)))
+        used = len(set(assignment))
+        return INFEASIBILITY_PENALTY * (infeasible + overload) + used
+
+    def is_feasible(self, assignment):
+        return self.cost(assignment) < INFEASIBILITY_PENALTY
+
+
+def first_fit_decreasing(problem):
+    """
+    First-fit decreasing: components in decreasing order of their smallest feasible rate,
+    each on the first core (in input order) where it is feasible and still fits.
+
+    Returns:
+        list[int | None]: Core index per component, None where no core fits
+    """
+    return _fit_decreasing(problem, best=False)
+
+
+def best_fit_decreasing(problem):
+    """Best-fit decreasing: like first_fit_decreasing, but each component goes to the core it fills the most."""
+    return _fit_decreasing(problem, best=True)
+
+
+def _fit_decreasing(problem, best):
+    n_components, n_cores = problem.rates.shape
+    smallest = np.min(problem.rates, axis=1) if n_cores else np.full(n_components, math.inf)
+    # Components that fit nowhere go last; stable, so ties keep the input order
+    order = sorted(range(n_components), key=lambda c: -smallest[c] if math.isfinite(smallest[c]) else math.inf)
+
+    loads = np.zeros(n_cores)
+    assignment = [None] * n_components
+    for c in order:
+        candidates = [k for k in range(n_cores)
+                      if math.isfinite(problem.rates[c, k]) and loads[k] + problem.rates[c, k] <= 1.0]
+        if not candidates:
+            continue
+        k = max(candidates, key=lambda k: loads[k] + problem.rates[c, k]) if best else candidates[0]
+        assignment[c] = k
+        loads[k] += problem.rates[c, k]
+    return assignment
+
+
+def complete_assignment(problem, assignment):
+    """Put every unassigned component on the core where it needs the smallest rate."""
+    fallback = np.argmin(problem.rates, axis=1)
+    return [int(fallback[c]) if k is None else k for c, k in enumerate(assignment)]
+
+
+def anneal(problem, initial, iterations=ANNEALING_ITERATIONS, seed=None, temperature=1.0):
+    """
+    Simulated annealing over complete assignments. A move puts one random component on a
+    random other core; the cost change is computed from the two affected cores only.
+    The temperature cools geometrically from `temperature` to 1e-3·temperature.
+
+    Returns:
+        tuple: (best assignment found, its cost)
+    """
+    rng = random.Random(seed)
+    n_components, n_cores = problem.rates.shape
+    if n_components == 0 or n_cores < 2:
+        return list(initial), problem.cost(initial)
+
+    # Effective rate of each pair: infeasible pairs occupy a full core and are penalized
+    feasible = np.isfinite(problem.rates)
+    effective = np.where(feasible, problem.rates, 1.0).tolist()
+    infeasible = (~feasible).tolist()
+
+    assignment = list(initial)
+    loads = [0.0] * n_cores
+    counts = [0] * n_cores
+    for c, k in enumerate(assignment):
+        loads[k] += effective[c][k]
+        counts[k] += 1
+
+    def core_cost(load, count):
+        return INFEASIBILITY_PENALTY * max(load - 1.0, 0.0) + (1 if count else 0)
+
+    cost = problem.cost(assignment)
+    best, best_cost = list(assignment), cost
+    cooling = (1e-3) ** (1.0 / iterations)
+    current_temperature = temperature
+
+    for _ in range(iterations):
+        c = rng.randrange(n_components)
+        source = assignment[c]
+        target = rng.randrange(n_cores - 1)
+        if target >= source:
+            target += 1
+
+        source_load = loads[source] - effective[c][source]
+        target_load = loads[target] + effective[c][target]
+        delta = (core_cost(source_load, counts[source] - 1) + core_cost(target_load, counts[target] + 1)
+                 - core_cost(loads[source], counts[source]) - core_cost(loads[target], counts[target])
+                 + INFEASIBILITY_PENALTY * (infeasible[c][target] - infeasible[c][source]))
+
+        if delta <= 0 or rng.random() < math.exp(-delta / current_temperature):
+            assignment[c] = target
+            loads[source], loads[target] = source_load, target_load
+            counts[source] -= 1
+            counts[target] += 1
+            cost += delta
+            if cost < best_cost - 1e-9:
+                best, best_cost = list(assignment), cost
+        current_temperature *= cooling
+
+    # Recompute from scratch to shed floating-point drift of the incremental updates
+    return best, problem.cost(best)
+
+
+def parallel_anneal(problem, initial, workers=1, chains=None, iterations=ANNEALING_ITERATIONS, seed=None):
+    """
+    Run independent annealing chains, in a pool of worker processes when workers > 1,
+    each with its own random stream spawned from `seed`, and keep the cheapest result.
+
+    Returns:
+        tuple: (best assignment, its cost)
+    """
+    chains = chains or max(workers, 1)
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(chains)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(anneal, problem, initial, iterations, chain_seed) for chain_seed in seeds]
+            results = [future.result() for future in futures]
+    else:
+        results = [anneal(problem, initial, iterations, chain_seed) for chain_seed in seeds]
+    return min(results, key=lambda result: result[1])
+
+
+def allocated_budgets(problem, assignment):
+    """
+    Copies of the components on their assigned cores (with the per-core minimal budget
+    when the problem resizes budgets).
+    """
+    allocated = []
+    for c, k in enumerate(assignment):
+        component = copy.copy(problem.components[c])
+        component.core_id = problem.core_ids[k]
+        if problem.resize_budgets and math.isfinite(problem.rates[c, k]):
+            component.budget = int(problem.budgets[c, k])
+        allocated.append(component)
+    return allocated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search component-to-core allocations of a hierarchical system.")
+    parser.add_argument("architecture", help="Path to architecture.csv")
+    parser.add_argument("budgets", help="Path to budgets.csv")
+    parser.add_argument("tasks", help="Path to tasks.csv")
+    parser.add_argument("--strategy", choices=["ffd", "bfd", "anneal"], default="anneal",
+                        help="First-fit or best-fit decreasing, or annealing started from best-fit decreasing")
+    parser.add_argument("--resize-budgets", action="store_true",
+                        help="Give each component the minimal budget at its period on its new core")
+    parser.add_argument("--edf-test", choices=["exhaustive", "qpa"], default="exhaustive")
+    parser.add_argument("--supply", choices=SUPPLY_MODELS, default="bdr",
+                        help="Component supply: half-half BDR bound of the PRM budget, or the exact PRM sbf")
+    parser.add_argument("--resources", metavar="RESOURCES_CSV",
+                        help="Critical sections of the tasks; adds the SRP blocking terms to the local tests")
+    parser.add_argument("--iterations", type=int, default=ANNEALING_ITERATIONS, help="Moves per annealing chain")
+    parser.add_argument("--chains", type=int, help="Number of annealing chains (default: one per worker)")
+    parser.add_argument("--workers", type=positive_int, default=1, help="Run the annealing chains in this many processes")
+    parser.add_argument("--seed", type=int, help="Seed of the annealing")
+    parser.add_argument("--output", default="budgets_partitioned.csv", help="Path of the budgets.csv to write")
+    args = parser.parse_args()
+
+    architectures, budgets, tasks = read_csv(args.architecture, args.budgets, args.tasks)
+    resources = read_resources(args.resources) if args.resources else None
+    problem = AllocationProblem(architectures, budgets, tasks, args.edf_test, args.resize_budgets, args.supply,
+                                resources)
+
+    heuristic = first_fit_decreasing(problem) if args.strategy == "ffd" else best_fit_decreasing(problem)
+    assignment = complete_assignment(problem, heuristic)
+    cost = problem.cost(assignment)
+    if args.strategy == "anneal":
+        assignment, cost = parallel_anneal(problem, assignment, args.workers, args.chains, args.iterations, args.seed)
+
+    allocated = allocated_budgets(problem, assignment)
+    loads = problem.loads(assignment)
+    for k, core_id in enumerate(problem.core_ids):
+        members = [problem.component_ids[c] for c, core in enumerate(assignment) if core == k]
+        print(f"Core {core_id}: load {loads[k]:.4f}, components: {', '.join(members) or '-'}")
+
+    # Confirm the allocation with the regular analysis pipeline
+    _, core_summary = analyze(architectures, allocated, copy.deepcopy(tasks), args.edf_test,
+                              supply_model=args.supply, resources=resources)
+    schedulable = sum(core_summary.values())
+    print(f"\nAllocation {'feasible' if problem.is_feasible(assignment) else 'infeasible'} (cost {cost:.2f}); "
+          f"{schedulable}/{len(core_summary)} cores schedulable")
+
+    write_budgets_csv(allocated, {component.id: (component.budget, component.period) for component in allocated},
+                      args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import argparse
+import csv
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from analysis import SUPPLY_MODELS, DemandCurve, analyze, component_supply, minimal_budget
+from common.csvreader import read_csv, read_resources
+from common.utils import positive_int
+
+# Bisection stops when the bracket is narrower than this fraction of its upper end
+# (or than this absolute width, for factors below 1)
+SENSITIVITY_TOLERANCE = 1e-4
+# Scaling factors above this are reported as unbounded (e.g. a component without tasks)
+MAX_SCALING = 2.0 ** 20
+
+@dataclass
+class TaskSensitivity:
+    task_name: str
+    component_id: str
+    wcet: float  # Speed-adjusted WCET
+    wcet_scaling: float  # Largest factor this task's WCET can be multiplied by alone
+    critical_wcet: float
+
+@dataclass
+class ComponentSensitivity:
+    component_id: str
+    core_id: str
+    schedulable: bool
+    wcet_scaling: float  # Largest factor all the component's WCETs can be multiplied by together
+    critical_speed_factor: float  # Slowest core speed the component tolerates
+    budget: int
+    minimal_budget: int | None  # None if even Q = P is not enough
+    budget_slack: int | None  # budget − minimal_budget
+    budget_scaling: float | None  # minimal_budget / budget, the smallest factor the budget can shrink to
+
+@dataclass
+class CoreSensitivity:
+    core_id: str
+    schedulable: bool
+    speed_factor: float
+    critical_speed_factor: float  # Slowest speed at which every component on the core stays schedulable
+    speed_scaling: float  # critical_speed_factor / speed_factor
+
+def critical_scaling(passes, tolerance: float = SENSITIVITY_TOLERANCE) -> float:
+    """
+    Largest factor λ ≥ 0 with passes(λ), for a test that is monotone in λ (passes up
+    to the critical factor, fails beyond). The bracket is found by doubling from 1 and
+    then narrowed by bisection.
+
+    Returns:
+        float: The critical factor (within the tolerance, from below), inf above MAX_SCALING
+    """
+    low, high = 0.0, 1.0
+    while passes(high):
+        low, high = high, 2.0 * high
+        if high > MAX_SCALING:
+            return math.inf
+    while high - low > tolerance * max(high, 1.0):
+        middle = (low + high) / 2
+        if passes(middle):
+            low = middle
+        else:
+            high = middle
+    return low
+
+def component_sensitivity(comp_id: str, comp: dict, speed_factor: float, edf_test: str = 'exhaustive',
+                          supply_model: str = 'bdr') -> tuple[ComponentSensitivity, list[TaskSensitivity]]:
+    """
+    Sensitivity of one component of an analysed system (see analysis.analyze):
+      • per task, the critical scaling of its WCET with all other tasks unchanged
+      • the critical scaling of all its WCETs together, and the core speed it corresponds to
+        (scaling the speed by s divides every WCET by s)
+      • the minimal budget at its period, and the slack of the current budget above it
+    Every probe is the component's local test (DemandCurve.is_schedulable) on a
+    scaled demand curve under the component's supply (see analysis.component_supply).
+    SRP blocking terms, if any, stay fixed: only the WCETs are scaled.
+    """
+    Q, P = comp['budget'], comp['period']
+    supply = component_supply(Q, P, supply_model)
+    curve = DemandCurve(comp['tasks'], comp['scheduler'], comp['srp'])
+    passes = lambda factors: curve.scaled(factors).is_schedulable(supply, edf_test)
+
+    tasks = []
+    for idx, task in enumerate(comp['tasks']):
+        def passes_task(factor, idx=idx):
+            factors = np.ones(curve.wcets.size)
+            factors[idx] = factor
+            return passes(factors)
+        scaling = critical_scaling(passes_task)
+        tasks.append(TaskSensitivity(task.id, comp_id, float(curve.wcets[idx]), scaling,
+                                     float(curve.wcets[idx]) * scaling))
+
+    scaling = critical_scaling(passes)
+    budget = minimal_budget(curve, P, edf_test, supply_model)
+    component = ComponentSensitivity(
+        component_id=comp_id,
+        core_id=comp['core_id'],
+        schedulable=comp['schedulable'],
+        wcet_scaling=scaling,
+        critical_speed_factor=speed_factor / scaling if scaling > 0 else math.inf,
+        budget=Q,
+        minimal_budget=budget,
+        budget_slack=None if budget is None else Q - budget,
+        budget_scaling=None if budget is None else (budget / Q if Q > 0 else math.inf),
+    )
+    return component, tasks
+
+def _component_sensitivity(args):
+    return component_sensitivity(*args)
+
+def sensitivity_analysis(architectures, budgets, tasks, edf_test: str = 'exhaustive', workers: int = 1,
+                         supply_model: str = 'bdr', resources=None):
+    """
+    Sensitivity of every task, component and core of a system. Components are
+    independent, so they are analysed in a pool of `workers` processes when workers > 1.
+    WCETs are speed-adjusted in place, as by analysis.analyze, and resources (critical
+    sections, optional) add the SRP blocking terms to every probe.
+
+    Returns:
+        tuple: (list[CoreSensitivity], list[ComponentSensitivity], list[TaskSensitivity])
+    """
+    components, core_summary = analyze(architectures, budgets, tasks, edf_test, supply_model=supply_model,
+                                       resources=resources)
+    speed_factors = {core.id: core.speed_factor for core in architectures}
+    jobs = [(comp_id, comp, speed_factors[comp['core_id']], edf_test, supply_model)
+            for comp_id, comp in components.items()]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_component_sensitivity, jobs))
+    else:
+        results = [component_sensitivity(*job) for job in jobs]
+
+    component_results = [component for component, _ in results]
+    task_results = [task for _, component_tasks in results for task in component_tasks]
+
+    core_results = []
+    for core in architectures:
+        critical = max((c.critical_speed_factor for c in component_results if c.core_id == core.id), default=0.0)
+        core_results.append(CoreSensitivity(core.id, core_summary.get(core.id, False), core.speed_factor,
+                                            critical, critical / core.speed_factor))
+    return core_results, component_results, task_results
+
+def _format(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.4f}" if math.isfinite(value) else "inf"
+    return str(value)
+
+def print_table(rows: list, title: str):
+    """Print dataclass rows as an aligned table."""
+    print(f"\n{title}:")
+    if not rows:
+        print("(none)")
+        return
+    header = list(asdict(rows[0]))
+    cells = [[_format(value) for value in asdict(row).values()] for row in rows]
+    widths = [max(len(name), *(len(line[i]) for line in cells)) for i, name in enumerate(header)]
+    print("  ".join(name.ljust(width) for name, width in zip(header, widths)))
+    for line in cells:
+        print("  ".join(cell.ljust(width) for cell, width in zip(line, widths)))
+
+def write_sensitivity_csv(rows: list, filename: str):
+    """Write dataclass rows to a CSV file."""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        if rows:
+            writer.writerow(list(asdict(rows[0])))
+            writer.writerows([_format(value) for value in asdict(row).values()] for row in rows)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Critical WCET, speed and budget scaling of every task, component and core.")
+    parser.add_argument("architecture", help="Path to architecture.csv")
+    parser.add_argument("budgets", help="Path to budgets.csv")
+    parser.add_argument("tasks", help="Path to tasks.csv")
+    parser.add_argument("--edf-test", choices=["exhaustive", "qpa"], default="exhaustive")
+    parser.add_argument("--supply", choices=SUPPLY_MODELS, default="bdr",
+                        help="Component supply: half-half BDR bound of the PRM budget, or the exact PRM sbf")
+    parser.add_argument("--resources", metavar="RESOURCES_CSV",
+                        help="Critical sections of the tasks; adds the SRP blocking terms to the local tests")
+    parser.add_argument("--workers", type=positive_int, default=1, help="Analyse components in this many processes")
+    parser.add_argument("--output", metavar="PREFIX",
+                        help="Also write PREFIX_tasks.csv, PREFIX_components.csv and PREFIX_cores.csv")
+    args = parser.parse_args()
+
+    architectures, budgets, tasks = read_csv(args.architecture, args.budgets, args.tasks)
+    resources = read_resources(args.resources) if args.resources else None
+    cores, components, task_results = sensitivity_analysis(architectures, budgets, tasks, args.edf_test,
+                                                           args.workers, args.supply, resources)
+
+    print_table(task_results, "Tasks")
+    print_table(components, "Components")
+    print_table(cores, "Cores")
+
+    if args.output:
+        write_sensitivity_csv(task_results, f"{args.output}_tasks.csv")
+        write_sensitivity_csv(components, f"{args.output}_components.csv")
+        write_sensitivity_csv(cores, f"{args.output}_cores.csv")
+
+if __name__ == "__main__":
+    main()
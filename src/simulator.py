@@ -1,96 +1,163 @@
+import argparse
+import copy
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+import math
 import random as rand
 import numpy as np
 
-from common.csvreader import read_csv
+from common.csvreader import read_csv, read_resources
 from common.component import Component
 from common.scheduler import Scheduler
 from common.core import Core
 from common.task import Task
 from common.job import Job
 from common.csvoutput import TaskResult
+from common.system_model import SystemModel
+from common.response_stats import ResponseTimeStats
+from common.model_cache import DEFAULT_CACHE_DIR, load_system
+from common.horizon import MAX_SIMULATION_HORIZON, HorizonPlan, plan_horizon
+from common.trace import TraceEvent, TraceRecorder
+from common.profiling import Profiler, ProgressReporter
+from common.sampler import SAMPLERS, EmpiricalSampler, ExecutionTimeSampler, NormalSampler
+from common.SRPModel import ResourceAccess, SRPModel, srp_models
+from common.utils import positive_int
 
 CLOCK_TICK = 1
 SIMULATION_ITERATIONS = 10
+# Avionics (DO-178C): Typically ≥80% to ensure strict deadline guarantees.
 LOWER_BOUND_PERCENTAGE = 1
+SAMPLE_BATCH_LIMIT = 1 << 16
 
 class Simulator:
-    def __init__(self, cores:Core, components:Component, tasks:Task):
+    def __init__(self, cores:Core, components:Component, tasks:Task,
+                 sampler: ExecutionTimeSampler | None = None, wcet_adjusted: bool = False,
+                 hyperperiod: int | None = None, resources: list[ResourceAccess] | None = None):
+        """
+        Args:
+            cores, components, tasks: The system to simulate
+            sampler: Execution-time distribution (normal around the WCET by default)
+            wcet_adjusted: True if the task WCETs are already scaled by the core speed factors
+                (e.g. loaded from the model cache), so they are not scaled again
+            hyperperiod: Precomputed hyperperiod, if known
+            resources: Critical sections of the tasks, arbitrated with the Stack Resource
+                Policy within each component (see common.SRPModel)
+        """
         self.cores:list[Core] = cores
         self.tasks:list[Task] = tasks
         self.components:list[Component] = components
-        self._adjust_task_wcet()
+        self.model = SystemModel(cores, components, tasks)
+        if not wcet_adjusted:
+            self._adjust_task_wcet()
+        self.resources: list[ResourceAccess] = resources or []
+        self._srp: dict[str, SRPModel] = srp_models(self.model, self.resources)  # component_id -> SRP state
+
+        self.sampler = sampler if sampler is not None else NormalSampler(LOWER_BOUND_PERCENTAGE)
+        self._execution_times: dict[str, list[float]] = {}  # task_id -> pre-drawn execution times
+        self._hyperperiod: int | None = hyperperiod
+        self.max_horizon: int = MAX_SIMULATION_HORIZON  # Longest hyperperiod simulated in full
+        self.truncate_horizon: bool = False  # Simulate max_horizon instead of refusing longer hyperperiods
+        self.trace: TraceRecorder | None = None  # Records the scheduling events when set
+        self.profiler: Profiler | None = None  # Collects phase timers, counters and queue high-water marks when set
+        self.progress: ProgressReporter | None = None  # Reports progress on the console when set
+        self._trace_running: dict[str, tuple[Component, Job]] = {}  # core_id -> job last dispatched
 
         self.task_start_times: dict[str, float] = {}  # task_id -> start time
-        self.task_response_times: dict[str, list[float]] = {}  # task_id -> list of response times
-        self.task_deadlines: dict[str, list[bool]] = {}  # task_id -> list of deadline met flags
+        self.task_stats: dict[str, ResponseTimeStats] = {}  # task_id -> response time and deadline statistics
 
         for task in self.tasks:
             self.task_start_times[task.id] = 0
-            self.task_response_times[task.id] = []
-            self.task_deadlines[task.id] = []
+            self.task_stats[task.id] = ResponseTimeStats()
 
-    def run(self):
+    def run(self, iterations: int = SIMULATION_ITERATIONS):
         print("Running simulation...")
 
         t = 0  # Simulation time in us
 
         # Initialize response time tracking
-        for task in self.tasks:
-            self.task_response_times[task.id] = []
-            self.task_deadlines[task.id] = []
+        self._reset_task_stats()
 
         simulation_iteration = 0
         hyperperiod = self._get_hyperperiod()
-
-        while simulation_iteration < SIMULATION_ITERATIONS:
-            # Progress tracking every 10,000 iterations
-            if t % 10_000 == 0:
-                progress = (t % hyperperiod) / hyperperiod * 100
-                print(f"Time: {t}, Progress: {progress:.2f}%")
+        self._start_trace_iteration(simulation_iteration)
+        profiler = self.profiler
+        if self.progress is not None:
+            self.progress.start(iterations * hyperperiod, "Simulation")
+
+        while simulation_iteration < iterations:
+            if self.progress is not None:
+                self.progress.update(simulation_iteration * hyperperiod + t)
+            if profiler is not None:
+                profiler.count("simulate.ticks")
+                profiler.mark()
 
             # --- Phase 1 Release tasks ---
             for task in self.tasks:
                 if t % task.period == 0:
                     self.release_task(t, task)
+            if profiler is not None:
+                profiler.lap("simulate.release")
 
             # --- Phase 2: Reset budgets ---
             for component in self.components:
                 if t % component.period == 0:
                     component.remaining_budget = component.budget
+                    if self.trace is not None:
+                        self.trace.record(t, TraceEvent.REPLENISH, component)
+                    if profiler is not None:
+                        profiler.count("simulate.replenishments")
+            if profiler is not None:
+                profiler.lap("simulate.replenish")
 
             # --- Phase 3: Core-level scheduling ---
             for core in self.cores:
-                eligible_components = [
-                    c for c in self.components
-                    if c.core_id == core.id and c.remaining_budget > 0 and len(c.jobs_queue) > 0
-                ]
-
-                if not eligible_components:
+                next_component = self._select_component(core)
+                if self.trace is not None:
+                    self._trace_dispatch(t, core, next_component)
+                if next_component is None:
                     continue
+                if profiler is not None:
+                    profiler.count("simulate.dispatches")
 
-                if core.scheduler == Scheduler.EDF:
-                    next_component = min(
-                        eligible_components,
-                        key=lambda c: c.jobs_queue[0].absolute_deadline
-                    )
-                elif core.scheduler == Scheduler.RM:
-                    next_component = min(eligible_components, key=lambda c: c.priority)
+                srp = self._srp.get(next_component.id) if self._srp else None
+                if srp is None:
+                    job_to_run = next_component.jobs_queue.peek()
                 else:
-                    next_component = None
-
-                job_to_run = next_component.jobs_queue[0]
+                    job_to_run = srp.job_to_run(next_component.jobs_queue)
 
                 if job_to_run.remaining_time == job_to_run.execution_time:
                     job_to_run.start_time = t
+                if srp is not None:
+                    srp.dispatch(job_to_run)
 
                 job_to_run.remaining_time -= CLOCK_TICK
-                
+                if srp is not None:
+                    srp.advance(job_to_run, CLOCK_TICK)
+
                 if job_to_run.remaining_time <= 0:
+                    if profiler is not None:
+                        profiler.lap("simulate.schedule")
                     response_time = (t + CLOCK_TICK) - job_to_run.start_time
-                    self.task_response_times[job_to_run.task_id].append(response_time)
-                    self.task_deadlines[job_to_run.task_id].append(t <= job_to_run.absolute_deadline)
-                    _ = next_component.jobs_queue.pop(0)
+                    self.task_stats[job_to_run.task_id].add_response(
+                        response_time, t <= job_to_run.absolute_deadline)
+                    if srp is None:
+                        _ = next_component.jobs_queue.pop()
+                    else:
+                        next_component.jobs_queue.remove(job_to_run.task_id)
+                        srp.finish(job_to_run)
+                    if self.trace is not None:
+                        self._trace_completion(t + CLOCK_TICK, next_component, job_to_run,
+                                               t <= job_to_run.absolute_deadline, self.trace.defer)
+                    if profiler is not None:
+                        self._profile_completion(t <= job_to_run.absolute_deadline)
                 next_component.remaining_budget -= CLOCK_TICK
+                if self.trace is not None and next_component.remaining_budget <= 0:
+                    self.trace.defer(t + CLOCK_TICK, TraceEvent.EXHAUST, next_component)
+
+            if self.trace is not None:
+                self.trace.commit()
+            if profiler is not None:
+                profiler.lap("simulate.schedule")
 
             if t != 0 and t % hyperperiod == 0:
                 print(f"\nIteration {simulation_iteration} completed!")
@@ -101,6 +168,7 @@ class Simulator:
                 simulation_iteration += 1
                 t = 0
                 self._clear_component_queues()
+                self._start_trace_iteration(simulation_iteration)
             else:
                 t += CLOCK_TICK
 
@@ -108,6 +176,326 @@ class Simulator:
         print(f"Simulation finished. Total simulation time: {t}")
         print("-" * 50)
 
+    def run_event_driven(self, iterations: int = SIMULATION_ITERATIONS):
+        """Discrete-event version of `run`.
+
+        Instead of advancing one CLOCK_TICK at a time, time jumps straight to the
+        next instant at which the schedule can change: a task release, a budget
+        replenishment, a job completion or a budget exhaustion. Between two such
+        instants every core keeps running the same job, so the whole interval is
+        charged at once. The tick semantics of `run` are preserved exactly (each
+        iteration covers t = 0..hyperperiod inclusive), so both engines produce
+        the same `TaskResult` output.
+        """
+        print("Running event-driven simulation...")
+
+        self._reset_task_stats()
+
+        hyperperiod = self._get_hyperperiod()
+        if self.progress is not None:
+            self.progress.start(iterations * hyperperiod, "Simulation")
+
+        for simulation_iteration in range(iterations):
+            self._start_trace_iteration(simulation_iteration)
+            self._run_event_driven_iteration(hyperperiod, simulation_iteration)
+
+            print(f"\nIteration {simulation_iteration} completed!")
+            print(f"Summary:")
+            print(f"- Hyperperiod: {hyperperiod}")
+            print("-" * 50)
+            self._clear_component_queues()
+
+        print("-" * 50)
+        print(f"Simulation finished. Total simulation time: {hyperperiod * iterations}")
+        print("-" * 50)
+
+    def run_parallel(self, workers: int, iterations: int = SIMULATION_ITERATIONS,
+                     seed: int | None = None, engine: str = "tick"):
+        """Run the Monte Carlo iterations in a pool of worker processes.
+
+        The iterations are split into one chunk per worker. Every chunk runs on its own
+        copy of the simulator with an independent random stream spawned from `seed`, so
+        a given (seed, workers, iterations) triple is reproducible. The per-task statistics
+        of the chunks are merged, so `get_task_results` reports them exactly as for a single
+        run over the same jobs.
+
+        Args:
+            workers: Number of worker processes
+            iterations: Total number of hyperperiods to simulate
+            seed: Seed of the random streams (None draws fresh entropy)
+            engine: "tick" for `run`, "event" for `run_event_driven`
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        chunks = [iterations // workers + (1 if i < iterations % workers else 0) for i in range(workers)]
+        chunks = [chunk for chunk in chunks if chunk > 0]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+        self._clear_component_queues()
+        self._execution_times.clear()
+        self._reset_task_stats()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run_iterations, self, chunk, chunk_seed, engine)
+                for chunk, chunk_seed in zip(chunks, seeds)
+            ]
+            for future in futures:
+                for task_id, stats in future.result().items():
+                    self.task_stats[task_id].merge(stats)
+
+    def run_per_core(self, workers: int = 1, iterations: int = SIMULATION_ITERATIONS,
+                     seed: int | None = None, engine: str = "event"):
+        """Simulate every core as an independent subsystem.
+
+        Components are pinned to a core and cores never interact, so each core is split
+        off with its own components and tasks and simulated over its own hyperperiod
+        (SystemModel.core_hyperperiod, which includes the replenishment periods). This
+        avoids simulating the LCM across all cores when their period sets are unrelated.
+        Subsystems run concurrently in a process pool when workers > 1, each with an
+        independent random stream spawned from `seed`, and their task statistics are
+        merged afterwards.
+
+        Args:
+            workers: Number of worker processes (1 runs the cores one after another in-process)
+            iterations: Number of core hyperperiods to simulate per core
+            seed: Seed of the random streams (None draws fresh entropy)
+            engine: "tick" for `run`, "event" for `run_event_driven`
+
+        Raises:
+            ValueError: If workers is not positive
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        subsystems = [self._core_subsystem(core) for core in self.cores
+                      if self.model.components_by_core.get(core.id)]
+        seeds = np.random.SeedSequence(seed).spawn(len(subsystems))
+
+        self._clear_component_queues()
+        self._reset_task_stats()
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_run_iterations, subsystem, iterations, core_seed, engine)
+                    for subsystem, core_seed in zip(subsystems, seeds)
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [_run_iterations(subsystem, iterations, core_seed, engine)
+                       for subsystem, core_seed in zip(subsystems, seeds)]
+
+        for task_stats in results:
+            for task_id, stats in task_stats.items():
+                self.task_stats[task_id].merge(stats)
+        self._clear_component_queues()
+
+    def _core_subsystem(self, core: Core) -> "Simulator":
+        """
+        Build a simulator for a single core, sharing this simulator's (already speed-adjusted)
+        components and tasks and a copy of its sampler.
+        """
+        components = self.model.components_by_core[core.id]
+        tasks = [task for component in components for task in self.model.tasks_by_component[component.id]]
+        task_ids = {task.id for task in tasks}
+        subsystem = Simulator([core], components, tasks, copy.copy(self.sampler), wcet_adjusted=True,
+                              hyperperiod=self.model.core_hyperperiod(core.id),
+                              resources=[access for access in self.resources if access.task_id in task_ids])
+        subsystem.max_horizon = self.max_horizon
+        subsystem.truncate_horizon = self.truncate_horizon
+        return subsystem
+
+    def _run_event_driven_iteration(self, hyperperiod: int, iteration: int = 0):
+        """
+        Simulate a single hyperperiod with the event-driven engine.
+
+        Args:
+            hyperperiod: Length of the iteration. The instant t == hyperperiod is
+                simulated as well, mirroring the tick-based loop.
+            iteration: Index of the iteration (for progress reporting)
+        """
+        end = hyperperiod + CLOCK_TICK
+        profiler = self.profiler
+
+        # Pending releases and replenishments as (time, phase, index). The phase
+        # keeps releases before replenishments and the index keeps the task order
+        # of the tick-based loop for events at the same instant.
+        events = [(0, 0, idx) for idx in range(len(self.tasks))]
+        events += [(0, 1, idx) for idx in range(len(self.components))]
+        heapq.heapify(events)
+
+        t = 0
+        while t < end:
+            if self.progress is not None:
+                self.progress.update(iteration * hyperperiod + t)
+            if profiler is not None:
+                profiler.count("simulate.steps")
+                profiler.observe("event_queue", len(events))
+                profiler.mark()
+
+            # --- Phase 1 and 2: releases and budget replenishments due now ---
+            while events and events[0][0] == t:
+                _, phase, idx = heapq.heappop(events)
+                if phase == 0:
+                    task = self.tasks[idx]
+                    self.release_task(t, task)
+                    next_time = t + task.period
+                    if profiler is not None:
+                        profiler.lap("simulate.release")
+                else:
+                    component = self.components[idx]
+                    component.remaining_budget = component.budget
+                    if self.trace is not None:
+                        self.trace.record(t, TraceEvent.REPLENISH, component)
+                    next_time = t + component.period
+                    if profiler is not None:
+                        profiler.count("simulate.replenishments")
+                        profiler.lap("simulate.replenish")
+                if next_time < end:
+                    heapq.heappush(events, (next_time, phase, idx))
+
+            # --- Phase 3: pick a job per core and find the next event ---
+            next_t = events[0][0] if events else end
+            running = []
+            for core in self.cores:
+                component = self._select_component(core)
+                if self.trace is not None:
+                    self._trace_dispatch(t, core, component)
+                if component is None:
+                    continue
+                if profiler is not None:
+                    profiler.count("simulate.dispatches")
+
+                srp = self._srp.get(component.id) if self._srp else None
+                if srp is None:
+                    job = component.jobs_queue.peek()
+                else:
+                    job = srp.job_to_run(component.jobs_queue)
+                if job.remaining_time == job.execution_time:
+                    job.start_time = t
+
+                # Ticks until the job completes or the budget runs out
+                ticks = min(math.ceil(job.remaining_time / CLOCK_TICK),
+                            math.ceil(component.remaining_budget / CLOCK_TICK))
+                if srp is not None:
+                    # ...or the job acquires or releases a resource
+                    srp.dispatch(job)
+                    ticks = min(ticks, srp.ticks_to_next_change(job))
+                next_t = min(next_t, t + ticks * CLOCK_TICK)
+                running.append((component, job, srp))
+
+            next_t = min(next_t, end)
+            elapsed = next_t - t
+
+            if profiler is not None:
+                profiler.lap("simulate.schedule")
+
+            # --- Phase 4: charge the elapsed interval to the running jobs ---
+            for component, job, srp in running:
+                job.remaining_time -= elapsed
+                if srp is not None:
+                    srp.advance(job, elapsed)
+                if job.remaining_time <= 0:
+                    response_time = next_t - job.start_time
+                    self.task_stats[job.task_id].add_response(
+                        response_time, next_t - CLOCK_TICK <= job.absolute_deadline)
+                    if srp is None:
+                        _ = component.jobs_queue.pop()
+                    else:
+                        component.jobs_queue.remove(job.task_id)
+                        srp.finish(job)
+                    if self.trace is not None:
+                        self._trace_completion(next_t, component, job,
+                                               next_t - CLOCK_TICK <= job.absolute_deadline, self.trace.record)
+                    if profiler is not None:
+                        self._profile_completion(next_t - CLOCK_TICK <= job.absolute_deadline)
+                component.remaining_budget -= elapsed
+                if self.trace is not None and component.remaining_budget <= 0:
+                    self.trace.record(next_t, TraceEvent.EXHAUST, component)
+            if profiler is not None:
+                profiler.lap("simulate.schedule")
+
+            t = next_t
+
+    def _start_trace_iteration(self, iteration: int):
+        """Stamp the following trace events with the iteration; queues start empty."""
+        if self.trace is not None:
+            self.trace.iteration = iteration
+            self._trace_running.clear()
+
+    def _trace_dispatch(self, t: int, core: Core, component: Component | None):
+        """
+        Record the dispatch decision of a core: START when a different job runs than
+        before, preceded by PREEMPT if the previous job is still pending.
+        """
+        job = None
+        if component is not None:
+            srp = self._srp.get(component.id)
+            job = component.jobs_queue.peek() if srp is None else srp.job_to_run(component.jobs_queue)
+        previous = self._trace_running.get(core.id)
+        if previous is not None and previous[1] is job:
+            return
+
+        if previous is not None:
+            previous_component, previous_job = previous
+            if (previous_job.remaining_time > 0 and
+                    previous_component.jobs_queue.get(previous_job.task_id) is previous_job):
+                self.trace.record(t, TraceEvent.PREEMPT, previous_component, previous_job.task_id)
+
+        if job is None:
+            self._trace_running.pop(core.id, None)
+        else:
+            self._trace_running[core.id] = (component, job)
+            self.trace.record(t, TraceEvent.START, component, job.task_id)
+
+    def _trace_completion(self, t: int, component: Component, job: Job, deadline_met: bool, record):
+        record(t, TraceEvent.COMPLETE, component, job.task_id)
+        if not deadline_met:
+            record(t, TraceEvent.DEADLINE_MISS, component, job.task_id)
+
+    def _profile_completion(self, deadline_met: bool):
+        self.profiler.count("simulate.completions")
+        if not deadline_met:
+            self.profiler.count("simulate.deadline_misses")
+        self.profiler.lap("simulate.complete")
+
+    def _select_component(self, core: Core) -> Component | None:
+        """
+        Pick the component that runs next on a core.
+
+        Only components with budget left and at least one pending job are eligible.
+        EDF cores pick the component whose head job has the earliest deadline,
+        RM cores pick the component with the highest priority (lowest value).
+
+        Args:
+            core: The core to schedule
+
+        Returns:
+            Component | None: The selected component, or None if the core is idle
+        """
+        eligible_components = [
+            c for c in self.model.components_by_core[core.id]
+            if c.remaining_budget > 0 and len(c.jobs_queue) > 0
+        ]
+
+        if not eligible_components:
+            return None
+
+        scheduler = self.model.scheduler_by_core[core.id]
+        if scheduler == Scheduler.EDF:
+            return min(
+                eligible_components,
+                key=lambda c: c.jobs_queue.peek().absolute_deadline
+            )
+        if scheduler == Scheduler.RM:
+            # Components without a priority come last
+            return min(eligible_components,
+                       key=lambda c: c.priority if c.priority is not None else math.inf)
+        return None
+
     def generate_output_file(self, filename: str):
         """Generate a CSV output file with task simulation results.
 
@@ -119,13 +507,15 @@ class Simulator:
         # Create CSV file
         with open(filename, 'w') as f:
             # Write header
-            f.write("Task,Component,Task Schedulable,Avg Response Time,Max Response Time,Component Schedulable\n")
+            f.write("Task,Component,Task Schedulable,Avg Response Time,Max Response Time,Component Schedulable,"
+                    "P50 Response Time,P99 Response Time,P99.9 Response Time\n")
 
             # Write data for each task
             for result in task_results:
                 f.write(f"{result.task_name},{result.component_id},{result.task_schedulable},"
                         f"{result.avg_response_time:.2f},{result.max_response_time:.2f},"
-                        f"{result.component_schedulable}\n")
+                        f"{result.component_schedulable},{result.p50_response_time:.2f},"
+                        f"{result.p99_response_time:.2f},{result.p999_response_time:.2f}\n")
 
     def _release_jobs_if_due(self, current_time: int):
         """
@@ -136,10 +526,7 @@ class Simulator:
         for task in self.tasks: # self.tasks stores Task templates
             if current_time % task.period == 0:
                 # 1. Get the component for this task template
-                component = next(
-                    (c for c in self.components if c.id == task.component_id),
-                    None
-                )
+                component = self.model.component_by_id.get(task.component_id)
                 if not component:
                     raise(f"Warning: Component {task.component_id} not found for task {task.id}")
 
@@ -152,14 +539,11 @@ class Simulator:
         Adjust the WCET of tasks based on the speed factor of the core they are assigned to.
         """
         for component in self.components:
-            core = next((c for c in self.cores if c.id == component.core_id), None)
+            core = self.model.core_of(component)
             if not core:
                 continue
 
-            for task in self.tasks:
-                if task.component_id != component.id:
-                    continue
-
+            for task in self.model.tasks_by_component[component.id]:
                 # Adjust WCET based on the speed factor of the core
                 task.wcet = task.wcet / core.speed_factor
                 task.remaining_time = task.wcet
@@ -171,52 +555,24 @@ class Simulator:
         for component in self.components:
             component.jobs_queue.clear()
             component.remaining_budget = component.budget
+        for srp in self._srp.values():
+            srp.clear()
 
     def _generate_execution_time(self, task:Task):
         """
-        Generate execution time for each task based on its WCET and the speed factor of the core.
-        """
-        # Avionics (DO-178C): Typically ≥80% to ensure strict deadline guarantees.
-        lower_bound = task.wcet * LOWER_BOUND_PERCENTAGE
-        return self._generate_normal_exec_time(lower_bound, task.wcet)
+        Return the execution time of the next job of a task.
 
-    def _generate_normal_exec_time(self,lower_bound, wcet):
-        """
-        Generate execution time following a normal distribution bounded between WCET and lower_bound.
-
-        The function uses a normal distribution with:
-        - mean: average of WCET and lower_bound ((wcet + lower_bound)/2)
-        - standard deviation: (wcet - lower_bound)/6 to ensure ~99.7% of values fall within ±3σ
-
-        The while loop ensures the generated execution time stays within the specified bounds
-        by rejecting and regenerating values that fall outside [lower_bound, wcet].
-
-        Parameters
-        ----------
-        wcet : float
-            Worst Case Execution Time - upper bound for execution time
-        lower_bound : float
-            Minimum possible execution time - lower bound
-
-        Returns
-        -------
-        float
-            A randomly generated execution time that follows a normal distribution
-            and falls between lower_bound and wcet inclusive
-
-        Notes
-        -----
-        - Using (wcet - lower_bound)/6 as std dev ensures most values (~99.7%)
-          fall within the desired range, minimizing rejections in the while loop
-        - The distribution is symmetrical around the mean, creating a bell curve
-          between lower_bound and wcet
+        Execution times are pre-drawn by the sampler in one vectorized call covering all
+        releases of the task in a hyperperiod (capped at SAMPLE_BATCH_LIMIT); a new batch
+        is drawn when the previous one is used up.
         """
-        mean = (wcet + lower_bound) / 2
-        std_dev = (wcet - lower_bound) / 6
-        while True:  # Ensure value stays within bounds
-            exec_time = np.random.normal(mean, std_dev)
-            if lower_bound <= exec_time <= wcet:
-                return exec_time
+        samples = self._execution_times.get(task.id)
+        if not samples:
+            count = min(self._get_hyperperiod() // task.period + 1, SAMPLE_BATCH_LIMIT)
+            # Reversed so that pop() hands out the samples in draw order
+            samples = self.sampler.sample(task, int(count))[::-1].tolist()
+            self._execution_times[task.id] = samples
+        return samples.pop()
 
     def _is_core_empty(self, core_id):
         """
@@ -230,61 +586,46 @@ class Simulator:
         """
         return all(
             len(component.jobs_queue) == 0
-            for component in self.components
-            if component.core_id == core_id
+            for component in self.model.components_by_core.get(core_id, [])
         )
 
     def release_task(self, t: int, task: Task):
         """Releases a single task if its period is met."""
-        component = next(c for c in self.components if c.id == task.component_id)
-        existing_job = next(
-            (j for j in component.jobs_queue if j.task_id == task.id),
-            None
-        )
+        component = self.model.component_of(task)
+        existing_job = component.jobs_queue.get(task.id)
+        if existing_job and self._srp and component.id in self._srp:
+            # The replaced job leaves the component with the resources it holds
+            self._srp[component.id].finish(existing_job)
         if existing_job:
-            self.task_deadlines[task.id].append(
-                t <= existing_job.absolute_deadline and
-                existing_job.remaining_time <= 0
-            )
-            
+            deadline_met = t <= existing_job.absolute_deadline and existing_job.remaining_time <= 0
+            self.task_stats[task.id].add_deadline(deadline_met)
+            if self.trace is not None and not deadline_met:
+                self.trace.record(t, TraceEvent.DEADLINE_MISS, component, task.id)
+            if self.profiler is not None and not deadline_met:
+                self.profiler.count("simulate.deadline_misses")
+
         execution_time = self._generate_execution_time(task)
         job = Job(task, t, execution_time)
         job.release_time = t
-        # component = next(c for c in self.components if c.id == task.component_id) # Already found
         self._schedule(t, component, job)
+        if self.trace is not None:
+            self.trace.record(t, TraceEvent.RELEASE, component, task.id)
+        if self.profiler is not None:
+            self.profiler.count("simulate.releases")
+            self.profiler.observe(f"ready_queue.{component.id}", len(component.jobs_queue))
 
     def _schedule(self, current_time: int, component: Component, job: Job):
         """
         Schedule the tasks for a given component based on its scheduling policy.
-        First removes any existing instance of the task from queue before scheduling new instance.
+        The component's ready queue replaces any existing instance of the task
+        with the new one.
 
         Args:
             current_time: Current simulation time
             component: The component whose tasks are to be scheduled
-            task: Task to be scheduled
+            job: Job to be scheduled
         """
-        # Remove existing instance of task if present
-        component.jobs_queue = [j for j in component.jobs_queue if j.task_id != job.task_id]
-
-        insert_idx = 0
-        match component.scheduler:
-            case Scheduler.RM:
-                # Rate Monotonic: Insert based on priority (lower value = higher priority)
-                for idx, queue_job in enumerate(component.jobs_queue):
-                    if job.priority > queue_job.priority:
-                        insert_idx = idx + 1
-            case Scheduler.EDF:
-                deadline_new = job.absolute_deadline
-                
-                insert_idx = 0
-                for idx, queue_job in enumerate(component.jobs_queue):
-                    deadline_queued = queue_job.absolute_deadline
-                    if deadline_new > deadline_queued:
-                        insert_idx = idx + 1
-            case _:
-                raise ValueError(f"Unknown scheduling policy: {component.scheduler}")
-
-        component.jobs_queue.insert(insert_idx, job)
+        component.jobs_queue.push(job)
 
     def get_task_results(self) -> list[TaskResult]:
         """Get the simulation results for all tasks.
@@ -292,84 +633,163 @@ class Simulator:
         Returns:
             List[TaskResult]: Results for each task including response times and schedulability.
         """
+        # A component is schedulable if all its tasks are schedulable
+        component_schedulable_by_id = {
+            component_id: all(self.task_stats[t.id].all_deadlines_met for t in component_tasks)
+            for component_id, component_tasks in self.model.tasks_by_component.items()
+        }
+
         results = []
         for task in self.tasks:
-            response_times = self.task_response_times.get(task.id, [])
-            deadline_flags = self.task_deadlines.get(task.id, [])
-
-            if response_times:
-                avg_response = sum(response_times) / len(response_times)
-                max_response = max(response_times)
-                # Task is schedulable only if ALL instances met their deadlines
-                task_schedulable = all(deadline_flags)
-            else:
-                avg_response = 0.0
-                max_response = 0.0
-                task_schedulable = False
-
-            # Get component for this task
-            component = next(c for c in self.components if c.id == task.component_id)
-
-            # A component is schedulable if all its tasks are schedulable
-            component_tasks = [t for t in self.tasks if t.component_id == component.id]
-            component_schedulable = all(
-                all(self.task_deadlines.get(t.id, []))
-                for t in component_tasks
-            )
+            stats = self.task_stats[task.id]
 
             results.append(TaskResult(
                 task_name=task.id,
                 component_id=task.component_id,
-                task_schedulable=task_schedulable,
-                avg_response_time=avg_response,
-                max_response_time=max_response,
-                component_schedulable=component_schedulable
+                # Task is schedulable only if ALL instances met their deadlines
+                task_schedulable=stats.count > 0 and stats.all_deadlines_met,
+                avg_response_time=stats.mean,
+                max_response_time=stats.max,
+                component_schedulable=component_schedulable_by_id[task.component_id],
+                p50_response_time=stats.quantile(0.5),
+                p99_response_time=stats.quantile(0.99),
+                p999_response_time=stats.quantile(0.999),
             ))
 
         return results
 
+    def _reset_task_stats(self):
+        """
+        Start a fresh statistics accumulator for every task.
+        """
+        for task in self.tasks:
+            self.task_stats[task.id] = ResponseTimeStats()
+
     def _get_hyperperiod(self):
-        """Calculate the system hyperperiod hierarchically.
-        First calculates the hyperperiod (LCM) of tasks within each component,
-        then calculates the LCM of all component hyperperiods.
+        """Return the simulated horizon: the system hyperperiod (see SystemModel.hyperperiod).
 
-        Example:
-            Component1 has tasks with periods [2,3]  -> LCM = 6
-            Component2 has tasks with periods [2,4]  -> LCM = 4
-            System hyperperiod = LCM(6,4) = 12
+        Hyperperiods above `max_horizon` are refused with the horizon plan (cost estimate,
+        truncation and harmonization suggestions) unless `truncate_horizon` is set, in
+        which case `max_horizon` is simulated instead.
 
         Returns:
             int: The hyperperiod value for the entire system
         """
-        # Calculate hyperperiod for each component
-        component_hyperperiods = []
-        for component in self.components:
-            # Get all tasks for this component
-            component_tasks = [task for task in self.tasks if task.component_id == component.id]
-            if not component_tasks:
-                # If component has no tasks, use its own period
-                component_hyperperiods.append(component.period)
-                continue
-
-            # Calculate LCM of task periods within this component
-            task_periods = [task.period for task in component_tasks]
-            component_lcm = task_periods[0]
-            for period in task_periods[1:]:
-                component_lcm = (component_lcm * period) // np.gcd(component_lcm, period)
-            component_hyperperiods.append(component_lcm)
-
-        # Calculate system hyperperiod as LCM of component hyperperiods
-        system_hyperperiod = component_hyperperiods[0]
-        for period in component_hyperperiods[1:]:
-            system_hyperperiod = (system_hyperperiod * period) // np.gcd(system_hyperperiod, period)
-
-        return system_hyperperiod
+        if self._hyperperiod is None:
+            self._hyperperiod = self.model.hyperperiod()
+        if self._hyperperiod > self.max_horizon:
+            if not self.truncate_horizon:
+                raise ValueError(
+                    "Simulation horizon too long; pass a larger max_horizon or truncate it.\n"
+                    + self.plan_horizon().describe()
+                )
+            return self.max_horizon
+        return self._hyperperiod
+
+    def plan_horizon(self, iterations: int = SIMULATION_ITERATIONS) -> HorizonPlan:
+        """Horizon plan of the simulated system (see common.horizon.plan_horizon)."""
+        return plan_horizon(self.model, iterations, self.max_horizon)
+
+def _run_iterations(simulator: Simulator, iterations: int, seed: np.random.SeedSequence, engine: str):
+    """Worker entry point of `Simulator.run_parallel`: run a chunk of iterations on a private copy."""
+    simulator.sampler.rng = np.random.default_rng(seed)
+    if engine == "event":
+        simulator.run_event_driven(iterations)
+    else:
+        simulator.run(iterations)
+    return simulator.task_stats
 
 def main():
-    cores, components, tasks = read_csv()
-
-    simulator = Simulator(cores, components, tasks)
-    simulator.run()
+    parser = argparse.ArgumentParser(description="Simulate a hierarchical real-time system.")
+    parser.add_argument("architecture", help="Path to architecture.csv")
+    parser.add_argument("budgets", help="Path to budgets.csv")
+    parser.add_argument("tasks", help="Path to tasks.csv")
+    parser.add_argument("--engine", choices=["tick", "event"], default="tick",
+                        help="Advance time tick by tick or jump between scheduling events")
+    parser.add_argument("--distribution", choices=sorted(SAMPLERS), default="normal",
+                        help="Distribution of the job execution times")
+    parser.add_argument("--lower-bound", type=float, default=LOWER_BOUND_PERCENTAGE,
+                        help="Best case execution time as a fraction of the WCET")
+    parser.add_argument("--traces", help="CSV of observed execution times (task_name,execution_time) "
+                                         "for the empirical distribution")
+    parser.add_argument("--seed", type=int, help="Seed of the random number generator")
+    parser.add_argument("--iterations", type=int, default=SIMULATION_ITERATIONS,
+                        help="Number of hyperperiods to simulate")
+    parser.add_argument("--workers", type=positive_int, default=1,
+                        help="Run the iterations in a pool of this many processes")
+    parser.add_argument("--per-core", action="store_true",
+                        help="Simulate each core separately over its own hyperperiod (in parallel with --workers)")
+    parser.add_argument("--max-horizon", type=int, default=MAX_SIMULATION_HORIZON,
+                        help="Longest hyperperiod simulated in full")
+    parser.add_argument("--truncate", action="store_true",
+                        help="Simulate --max-horizon time units when the hyperperiod is longer instead of refusing")
+    parser.add_argument("--plan", action="store_true",
+                        help="Print the horizon plan (hyperperiods and cost estimates) and exit")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Record the scheduling events into a binary trace (see common.trace.TraceReader)")
+    parser.add_argument("--profile", metavar="REPORT_JSON",
+                        help="Write phase timers, event counters and queue high-water marks to a JSON report")
+    parser.add_argument("--progress", action="store_true", help="Report progress on the console every second")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE_DIR, metavar="CACHE_DIR",
+                        help="Load the system through the content-hashed model cache")
+    parser.add_argument("--resources", metavar="RESOURCES_CSV",
+                        help="Critical sections of the tasks (task_name,resource_id,start,end), arbitrated with SRP")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.distribution == "empirical":
+        if args.traces is None:
+            parser.error("--distribution empirical requires --traces")
+        sampler = EmpiricalSampler.from_csv(args.traces, args.lower_bound, rng)
+    else:
+        sampler = SAMPLERS[args.distribution](args.lower_bound, rng)
+
+    resources = read_resources(args.resources) if args.resources else None
+    if args.cache:
+        system = load_system(args.architecture, args.budgets, args.tasks, args.cache)
+        simulator = Simulator(system.cores, system.components, system.tasks, sampler,
+                              wcet_adjusted=True, hyperperiod=system.hyperperiod, resources=resources)
+    else:
+        cores, components, tasks = read_csv(args.architecture, args.budgets, args.tasks)
+        simulator = Simulator(cores, components, tasks, sampler, resources=resources)
+
+    simulator.max_horizon = args.max_horizon
+    simulator.truncate_horizon = args.truncate
+
+    plan = simulator.plan_horizon(args.iterations)
+    if args.plan:
+        print(plan.describe())
+        return
+    if not plan.feasible:
+        if not args.truncate:
+            print(plan.describe())
+            parser.error("hyperperiod exceeds --max-horizon; pass --truncate or a larger --max-horizon")
+        print(f"Warning: simulating a truncated horizon of {plan.truncated_horizon} "
+              f"({plan.coverage:.2e} of the hyperperiod)")
+
+    if (args.trace or args.profile) and (args.per_core or args.workers > 1):
+        parser.error("--trace and --profile instrument a single-process run; drop --per-core and --workers")
+    if args.trace:
+        simulator.trace = TraceRecorder(args.trace, simulator.model)
+    if args.profile:
+        simulator.profiler = Profiler()
+    if args.progress:
+        simulator.progress = ProgressReporter()
+
+    if args.per_core:
+        simulator.run_per_core(args.workers, args.iterations, args.seed, args.engine)
+    elif args.workers > 1:
+        simulator.run_parallel(args.workers, args.iterations, args.seed, args.engine)
+    elif args.engine == "event":
+        simulator.run_event_driven(args.iterations)
+    else:
+        simulator.run(args.iterations)
+
+    if simulator.trace is not None:
+        simulator.trace.close()
+        print(f"Trace: {simulator.trace.count} events written to {args.trace}")
+    if simulator.profiler is not None:
+        simulator.profiler.write_json(args.profile)
 
     simulator.generate_output_file("simulation_solution.csv")
 
@@ -0,0 +1,217 @@
+import numpy as np
+import pytest
+
+from analysis import DemandCurve, critical_time_points, minimal_budget, qpa_edf_test
+from common.BDR import BDR
+from common.DBF import DBF
+from common.scheduler import Scheduler
+from common.task import Task
+
+
+def test_qpa_matches_brute_force_demand_check():
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        periods = rng.choice([10, 20, 25, 40, 50, 100], size=rng.integers(1, 6)).astype(float)
+        wcets = np.maximum(1, np.round(periods * rng.uniform(0.01, 0.2, size=periods.size)))
+        supply = BDR(rate=rng.uniform(0.3, 1.0), delay=float(rng.integers(0, 30)))
+
+        # Check every deadline up to a generous multiple of the hyperperiod
+        time_points = critical_time_points(periods, 2000)
+        expected = bool(np.all(DBF.dbf_edf_vec(periods, wcets, time_points) <= supply.sbf_vec(time_points)))
+        if np.sum(wcets / periods) > supply.rate:
+            expected = False
+
+        assert qpa_edf_test(periods, wcets, supply) == expected
+
+
+def test_minimal_budget_is_the_smallest_passing_budget():
+    tasks = [Task("Task_0", wcet=1, period=25, component_id="C", priority=0),
+             Task("Task_1", wcet=2, period=50, component_id="C", priority=1),
+             Task("Task_2", wcet=4, period=100, component_id="C", priority=2)]
+    for scheduler in (Scheduler.RM, Scheduler.EDF):
+        curve = DemandCurve(tasks, scheduler)
+        for period in (5, 10, 20):
+            budget = minimal_budget(curve, period)
+            passes = lambda Q: curve.is_schedulable(BDR(rate=Q/period, delay=2*(period-Q)))
+            assert passes(budget)
+            assert not passes(budget - 1)
+
+
+def test_analysis_session_matches_full_reanalysis_after_edits():
+    import copy
+
+    from analysis import AnalysisSession, analyze
+    from common.component import Component
+    from common.csvreader import read_budgets, read_cores, read_tasks
+
+    case = "data/custom/15-med-onecore"
+    cores = read_cores(f"{case}/architecture.csv")
+    budgets = read_budgets(f"{case}/budgets.csv")
+    tasks = read_tasks(f"{case}/tasks.csv")
+    session = AnalysisSession(cores, budgets, tasks)
+
+    def full():
+        # Full pipeline on the same (nominal) system
+        return analyze(cores, copy.deepcopy(budgets), copy.deepcopy(tasks))
+
+    def check():
+        components, core_summary = full()
+        assert {cid: c['schedulable'] for cid, c in components.items()} == \
+               {cid: c['schedulable'] for cid, c in session.components.items()}
+        assert core_summary == session.core_summary
+
+    check()
+
+    # A budget change re-checks only its own component, on the cached demand curve
+    curve = session._curves[budgets[0].id]
+    result = session.change_budget(budgets[0].id, budget=budgets[0].budget + 1)
+    assert set(result['components']) == {budgets[0].id}
+    assert session._curves[budgets[0].id] is curve
+    budgets[0].budget += 1
+    check()
+
+    session.update_task(tasks[0].id, wcet=tasks[0].wcet * 3)
+    tasks[0].wcet *= 3
+    check()
+
+    target = budgets[-1].id
+    session.move_task(tasks[1].id, target)
+    tasks[1].component_id = target
+    check()
+
+    extra = Component("Extra", Scheduler.EDF, 2, 10, budgets[0].core_id, None)
+    extra_task = Task("Task_extra", wcet=1, period=20, component_id="Extra", priority=None)
+    result = session.add_component(extra, [extra_task])
+    assert set(result['components']) == {"Extra"}
+    budgets.append(extra)
+    tasks.append(extra_task)
+    check()
+
+
+def test_analysis_session_rejects_invalid_edits_without_changing_state():
+    import copy
+
+    import pytest
+
+    from analysis import AnalysisSession
+    from common.csvreader import read_budgets, read_cores, read_tasks
+
+    case = "data/custom/15-med-onecore"
+    tasks = read_tasks(f"{case}/tasks.csv")
+    session = AnalysisSession(read_cores(f"{case}/architecture.csv"), read_budgets(f"{case}/budgets.csv"), tasks)
+
+    def state():
+        return (copy.deepcopy(session.components), {cid: (b.budget, b.period) for cid, b in session.budgets.items()},
+                {tid: (t.component_id, t.wcet) for tid, t in session.tasks.items()}, dict(session.core_summary))
+
+    before = state()
+    with pytest.raises(ValueError):
+        session.move_task(tasks[0].id, "No_such_component")
+    component_id = tasks[0].component_id
+    budget, period = session.components[component_id]['budget'], session.components[component_id]['period']
+    for edit in ({'budget': -1}, {'period': 0}, {'budget': period + 1}, {'budget': budget, 'period': budget - 1}):
+        with pytest.raises(ValueError):
+            session.change_budget(component_id, **edit)
+    with pytest.raises(ValueError):
+        session.change_budget("No_such_component", budget=1)
+    assert state() == before
+
+
+def test_edf_response_times_match_brute_force_over_long_horizon():
+    import math
+
+    from analysis import edf_response_times
+    from common.PRM import PRM
+
+    def brute_force(periods, wcets, supply):
+        # Deadline shift over every deadline of several hyperperiods
+        horizon = max(4 * math.lcm(*periods.astype(int)), 2000)
+        points = critical_time_points(periods, horizon)
+        delta = np.min(points - supply.sbf_inverse_vec(DBF.dbf_edf_vec(periods, wcets, points)))
+        if delta < 0:
+            return np.full(periods.size, math.inf)
+        return np.maximum(periods - delta, supply.sbf_inverse_vec(wcets))
+
+    # Demand at t = 24, past the largest period, sets the bound of the period-12 task
+    periods, wcets = np.array([12.0, 23.0, 8.0, 11.0]), np.array([3.1, 3.5, 2.4, 1.3])
+    supply = BDR(rate=1.0, delay=0.0)
+    response = edf_response_times(periods, wcets, supply, critical_time_points(periods, periods.max()))
+    assert response[0] == pytest.approx(7.5)
+    assert np.allclose(response, brute_force(periods, wcets, supply))
+
+    rng = np.random.default_rng(11)
+    for _ in range(300):
+        periods = rng.choice([8, 11, 12, 23, 30], size=rng.integers(1, 5)).astype(float)
+        wcets = np.round(periods * rng.uniform(0.02, 0.3, size=periods.size), 1)
+        P = int(rng.integers(2, 8))
+        Q = int(rng.integers(1, P + 1))
+        for supply in (BDR(rate=Q / P, delay=2 * (P - Q)), PRM(Q, P)):
+            response = edf_response_times(periods, wcets, supply, critical_time_points(periods, periods.max()))
+            expected = brute_force(periods, wcets, supply)
+            assert np.array_equal(np.isinf(response), np.isinf(expected))
+            finite = np.isfinite(expected)
+            assert np.allclose(response[finite], expected[finite])
+
+
+def test_response_time_bounds_cover_simulated_response_times():
+    import contextlib
+    import io
+    import math
+
+    from common.component import Component
+    from common.core import Core
+    from simulator import Simulator
+
+    rng = np.random.default_rng(3)
+    bounded = 0
+    for _ in range(40):
+        scheduler = Scheduler.RM if rng.random() < 0.5 else Scheduler.EDF
+        periods = rng.choice([10, 20, 40, 50, 100], size=rng.integers(1, 4))
+        wcets = np.maximum(1, np.round(periods * rng.uniform(0.02, 0.15, periods.size)))
+        ranks = np.argsort(np.argsort(periods, kind="stable"))
+        tasks = [Task(f"Task_{i}", wcet=int(wcets[i]), period=int(periods[i]), component_id="C",
+                      priority=int(ranks[i]) if scheduler == Scheduler.RM else None)
+                 for i in range(periods.size)]
+        P = int(rng.choice([2, 4, 5]))
+        Q = int(rng.integers(1, P + 1))
+        component = Component("C", scheduler, Q, P, "Core_1", None)
+
+        ordered = sorted(tasks, key=lambda t: t.priority) if scheduler == Scheduler.RM else tasks
+        curve = DemandCurve(ordered, scheduler)
+        supply = BDR(rate=Q/P, delay=2*(P-Q))
+        bounds = dict(zip((t.id for t in ordered), curve.response_times(supply)))
+        if curve.is_schedulable(supply):
+            assert all(math.isfinite(bound) for bound in bounds.values())
+
+        simulator = Simulator([Core("Core_1", 1.0, Scheduler.EDF)], [component], tasks)
+        with contextlib.redirect_stdout(io.StringIO()):
+            simulator.run(2)
+        for result in simulator.get_task_results():
+            bound = bounds[result.task_name]
+            if math.isfinite(bound):
+                bounded += 1
+                assert result.task_schedulable
+                assert result.max_response_time <= bound
+    assert bounded > 0
+
+
+def test_report_names_the_supply_and_leaves_unbounded_response_times_empty(tmp_path, capsys):
+    import csv
+
+    from analysis import analyze, output_report, write_solution_csv
+    from common.component import Component
+    from common.core import Core
+
+    cores = [Core("Core_1", 1.0, Scheduler.EDF)]
+    budgets = [Component("C", Scheduler.EDF, 1, 4, "Core_1", None)]
+    tasks = [Task("Task_0", wcet=3, period=5, component_id="C", priority=None)]
+    components, core_summary = analyze(cores, budgets, tasks, supply_model='prm')
+
+    output_report(components, core_summary, 'prm')
+    report = capsys.readouterr().out
+    assert "exact sbf(rate=0.2500,blackout=6.00)" in report and "BLB" not in report
+
+    path = tmp_path / "solution.csv"
+    write_solution_csv(tasks, components, str(path), 'prm')
+    with open(path, newline='') as f:
+        assert [row['worst_case_response_time'] for row in csv.DictReader(f)] == ['']
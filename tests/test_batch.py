@@ -0,0 +1,10 @@
+from batch import discover_cases, run_batch
+
+
+def test_batch_runner_processes_every_custom_case():
+    cases = discover_cases(["data/custom"])
+    assert len(cases) == 5
+
+    results = run_batch(cases, workers=1, iterations=1)
+    assert all("error" not in result for result in results)
+    assert all(result["analysis"]["cores"] and result["simulation"]["tasks"] for result in results)
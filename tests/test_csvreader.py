@@ -0,0 +1,33 @@
+from common.csvreader import iter_tasks, read_budgets, read_tasks
+
+TASKS = """task_name,wcet,period,component_id,priority
+Task_0,1,10,A,0
+Task_1,2.5,20,A,
+Task_2,3,30,B,1.0
+Task_3,1,40,B,2
+Task_4,2,50,C,
+Task_5,1,60,C,
+Task_6,4,70,C,3
+"""
+
+
+def test_iter_tasks_streams_chunks_in_file_order(tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text(TASKS)
+
+    chunks = list(iter_tasks(str(path), chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [task for chunk in chunks for task in chunk] == read_tasks(str(path))
+    assert [task.id for chunk in chunks for task in chunk] == [f"Task_{i}" for i in range(7)]
+    assert list(iter_tasks(str(path), chunk_size=100))[0][1].wcet == 2.5
+
+
+def test_blank_and_missing_priorities_become_none(tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text(TASKS)
+    assert [task.priority for task in read_tasks(str(path))] == [0, None, 1, 2, None, None, 3]
+
+    # A budgets file without a priority column at all
+    budgets = tmp_path / "budgets.csv"
+    budgets.write_text("component_id,scheduler,budget,period,core_id\nA,EDF,2,10,Core_1\n")
+    assert read_budgets(str(budgets))[0].priority is None
@@ -0,0 +1,31 @@
+import numpy as np
+
+from common.BDR import BDR
+from common.DBF import DBF
+from common.task import Task
+
+
+def _random_tasks(seed, count=20):
+    rng = np.random.default_rng(seed)
+    return [Task(f"Task_{i}", wcet=float(rng.integers(1, 10)), period=int(rng.integers(10, 200)),
+                 component_id="C", priority=i) for i in range(count)]
+
+
+def test_vectorized_dbf_matches_scalar_dbf():
+    tasks = _random_tasks(0)
+    periods, wcets = DBF.task_arrays(tasks)
+    intervals = np.arange(0, 500, 7)
+
+    assert np.allclose(DBF.dbf_edf_vec(periods, wcets, intervals),
+                       [DBF.dbf_edf(tasks, t) for t in intervals])
+    assert np.allclose(DBF.dbf_edf_explicit_vec(periods, wcets, periods, intervals),
+                       [DBF.dbf_edf_explicit(tasks, t) for t in intervals])
+    for index in (0, 5, 19):
+        assert np.allclose(DBF.dbf_rm_vec(periods, wcets, index, intervals),
+                           [DBF.dbf_rm(tasks, t, index) for t in intervals])
+
+
+def test_vectorized_sbf_matches_scalar_sbf():
+    supply = BDR(rate=0.4, delay=6)
+    intervals = np.linspace(0, 50, 101)
+    assert np.allclose(supply.sbf_vec(intervals), [supply.sbf(t) for t in intervals])
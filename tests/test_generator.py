@@ -0,0 +1,40 @@
+import math
+
+import numpy as np
+
+from common.csvreader import read_budgets, read_cores, read_tasks
+from generator import generate_system, uunifast, write_system
+
+
+def test_uunifast_rows_sum_to_their_utilization():
+    rng = np.random.default_rng(0)
+    totals = rng.uniform(0.1, 0.9, 100)
+    shares = uunifast(rng, totals, 7)
+    assert shares.shape == (100, 7)
+    assert np.all(shares >= 0)
+    assert np.allclose(shares.sum(axis=1), totals)
+
+
+def test_generation_is_deterministic_and_round_trips_through_csv(tmp_path):
+    first = generate_system(cores=3, components_per_core=2, tasks_per_component=4, seed=7)
+    second = generate_system(cores=3, components_per_core=2, tasks_per_component=4, seed=7)
+    assert first[2] == second[2] and first[0] == second[0]
+
+    cores, components, tasks = first
+    write_system(str(tmp_path), cores, components, tasks)
+    assert read_cores(str(tmp_path / "architecture.csv")) == cores
+    assert read_tasks(str(tmp_path / "tasks.csv")) == tasks
+    loaded = read_budgets(str(tmp_path / "budgets.csv"))
+    assert [(c.id, c.budget, c.period, c.core_id, c.priority) for c in loaded] == \
+           [(c.id, c.budget, c.period, c.core_id, c.priority) for c in components]
+
+
+def test_harmonic_periods_bound_the_hyperperiod():
+    cores, components, tasks = generate_system(cores=4, components_per_core=5, tasks_per_component=50,
+                                               periods="harmonic", period_range=(10, 5000), seed=1)
+    periods = [t.period for t in tasks] + [c.period for c in components]
+    assert len(tasks) == 1000
+    assert math.lcm(*periods) == max(periods) <= 5000
+    assert all(1 <= c.budget <= c.period for c in components)
+    schedulers = {c.id: c.scheduler.name for c in components}
+    assert all((t.priority is None) == (schedulers[t.component_id] == "EDF") for t in tasks)
@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from common.csvreader import read_budgets, read_cores, read_tasks
+from common.horizon import harmonize_periods, plan_horizon
+from common.system_model import SystemModel
+
+CASE = "data/custom/15-med-onecore"
+
+
+def _load(case=CASE):
+    return read_cores(f"{case}/architecture.csv"), read_budgets(f"{case}/budgets.csv"), read_tasks(f"{case}/tasks.csv")
+
+
+def test_plan_includes_component_periods_and_counts_releases():
+    model = SystemModel(*_load())
+    plan = plan_horizon(model, iterations=2)
+
+    periods = [int(t.period) for t in model.tasks] + [int(c.period) for c in model.components]
+    assert plan.hyperperiod == math.lcm(*periods)
+    assert plan.feasible and plan.truncated_horizon is None and plan.coverage == 1.0
+    assert sum(core.releases for core in plan.cores) == sum(plan.hyperperiod // int(t.period) for t in model.tasks)
+    assert plan.ticks == 2 * plan.hyperperiod
+
+
+def test_infeasible_plan_suggests_truncation_and_harmonic_periods():
+    model = SystemModel(*_load())
+    plan = plan_horizon(model, max_horizon=100)
+
+    assert not plan.feasible and plan.truncated_horizon == 100
+    assert plan.min_releases == {t.id: 100 // int(t.period) for t in model.tasks}
+    harmonized = harmonize_periods(model)
+    assert all(harmonized[t.id] <= t.period for t in model.tasks)
+    assert plan.harmonized_hyperperiod == max(harmonized.values())
+
+
+def test_simulator_refuses_long_horizons_unless_truncated():
+    from simulator import Simulator
+
+    simulator = Simulator(*_load())
+    simulator.max_horizon = 100
+    with pytest.raises(ValueError, match="Hyperperiod"):
+        simulator.run_event_driven(1)
+
+    simulator.truncate_horizon = True
+    simulator.run_event_driven(1)
+    assert any(result.max_response_time > 0 for result in simulator.get_task_results())
@@ -0,0 +1,41 @@
+import shutil
+
+import numpy as np
+
+from common.csvreader import read_budgets, read_cores, read_tasks
+from common.model_cache import load_system
+from common.system_model import SystemModel
+
+CASE = "data/custom/15-med-onecore"
+
+
+def test_cache_hit_returns_the_same_system_and_changes_invalidate_it(tmp_path):
+    for name in ("architecture", "budgets", "tasks"):
+        shutil.copy(f"{CASE}/{name}.csv", tmp_path / f"{name}.csv")
+    paths = [str(tmp_path / f"{name}.csv") for name in ("architecture", "budgets", "tasks")]
+    cache_dir = str(tmp_path / "cache")
+
+    first = load_system(*paths, cache_dir)
+    second = load_system(*paths, cache_dir)
+    assert not first.hit and second.hit
+
+    # A hit maps the columns and builds no model objects until they are used
+    assert all(isinstance(column, np.memmap) for column in second.columns.values())
+    assert second._tasks is None and second._components is None and second._cores is None
+    assert np.array_equal(second.columns["task_wcet"], [task.wcet for task in first.tasks])
+    assert second._tasks is None
+    assert second.tasks == first.tasks
+    assert second.cores == first.cores
+    assert second.hyperperiod == first.hyperperiod
+
+    # The streamed miss path matches a plain load of the same files
+    model = SystemModel(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+    assert first.hyperperiod == model.hyperperiod()
+    assert [task.id for task in first.tasks] == [task.id for task in model.tasks]
+    assert [c.priority for c in second.components] == [c.priority for c in first.components]
+
+    with open(paths[2], "a") as f:
+        f.write("Task_99,2,10,Control_Unit,\n")
+    third = load_system(*paths, cache_dir)
+    assert not third.hit and third.key != first.key
+    assert third.tasks[-1].id == "Task_99"
@@ -0,0 +1,55 @@
+from common.component import Component
+from common.core import Core
+from common.scheduler import Scheduler
+from common.task import Task
+from partitioning import (
+    AllocationProblem,
+    allocated_budgets,
+    anneal,
+    best_fit_decreasing,
+    complete_assignment,
+    first_fit_decreasing,
+)
+
+# Bandwidths 0.6, 0.6, 0.4, 0.4, 0.3, 0.3, 0.2, 0.2 fill three cores exactly
+BUDGETS = [6, 6, 4, 4, 3, 3, 2, 2]
+
+
+def _system(speeds=(1.0, 1.0, 1.0)):
+    cores = [Core(id=f"Core_{k}", speed_factor=speed, scheduler=Scheduler.EDF) for k, speed in enumerate(speeds)]
+    components = [Component(f"C{i}", Scheduler.EDF, budget, 10, "Core_0", None) for i, budget in enumerate(BUDGETS)]
+    tasks = [Task(f"T{i}", wcet=1, period=100, component_id=f"C{i}", priority=None) for i in range(len(BUDGETS))]
+    return cores, components, tasks
+
+
+def test_fit_decreasing_packs_the_cores_exactly():
+    problem = AllocationProblem(*_system())
+    for heuristic in (first_fit_decreasing, best_fit_decreasing):
+        assignment = heuristic(problem)
+        assert None not in assignment
+        assert problem.is_feasible(assignment)
+        assert problem.loads(assignment).max() <= 1.0
+
+
+def test_annealing_repairs_an_overloaded_allocation():
+    problem = AllocationProblem(*_system())
+    start = [0] * len(BUDGETS)
+    assert not problem.is_feasible(start)
+    assignment, cost = anneal(problem, start, iterations=20_000, seed=3)
+    assert problem.is_feasible(assignment) and cost == problem.cost(assignment)
+
+
+def test_resized_budgets_depend_on_the_core_speed():
+    cores, components, tasks = _system(speeds=(0.5, 1.0, 2.0))
+    # A heavy task that only a fast core can carry within a 10-unit period
+    tasks[0] = Task("T0", wcet=11, period=20, component_id="C0", priority=None)
+    problem = AllocationProblem(cores, components, tasks, resize_budgets=True)
+
+    rates = problem.rates[0]
+    assert rates[0] == float("inf") and rates[1] > rates[2]
+    assignment = complete_assignment(problem, best_fit_decreasing(problem))
+    allocated = allocated_budgets(problem, assignment)
+    assert allocated[0].core_id != "Core_0"
+    assert allocated[0].budget == problem.budgets[0, assignment[0]]
+    # Results are shared between cores of equal speed and reused
+    assert len(problem._memo) == len(components) * 3
@@ -0,0 +1,65 @@
+import itertools
+
+import numpy as np
+
+from analysis import DemandCurve, minimal_budget
+from common.BDR import BDR
+from common.PRM import PRM
+from common.scheduler import Scheduler
+from common.task import Task
+
+
+def _brute_force_sbf(budget, period, periods=4):
+    """Least supply in any window of length t over all slot placements of `budget` per period."""
+    placements = list(itertools.combinations(range(period), budget))
+    horizon = periods * period
+    worst = np.full(horizon + 1, np.inf)
+    for pattern in itertools.product(placements, repeat=periods):
+        slots = np.zeros(horizon)
+        for k, placement in enumerate(pattern):
+            slots[[k * period + slot for slot in placement]] = 1
+        supplied = np.concatenate([[0], np.cumsum(slots)])
+        for length in range(horizon - period + 1):
+            # Windows that start in the first period see every phase of the pattern
+            windows = supplied[length:length + period] - supplied[:period]
+            worst[length] = min(worst[length], windows.min())
+    return worst[:horizon - period + 1]
+
+
+def test_sbf_matches_worst_case_supply_pattern():
+    for budget, period in [(1, 3), (2, 3), (1, 4), (2, 4), (3, 4), (4, 4)]:
+        expected = _brute_force_sbf(budget, period)
+        intervals = np.arange(expected.size)
+        supply = PRM(budget, period)
+        assert np.array_equal(supply.sbf_vec(intervals), expected)
+        assert [supply.sbf(t) for t in intervals] == list(expected)
+
+
+def test_sbf_inverse_and_bdr_bound():
+    for budget, period in [(1, 4), (3, 5), (2.5, 7), (5, 5)]:
+        supply = PRM(budget, period)
+        bound = BDR(rate=budget / period, delay=2 * (period - budget))
+        intervals = np.linspace(0, 60, 1201)
+        assert np.all(supply.sbf_vec(intervals) >= bound.sbf_vec(intervals) - 1e-12)
+
+        demands = np.linspace(0.1, 20, 200)
+        inverse = supply.sbf_inverse_vec(demands)
+        assert np.allclose(inverse, [supply.sbf_inverse(d) for d in demands])
+        assert np.all(supply.sbf_vec(inverse) >= demands - 1e-9)
+        assert np.all(supply.sbf_vec(inverse - 1e-6) < demands)
+
+
+def test_exact_supply_never_needs_a_larger_budget():
+    rng = np.random.default_rng(5)
+    smaller = 0
+    for _ in range(100):
+        scheduler = Scheduler.RM if rng.random() < 0.5 else Scheduler.EDF
+        periods = np.sort(rng.choice([20, 40, 50, 100], size=rng.integers(1, 4)))
+        tasks = [Task(f"Task_{i}", wcet=max(1, round(p * rng.uniform(0.02, 0.12))), period=int(p),
+                      component_id="C", priority=i) for i, p in enumerate(periods)]
+        curve = DemandCurve(tasks, scheduler)
+        for edf_test in ("exhaustive", "qpa"):
+            bdr, prm = minimal_budget(curve, 10, edf_test), minimal_budget(curve, 10, edf_test, supply_model='prm')
+            assert bdr is None or prm <= bdr
+            smaller += prm is not None and (bdr is None or prm < bdr)
+    assert smaller > 0
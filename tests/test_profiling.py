@@ -0,0 +1,55 @@
+import io
+
+from common.csvreader import read_budgets, read_cores, read_tasks
+from common.profiling import Profiler, ProgressReporter
+
+CASE = "data/custom/11-unschedulable-test-case"
+
+
+def _load():
+    return read_cores(f"{CASE}/architecture.csv"), read_budgets(f"{CASE}/budgets.csv"), read_tasks(f"{CASE}/tasks.csv")
+
+
+def test_profiler_counts_match_the_simulation_for_both_engines():
+    from simulator import Simulator
+
+    reports = []
+    for engine in ("tick", "event"):
+        simulator = Simulator(*_load())
+        simulator.profiler = Profiler()
+        simulator.run(2) if engine == "tick" else simulator.run_event_driven(2)
+        report = simulator.profiler.report()
+        reports.append(report)
+
+        completions = sum(stats.count for stats in simulator.task_stats.values())
+        assert report["counters"]["simulate.completions"] == completions
+        assert report["timers"]["simulate.complete"]["calls"] == completions
+        assert all(report["high_water"][f"ready_queue.{c.id}"] >= 1 for c in simulator.components)
+
+    # Everything but the loop counts is engine independent
+    for name in ("simulate.releases", "simulate.replenishments", "simulate.completions"):
+        assert reports[0]["counters"][name] == reports[1]["counters"][name]
+
+
+def test_analysis_records_per_component_time():
+    from analysis import analyze
+
+    cores, components, tasks = _load()
+    profiler = Profiler()
+    analyze(cores, components, tasks, profiler=profiler)
+    timers = profiler.report()["timers"]
+    assert {f"analysis.component.{c.id}" for c in components} <= timers.keys()
+
+
+def test_progress_reporter_is_throttled():
+    stream = io.StringIO()
+    progress = ProgressReporter(interval=3600, stream=stream)
+    progress.start(100)
+    for done in range(100):
+        progress.update(done)
+    assert stream.getvalue() == ""
+
+    progress = ProgressReporter(interval=0, stream=stream)
+    progress.start(100)
+    progress.update(50)
+    assert "50.0%" in stream.getvalue()
@@ -0,0 +1,46 @@
+from common.component import Component
+from common.core import Core
+from common.job import Job
+from common.ready_queue import ReadyQueue
+from common.scheduler import Scheduler
+from common.SRPModel import SRPModel
+from common.task import Task
+
+
+def test_edf_queue_orders_by_deadline_and_replaces_pending_job():
+    queue = ReadyQueue(Scheduler.EDF)
+    slow = Task("slow", wcet=2, period=20, component_id="C", priority=None)
+    fast = Task("fast", wcet=1, period=5, component_id="C", priority=None)
+
+    queue.push(Job(slow, 0, 2))
+    queue.push(Job(fast, 0, 1))
+    assert queue.peek().task_id == "fast"
+
+    # A new release of "fast" replaces its pending job
+    queue.push(Job(fast, 5, 1))
+    assert len(queue) == 2
+    assert queue.get("fast").release_time == 5
+
+    assert queue.pop().task_id == "fast"
+    assert queue.pop().task_id == "slow"
+    assert len(queue) == 0
+
+
+def test_rm_queue_orders_by_priority():
+    queue = ReadyQueue(Scheduler.RM)
+    low = Task("low", wcet=1, period=10, component_id="C", priority=2)
+    high = Task("high", wcet=1, period=50, component_id="C", priority=0)
+
+    queue.push(Job(low, 0, 1))
+    queue.push(Job(high, 0, 1))
+    assert [queue.pop().task_id, queue.pop().task_id] == ["high", "low"]
+
+
+def test_model_objects_have_no_instance_dict():
+    task = Task("T", 2, 10, "C", 1)
+    job = Job(task, 20, 2)
+    component = Component("C", Scheduler.EDF, 1, 5, "Core_1", None)
+    core = Core("Core_1", 1.0, Scheduler.EDF)
+    for obj in (task, job, component, core, ReadyQueue(Scheduler.RM), SRPModel(Scheduler.RM, [task], [])):
+        assert not hasattr(obj, "__dict__")
+    assert job.id == "T_20"
@@ -0,0 +1,34 @@
+import numpy as np
+
+from common.response_stats import ResponseTimeStats
+
+
+def test_quantiles_are_within_relative_accuracy():
+    values = np.random.default_rng(0).uniform(1, 1000, size=20_000)
+    stats = ResponseTimeStats(relative_accuracy=0.01)
+    for value in values:
+        stats.add_response(value, True)
+
+    for q in (0.5, 0.99, 0.999):
+        exact = np.quantile(values, q, method="lower")
+        assert abs(stats.quantile(q) - exact) <= 0.01 * exact
+    assert stats.count == 20_000
+    assert np.isclose(stats.mean, values.mean())
+    assert np.isclose(stats.variance, values.var())
+
+
+def test_merge_matches_single_accumulator():
+    values = np.random.default_rng(1).uniform(1, 50, size=1_000)
+    single, first, second = ResponseTimeStats(), ResponseTimeStats(), ResponseTimeStats()
+    for i, value in enumerate(values):
+        single.add_response(value, value < 45)
+        (first if i % 3 else second).add_response(value, value < 45)
+    second.add_deadline(False)
+    single.add_deadline(False)
+
+    first.merge(second)
+    assert first.count == single.count
+    assert first.deadline_misses == single.deadline_misses
+    assert (first.min, first.max) == (single.min, single.max)
+    assert np.isclose(first.variance, single.variance)
+    assert first.quantile(0.99) == single.quantile(0.99)
@@ -0,0 +1,31 @@
+import numpy as np
+
+from common.sampler import ConstantSampler, EmpiricalSampler, NormalSampler, UniformSampler
+from common.task import Task
+
+TASK = Task("Task_0", wcet=10, period=50, component_id="C", priority=None)
+
+
+def test_samples_stay_within_bounds():
+    for sampler_class in (NormalSampler, UniformSampler):
+        samples = sampler_class(0.5, np.random.default_rng(0)).sample(TASK, 10_000)
+        assert samples.shape == (10_000,)
+        assert samples.min() >= 5 and samples.max() <= 10
+
+
+def test_zero_spread_returns_wcet():
+    assert np.all(NormalSampler(1.0).sample(TASK, 5) == 10)
+    assert np.all(ConstantSampler().sample(TASK, 5) == 10)
+
+
+def test_seeded_samplers_are_reproducible():
+    first = NormalSampler(0.8, np.random.default_rng(42)).sample(TASK, 100)
+    second = NormalSampler(0.8, np.random.default_rng(42)).sample(TASK, 100)
+    assert np.array_equal(first, second)
+
+
+def test_empirical_sampler_draws_from_trace():
+    sampler = EmpiricalSampler({"Task_0": [4, 6, 12]}, rng=np.random.default_rng(1))
+    samples = sampler.sample(TASK, 1_000)
+    # 12 is above the WCET and gets clipped
+    assert set(np.unique(samples)) == {4, 6, 10}
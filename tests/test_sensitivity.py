@@ -0,0 +1,57 @@
+import copy
+
+from analysis import DemandCurve
+from common.BDR import BDR
+from common.component import Component
+from common.core import Core
+from common.scheduler import Scheduler
+from common.task import Task
+from sensitivity import SENSITIVITY_TOLERANCE, critical_scaling, sensitivity_analysis
+
+
+def _system():
+    cores = [Core(id="Core_1", speed_factor=0.8, scheduler=Scheduler.EDF)]
+    components = [Component("Edf", Scheduler.EDF, 5, 10, "Core_1", None),
+                  Component("Rm", Scheduler.RM, 3, 10, "Core_1", None)]
+    tasks = [Task("T0", wcet=2, period=40, component_id="Edf", priority=None),
+             Task("T1", wcet=4, period=80, component_id="Edf", priority=None),
+             Task("T2", wcet=1, period=50, component_id="Rm", priority=0),
+             Task("T3", wcet=2, period=100, component_id="Rm", priority=1)]
+    return cores, components, tasks
+
+
+def test_critical_scaling_brackets_the_threshold():
+    for threshold in (0.0, 0.37, 1.0, 5.5):
+        scaling = critical_scaling(lambda factor: factor <= threshold)
+        assert scaling <= threshold < scaling + 2 * SENSITIVITY_TOLERANCE * max(threshold, 1.0)
+    assert critical_scaling(lambda factor: True) == float("inf")
+
+
+def test_critical_factors_are_tight():
+    cores, components, tasks = _system()
+    _, component_results, task_results = sensitivity_analysis(*copy.deepcopy(_system()))
+
+    by_component = {c.id: c for c in components}
+    for result in component_results:
+        component = by_component[result.component_id]
+        Q, P = component.budget, component.period
+        supply = BDR(rate=Q/P, delay=2*(P-Q))
+        scaled = [copy.copy(t) for t in tasks if t.component_id == component.id]
+        for task in scaled:
+            task.wcet /= cores[0].speed_factor
+        curve = DemandCurve(scaled, component.scheduler)
+
+        step = 1 + 2 * SENSITIVITY_TOLERANCE
+        assert curve.scaled(result.wcet_scaling).is_schedulable(supply)
+        assert not curve.scaled(result.wcet_scaling * step).is_schedulable(supply)
+        assert result.budget_slack == Q - result.minimal_budget
+        for idx, task in enumerate(t for t in task_results if t.component_id == component.id):
+            factors = [1.0] * len(scaled)
+            factors[idx] = task.wcet_scaling * step
+            assert not curve.scaled(factors).is_schedulable(supply)
+
+
+def test_parallel_sensitivity_matches_serial():
+    serial = sensitivity_analysis(*_system())
+    parallel = sensitivity_analysis(*_system(), workers=2)
+    assert serial == parallel
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 from src.simulator import Simulator
 from src.common.csvreader import read_cores, read_budgets, read_tasks
 
@@ -24,4 +26,57 @@ def test_simulator_tiny_case():
     # Example assertions (adjust according to your actual test data):
     
 
- 
\ No newline at end of file
+ 
+
+def test_event_driven_engine_matches_tick_engine():
+    from common.csvreader import read_budgets, read_cores, read_tasks
+    from simulator import Simulator
+
+    for case in ["11-unschedulable-test-case", "13-validation-test-case", "14-validation-test-case",
+                 "15-med-onecore", "16-large-onecore"]:
+        paths = [f"data/custom/{case}/{name}.csv" for name in ("architecture", "budgets", "tasks")]
+
+        tick_simulator = Simulator(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+        tick_simulator.run()
+
+        event_simulator = Simulator(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+        event_simulator.run_event_driven()
+
+        assert event_simulator.get_task_results() == tick_simulator.get_task_results()
+
+
+def test_parallel_iterations_merge_like_a_serial_run():
+    from common.csvreader import read_budgets, read_cores, read_tasks
+    from simulator import Simulator
+
+    paths = [f"data/custom/15-med-onecore/{name}.csv" for name in ("architecture", "budgets", "tasks")]
+
+    serial_simulator = Simulator(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+    serial_simulator.run(iterations=4)
+
+    parallel_simulator = Simulator(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+    parallel_simulator.run_parallel(workers=2, iterations=4)
+
+    assert parallel_simulator.get_task_results() == serial_simulator.get_task_results()
+
+    with pytest.raises(ValueError):
+        parallel_simulator.run_parallel(workers=0, iterations=4)
+
+
+def test_per_core_simulation_matches_whole_system_run():
+    from common.csvreader import read_budgets, read_cores, read_tasks
+    from simulator import Simulator
+
+    # Component periods divide the task hyperperiod, so per-core horizons equal the global one
+    paths = [f"data/custom/16-large-onecore/{name}.csv" for name in ("architecture", "budgets", "tasks")]
+
+    simulator = Simulator(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+    simulator.run_event_driven(iterations=2)
+
+    per_core_simulator = Simulator(read_cores(paths[0]), read_budgets(paths[1]), read_tasks(paths[2]))
+    per_core_simulator.run_per_core(workers=2, iterations=2)
+
+    assert per_core_simulator.get_task_results() == simulator.get_task_results()
+
+    with pytest.raises(ValueError):
+        per_core_simulator.run_per_core(workers=0, iterations=2)
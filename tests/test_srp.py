@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from analysis import DemandCurve, analyze
+from common.BDR import BDR
+from common.component import Component
+from common.core import Core
+from common.scheduler import Scheduler
+from common.SRPModel import ResourceAccess, SRPModel, srp_models
+from common.system_model import SystemModel
+from common.task import Task
+from common.trace import TraceEvent, TraceReader, TraceRecorder
+
+# L holds R for 4 time units of its execution, H needs R at its start
+ACCESSES = [ResourceAccess("H", "R", 0, 1), ResourceAccess("L", "R", 1, 5)]
+
+
+def _system(scheduler=Scheduler.RM):
+    cores = [Core("Core_1", 1.0, Scheduler.EDF)]
+    components = [Component("C", scheduler, 1, 1, "Core_1", None)]
+    tasks = [Task("H", wcet=1, period=4, component_id="C", priority=0),
+             Task("L", wcet=6, period=20, component_id="C", priority=1)]
+    return cores, components, tasks
+
+
+def _starts(path, engine, resources):
+    from simulator import Simulator
+
+    simulator = Simulator(*_system(), resources=resources)
+    with TraceRecorder(str(path), simulator.model) as trace:
+        simulator.trace = trace
+        if engine == "event":
+            simulator.run_event_driven(1)
+        else:
+            simulator.run(1)
+    reader = TraceReader(str(path))
+    return [(event["time"], event["task"]) for event in reader.describe(reader.query(events=[TraceEvent.START]))]
+
+
+@pytest.mark.parametrize("engine", ["tick", "event"])
+def test_ceiling_blocks_the_higher_priority_job(tmp_path, engine):
+    free = _starts(tmp_path / "free.bin", engine, None)
+    blocked = _starts(tmp_path / "srp.bin", engine, ACCESSES)
+    # H released at 4 preempts L, unless L holds R (until 1 + 4 ticks of its execution)
+    assert (4, "H") in free and (6, "H") not in free
+    assert (6, "H") in blocked and (4, "H") not in blocked
+
+
+def test_blocking_terms():
+    cores, components, tasks = _system()
+    srp = srp_models(SystemModel(cores, components, tasks), ACCESSES)["C"]
+    assert srp.ceilings == {"R": 0}
+    assert np.array_equal(srp.rm_blocking(["H", "L"]), [4.0, 0.0])
+
+    edf = SRPModel(Scheduler.EDF, tasks, ACCESSES)
+    assert np.array_equal(edf.edf_blocking(np.array([2, 4, 10, 20])), [0.0, 4.0, 4.0, 0.0])
+
+    # C_H + B_H = 5 > T_H under a full supply
+    supply = BDR(rate=1.0, delay=0.0)
+    assert DemandCurve(tasks, Scheduler.RM).is_schedulable(supply)
+    assert not DemandCurve(tasks, Scheduler.RM, srp).is_schedulable(supply)
+    for edf_test in ("exhaustive", "qpa"):
+        assert DemandCurve(tasks, Scheduler.EDF).is_schedulable(supply, edf_test)
+        assert not DemandCurve(tasks, Scheduler.EDF, edf).is_schedulable(supply, edf_test)
+
+    components, _ = analyze(cores, components, tasks, resources=ACCESSES)
+    assert not components["C"]["schedulable"]
+
+
+def test_shared_resources_are_rejected():
+    cores, components, tasks = _system()
+    components.append(Component("D", Scheduler.RM, 1, 2, "Core_1", None))
+    tasks.append(Task("X", wcet=1, period=10, component_id="D", priority=0))
+    with pytest.raises(ValueError, match="shared"):
+        srp_models(SystemModel(cores, components, tasks), ACCESSES + [ResourceAccess("X", "R", 0, 1)])
+
+
+def test_session_and_partitioning_honour_blocking():
+    import copy
+
+    from analysis import AnalysisSession
+    from partitioning import AllocationProblem
+
+    cores, components, tasks = _system()
+    cores.append(Core("Core_2", 2.0, Scheduler.EDF))
+
+    def full():
+        return analyze(cores, copy.deepcopy(components), copy.deepcopy(tasks), resources=ACCESSES)[0]
+
+    session = AnalysisSession(cores, components, tasks, resources=ACCESSES)
+    assert not session.components["C"]["schedulable"]
+    assert session.components["C"]["schedulable"] == full()["C"]["schedulable"]
+
+    # A priority edit rebuilds the SRP model with the demand curve
+    session.update_task("L", priority=1)
+    assert not session.components["C"]["schedulable"]
+
+    # At double speed, H needs C_H + B_H = 0.5 + 2 ≤ 4
+    components[0].core_id = "Core_2"
+    moved = AnalysisSession(cores, components, tasks, resources=ACCESSES)
+    assert moved.components["C"]["schedulable"] and full()["C"]["schedulable"]
+
+    problem = AllocationProblem(cores, components, tasks, resources=ACCESSES)
+    assert problem.rates.tolist() == [[float("inf"), 1.0]]
+    assert AllocationProblem(cores, components, tasks).rates.tolist() == [[1.0, 1.0]]
+
+    components.append(Component("D", Scheduler.RM, 1, 1, "Core_1", None))
+    with pytest.raises(ValueError, match="component-local"):
+        AnalysisSession(cores, components, tasks, resources=ACCESSES).move_task("L", "D")
@@ -0,0 +1,53 @@
+import numpy as np
+
+from common.csvreader import read_budgets, read_cores, read_tasks
+from common.trace import TraceEvent, TraceReader, TraceRecorder
+
+CASE = "data/custom/11-unschedulable-test-case"
+
+
+def _traced_run(path, engine, chunk_events=64):
+    from simulator import Simulator
+
+    simulator = Simulator(read_cores(f"{CASE}/architecture.csv"), read_budgets(f"{CASE}/budgets.csv"),
+                          read_tasks(f"{CASE}/tasks.csv"))
+    with TraceRecorder(str(path), simulator.model, chunk_events) as trace:
+        simulator.trace = trace
+        if engine == "event":
+            simulator.run_event_driven(2)
+        else:
+            simulator.run(2)
+    return simulator
+
+
+def test_both_engines_record_the_same_ordered_trace(tmp_path):
+    simulator = _traced_run(tmp_path / "tick.bin", "tick")
+    _traced_run(tmp_path / "event.bin", "event")
+
+    tick = TraceReader(str(tmp_path / "tick.bin"))
+    event = TraceReader(str(tmp_path / "event.bin"))
+    assert len(tick) > 0
+    assert np.array_equal(np.asarray(tick.events), np.asarray(event.events))
+
+    order = tick.events["iteration"].astype(np.int64) * 10**9 + tick.events["time"]
+    assert np.all(np.diff(order) >= 0)
+
+    # Every completion recorded in the statistics appears in the trace
+    completions = tick.query(events=[TraceEvent.COMPLETE])
+    assert len(completions) == sum(stats.count for stats in simulator.task_stats.values())
+
+
+def test_reader_queries(tmp_path):
+    _traced_run(tmp_path / "trace.bin", "tick")
+    reader = TraceReader(str(tmp_path / "trace.bin"))
+    events = [row for row in reader.describe(reader.events)]
+
+    window = list(reader.describe(reader.window(5, 20, iteration=1)))
+    assert window == [row for row in events if row["iteration"] == 1 and 5 <= row["time"] < 20]
+
+    task = reader.task_ids[0]
+    assert list(reader.describe(reader.for_task(task))) == [row for row in events if row["task"] == task]
+
+    component = reader.component_ids[-1]
+    budget_events = reader.query(component=component, events=[TraceEvent.REPLENISH, TraceEvent.EXHAUST])
+    assert all(row["task"] is None and row["component"] == component for row in reader.describe(budget_events))